@@ -1,15 +1,37 @@
 import os
+import time
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from app.routes import scheduler
+from fastapi.middleware.gzip import GZipMiddleware
+from app.middleware.request_decompression import RequestDecompressionMiddleware
+from app.routes import health, scheduler
+from app.services.email_outbox import email_sender, is_email_configured
+from app.services.solver_pool import solver_pool
 from dotenv import load_dotenv
 
 load_dotenv()
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Runs in each worker, after gunicorn forks them from the preloaded app
+    app.state.started_at = time.monotonic()
+    solver_pool.start()
+    if is_email_configured():
+        email_sender.start()
+    app.state.ready = True
+    yield
+    app.state.ready = False
+    email_sender.stop()
+    solver_pool.shutdown()
+
+
 app = FastAPI(
     title="Travelling Salesman API",
     description="API for generating job rosters using a dummy Traveling Salesman algorithm",
     version="1.0.1",
+    lifespan=lifespan,
 )
 
 # Configure CORS
@@ -33,7 +55,16 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress responses for clients that accept gzip, and accept gzip or deflate request bodies
+app.add_middleware(
+    GZipMiddleware,
+    minimum_size=int(os.getenv("GZIP_MIN_SIZE", 1000)),
+    compresslevel=int(os.getenv("GZIP_LEVEL", 5)),
+)
+app.add_middleware(RequestDecompressionMiddleware, max_size=int(os.getenv("MAX_REQUEST_BODY_BYTES", 50 * 2 ** 20)))
+
 app.include_router(scheduler.router)
+app.include_router(health.router)
 
 @app.get("/")
 def home():
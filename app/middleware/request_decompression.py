@@ -0,0 +1,74 @@
+import zlib
+from starlette.responses import PlainTextResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+DECODERS = {
+    "gzip": lambda: zlib.decompressobj(16 + zlib.MAX_WBITS),
+    "deflate": lambda: zlib.decompressobj(),
+}
+
+
+class RequestDecompressionMiddleware:
+    """
+    Decompress request bodies sent with Content-Encoding gzip or deflate, so routes read plain JSON.
+
+    Bodies that would decompress past max_size are rejected with 413 before they are fully inflated,
+    unknown encodings with 415 and corrupt bodies with 400.
+    """
+
+    def __init__(self, app: ASGIApp, max_size: int = 50 * 2 ** 20):
+        self.app = app
+        self.max_size = max_size
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        headers = [(name, value) for name, value in scope["headers"] if name != b"content-encoding"]
+        encoding = next((value for name, value in scope["headers"] if name == b"content-encoding"), b"").decode("latin-1").strip().lower()
+        if encoding in ("", "identity"):
+            await self.app(scope, receive, send)
+            return
+        if encoding not in DECODERS:
+            await PlainTextResponse(f"Unsupported Content-Encoding: {encoding}", status_code=415)(scope, receive, send)
+            return
+
+        decoder = DECODERS[encoding]()
+        chunks = []
+        size = 0
+        more_body = True
+        try:
+            while more_body:
+                message = await receive()
+                if message["type"] == "http.disconnect":
+                    return
+                more_body = message.get("more_body", False)
+                # Inflating at most one byte past the limit is enough to know the body is too large
+                chunk = decoder.decompress(message.get("body", b""), self.max_size - size + 1)
+                chunks.append(chunk)
+                size += len(chunk)
+                if size > self.max_size:
+                    await PlainTextResponse("Decompressed request body too large", status_code=413)(scope, receive, send)
+                    return
+            chunks.append(decoder.flush())
+            if not decoder.eof:
+                raise zlib.error("truncated body")
+        except zlib.error:
+            await PlainTextResponse(f"Request body is not valid {encoding}", status_code=400)(scope, receive, send)
+            return
+
+        body = b"".join(chunks)
+        headers = [(name, value) for name, value in headers if name != b"content-length"]
+        headers.append((b"content-length", str(len(body)).encode("latin-1")))
+        scope = dict(scope, headers=headers)
+        sent = False
+
+        async def receive_decompressed() -> Message:
+            nonlocal sent
+            if sent:
+                return await receive()
+            sent = True
+            return {"type": "http.request", "body": body, "more_body": False}
+
+        await self.app(scope, receive_decompressed, send)
@@ -0,0 +1,60 @@
+from pydantic import BaseModel
+from datetime import datetime
+from typing import List, Optional
+from pydantic import Field
+
+from app.models.roster_response import RosterResponse
+
+
+class CompactAssignment(BaseModel):
+    """
+    A single job assignment, without repeating the job details the client already sent.
+
+    Attributes:
+        job_id: ID of the assigned job
+        salesman_id: ID of the salesman the job was assigned to
+        start_time: Scheduled start time
+        order: Position of the job in the salesman's route (0-based)
+    """
+
+    job_id: str
+    salesman_id: str
+    start_time: datetime
+    order: int
+
+
+class CompactRosterResponse(BaseModel):
+    """
+    Compact form of a RosterResponse holding only the assignment deltas.
+
+    Attributes:
+        assignments: Assignments in route order for each salesman
+        unassigned_job_ids: IDs of jobs that couldn't be assigned
+        message: Status message about the roster creation
+    """
+
+    assignments: List[CompactAssignment] = Field(default_factory=list)
+    unassigned_job_ids: List[str] = Field(default_factory=list)
+    message: Optional[str] = None
+
+    @classmethod
+    def from_roster(cls, roster: RosterResponse) -> "CompactRosterResponse":
+        """
+        Build the compact response from a solved roster.
+        Validation is skipped since the roster has already been validated.
+        """
+        assignments = [
+            CompactAssignment.model_construct(
+                job_id=job.job_id,
+                salesman_id=salesman_id,
+                start_time=job.start_time,
+                order=order,
+            )
+            for salesman_id, jobs in roster.jobs.items()
+            for order, job in enumerate(jobs)
+        ]
+        return cls.model_construct(
+            assignments=assignments,
+            unassigned_job_ids=[job.job_id for job in roster.unassigned_jobs],
+            message=roster.message,
+        )
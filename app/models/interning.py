@@ -0,0 +1,57 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterable, Iterator, Optional
+
+from pydantic import BaseModel
+
+# Values seen so far while validating the current request, or None outside of one
+_pool: ContextVar[Optional[Dict[Any, Any]]] = ContextVar("intern_pool", default=None)
+
+
+@contextmanager
+def interning() -> Iterator[None]:
+    """
+    Share equal values between the models validated in this block.
+
+    Large requests repeat the same addresses, dates, times and names across many jobs. Within the
+    block each distinct value is kept once and every model refers to it, so the duplicates pydantic
+    builds are freed as validation goes. The pool lives only as long as the block.
+    """
+    token = _pool.set({})
+    try:
+        yield
+    finally:
+        _pool.reset(token)
+
+
+def intern_value(value: Any, key: Any = None) -> Any:
+    """
+    Get the value already seen in this interning block that is equal to value, or value if it is the first.
+    Args:
+        value: Immutable value to share, or a model that is never changed after validation.
+        key: Hashable key to compare models by. Defaults to the value itself.
+    """
+    pool = _pool.get()
+    if pool is None or value is None:
+        return value
+    return pool.setdefault(_pool_key(value, key), value)
+
+
+def intern_fields(model: BaseModel, fields: Iterable[str]) -> None:
+    """
+    Replace the given fields of a model with the equal values already seen in this interning block.
+    The values are equal, so they are set directly without marking the fields as set.
+    """
+    pool = _pool.get()
+    if pool is None:
+        return
+    values = model.__dict__
+    for field in fields:
+        value = values[field]
+        if value is not None:
+            values[field] = pool.setdefault(_pool_key(value), value)
+
+
+def _pool_key(value: Any, key: Any = None) -> tuple:
+    # Equal values of different types (1 and 1.0) or timezones (the same instant) must stay distinct
+    return type(value), value if key is None else key, getattr(value, "tzinfo", None)
@@ -3,8 +3,11 @@ from datetime import datetime, timedelta
 from typing import Optional
 from pydantic import Field
 
+from app.models.interning import intern_fields
 from app.models.location import Location
 
+URGENCY_FIELDS = frozenset({'entry_time', 'exit_time', 'duration_mins'})
+
 
 class Job(BaseModel):
     """
@@ -34,6 +37,7 @@ class Job(BaseModel):
     start_time: Optional[datetime] = None
     cluster: Optional[int] = None
     _travel_time_mins: Optional[int] = 0
+    _urgency: Optional[float] = None
 
     @field_validator('exit_time')
     @classmethod
@@ -47,8 +51,20 @@ class Job(BaseModel):
         availability = (self.exit_time - self.entry_time).total_seconds() / 60
         if availability < self.duration_mins:
             self.exit_time = self.entry_time + timedelta(minutes=self.duration_mins)
+        self._urgency = self.get_urgency()
         return self
 
+    @model_validator(mode="after")
+    def share_repeated_values(self) -> 'Job':
+        intern_fields(self, ('job_id', 'client_name', 'date', 'entry_time', 'exit_time', 'salesman_id', 'salesman_name', 'start_time'))
+        return self
+
+    def __setattr__(self, name, value):
+        super().__setattr__(name, value)
+        if name in URGENCY_FIELDS and self.__pydantic_private__ is not None:
+            # Recompute urgency on next use instead of ordering by the old time window
+            self.__pydantic_private__["_urgency"] = None
+
     def assign_salesman(
         self, salesman_id: str, job_start_time: datetime, salesman_name: str = ""
     ) -> None:
@@ -60,11 +76,17 @@ class Job(BaseModel):
     def urgency(self) -> float:
         """
         Calculate the urgency of the job based on the time window and duration.
+        Computed when the job is validated, as the solver reads it many times,
+        and again after the time window or duration changes.
 
         Returns:
             float: Urgency score
         """
-        return self.get_urgency()
+        # Read the private attribute directly, as pydantic's __getattr__ fallback costs more than the computation
+        private = self.__pydantic_private__
+        if private["_urgency"] is None:
+            private["_urgency"] = self.get_urgency()
+        return private["_urgency"]
 
     def get_urgency(self) -> float:
         time_diff = self.exit_time - self.entry_time
@@ -2,7 +2,9 @@ from datetime import timedelta
 from typing import Optional
 from pydantic import BaseModel, Field, model_validator
 
+from app.models.interning import intern_value
 from app.services.location_helpers import LocationHelpers
+from app.services import travel_time_table
 
 class Location(BaseModel):
     """
@@ -35,9 +37,11 @@ class Location(BaseModel):
                 self.address = response.get('address')
             else:
                 raise ValueError("Either coordinates or address must be provided")
-        
 
-        return self
+        if self.address is not None:
+            self.address = intern_value(self.address)
+        # Jobs at the same place share one Location within a request, as locations aren't changed once validated
+        return intern_value(self, key=(self.latitude, self.longitude, self.address))
     
     def is_same_location_as(self, other: 'Location') -> bool:
         return (self.address is not None and self.address == other.address) or (
@@ -59,6 +63,9 @@ class Location(BaseModel):
         
         coord1 = (self.latitude, self.longitude)
         coord2 = (other.latitude, other.longitude)
-        travel_time = LocationHelpers.get_travel_time_minutes(coord1, coord2)
+        table = travel_time_table.travel_time_table
+        travel_time = table.lookup(coord1, coord2) if table is not None else None
+        if travel_time is None:
+            travel_time = LocationHelpers.get_travel_time_minutes(coord1, coord2)
 
         return timedelta(minutes=max(5, travel_time))
\ No newline at end of file
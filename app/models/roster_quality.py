@@ -0,0 +1,61 @@
+from typing import List
+from pydantic import BaseModel
+
+
+class SalesmanQuality(BaseModel):
+    """
+    How a salesman's day is spent in a roster.
+
+    Attributes:
+        salesman_id: ID of the salesman
+        utilization: Minutes of assigned work as a share of max_workday_mins
+        work_mins: Minutes of assigned work
+        travel_mins: Minutes travelling between jobs
+        idle_mins: Minutes between the first job's start and the last job's end spent neither working nor travelling
+    """
+
+    salesman_id: str
+    utilization: float = 0.0
+    work_mins: int = 0
+    travel_mins: float = 0.0
+    idle_mins: float = 0.0
+
+
+class RosterBounds(BaseModel):
+    """
+    Optimistic bounds on any roster for the same request.
+
+    Attributes:
+        max_jobs: Most jobs that fit into the salesmen's combined hours, ignoring travel and
+            counting only jobs whose time window overlaps some salesman's hours
+        max_work_mins: Most minutes of work that fit in the same way
+        min_travel_mins: Least travel needed to visit the roster's assigned jobs with its number of routes,
+            from a minimum spanning tree over the jobs with the longest edges removed
+    """
+
+    max_jobs: int = 0
+    max_work_mins: int = 0
+    min_travel_mins: float = 0.0
+
+
+class RosterQuality(BaseModel):
+    """
+    Report on how good a roster is, to judge whether a slower solve mode is worth it.
+
+    Attributes:
+        salesmen: Breakdown of each salesman's day
+        assigned_jobs: Number of jobs assigned
+        work_mins: Minutes of work assigned
+        travel_mins: Minutes travelling between jobs
+        idle_mins: Minutes idle within the salesmen's days
+        bounds: Bounds on any roster for the same request
+        gap: Share of max_work_mins the roster may be missing, 0 when it is provably optimal on work
+    """
+
+    salesmen: List[SalesmanQuality]
+    assigned_jobs: int
+    work_mins: int
+    travel_mins: float
+    idle_mins: float
+    bounds: RosterBounds
+    gap: float
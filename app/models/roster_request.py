@@ -1,10 +1,22 @@
-from pydantic import BaseModel
-from typing import List
+from pydantic import BaseModel, Field, model_validator
+from typing import List, Optional
 
+from app.models.interning import interning
 from app.models.job import Job
 from app.models.salesman import Salesman
+from app.models.solver_options import SolverOptions
+from app.models.warm_start import WarmStart
 
 
 class RosterRequest(BaseModel):
     jobs: List[Job]
     salesmen: List[Salesman]
+    options: SolverOptions = Field(default_factory=SolverOptions)
+    warm_start: Optional[WarmStart] = None
+
+    @model_validator(mode="wrap")
+    @classmethod
+    def share_repeated_values(cls, data, handler):
+        """Validate the request sharing equal addresses, times and names between its jobs and salesmen."""
+        with interning():
+            return handler(data)
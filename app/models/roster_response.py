@@ -4,7 +4,9 @@ from typing import Dict, List, Optional
 from pydantic import Field
 
 from app.models.job import Job
+from app.models.roster_quality import RosterQuality
 from app.models.salesman import Salesman
+from app.models.solver_options import SolverOptions
 
 
 class RosterResponse(BaseModel):
@@ -15,11 +17,15 @@ class RosterResponse(BaseModel):
         jobs: Dictionary mapping salesman IDs to their assigned jobs
         unassigned_jobs: List of jobs that couldn't be assigned
         message: Status message about the roster creation
+        options: Solver options that produced this roster
+        quality: Quality report, if requested with options.quality_report
     """
 
     jobs: Dict[str, List[Job]] = Field(default_factory=dict)
     unassigned_jobs: List[Job] = Field(default_factory=list)
     message: Optional[str] = None
+    options: Optional[SolverOptions] = None
+    quality: Optional[RosterQuality] = None
 
     def add_salesmen(self, salesmen: List[Salesman]) -> None:
         """Initialize roster with a list of salesmen."""
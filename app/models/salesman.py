@@ -1,8 +1,9 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, model_validator
 from datetime import datetime, timedelta
 from typing import Optional
 from pydantic import Field
 
+from app.models.interning import intern_fields
 from app.models.location import Location
 from app.models.job import Job
 
@@ -33,6 +34,11 @@ class Salesman(BaseModel):
     time_worked_mins: int = Field(default=0, ge=0)
     max_workday_mins: int = Field(default=9 * 60, ge=0)  # 9 hours
 
+    @model_validator(mode="after")
+    def share_repeated_values(self) -> 'Salesman':
+        intern_fields(self, ('salesman_id', 'salesman_name', 'start_time', 'end_time'))
+        return self
+
     def can_complete_job_in_time(
         self, job_exit_time: datetime, completion_time: datetime
     ) -> bool:
@@ -67,6 +73,10 @@ class Salesman(BaseModel):
             self.current_time += timedelta(minutes=minutes)
             self.time_worked_mins += minutes
 
+    def wait_until(self, time: datetime) -> None:
+        """Make the salesman wait until the given time."""
+        self.wait((time - self.current_time).total_seconds() / 60)
+
     def assign_job(self, job: Job) -> None:
         """
         Update salesman's state after job assignment.
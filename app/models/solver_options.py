@@ -0,0 +1,62 @@
+from typing import Literal, Optional
+from pydantic import BaseModel, Field
+
+
+class SolverOptions(BaseModel):
+    """
+    Options controlling how jobs are assigned to salesmen.
+
+    Attributes:
+        engine: Assignment engine
+            - greedy: fill one salesman at a time, working cluster by cluster
+            - round_robin: advance all salesmen together in simulated time
+            - exact: branch and bound search from the greedy roster, for small requests
+            - regret: regret-k insertion, placing first the jobs that would cost most to place later
+            - auto: exact for up to 5 salesmen and 40 jobs, greedy otherwise
+        job_selection: How the next job is picked from the salesman's current cluster
+            - urgency: first feasible job in urgency order
+            - nearest: nearest feasible job to the salesman's current location
+            - urgency_within_radius: most urgent feasible job within search_radius_km,
+              then the nearest feasible job beyond it
+            - tour: next feasible job along a nearest neighbour tour of the cluster from the salesman's
+              last job, using travel times precomputed for the cluster (greedy engine only)
+        search_radius_km: Radius used by urgency_within_radius
+        vectorized: Check all candidate jobs at once with NumPy instead of one at a time
+        job_order: Order in which jobs are considered (random uses seed)
+        salesman_order: Order in which salesmen are rostered
+            - input: as given in the request
+            - availability: earliest available first
+            - proximity: closest to the jobs first
+        n_clusters: Number of job clusters (default 4)
+        nearest_clusters: If set, a salesman's first job is searched for only in this many clusters
+            nearest to their home, moving further out as those are exhausted (greedy engine only)
+        seed: Seed for the random job order
+        multi_start: Number of variants of the engine to run, keeping the best roster
+        time_budget_secs: Time allowed for a multi-start solve
+        exact_time_limit_secs: Time allowed for the exact engine's search before it returns
+            the best roster found so far
+        regret_k: Number of cheapest routes compared for each job's regret (regret engine only);
+            1 inserts the cheapest job first
+        deadline_secs: Time allowed for the solve, after which the roster so far is returned
+            with the remaining jobs unassigned (default SOLVE_DEADLINE_SECS, or none)
+        quality_report: Return a report of utilization, travel, idle time and the gap to a bound with the roster
+        wait_mins: If set, a salesman with no job to start waits in steps of this many minutes
+            instead of jumping to the next time a job opens (greedy engine only)
+    """
+
+    engine: Literal["greedy", "round_robin", "exact", "regret", "auto"] = "greedy"
+    job_selection: Literal["urgency", "nearest", "urgency_within_radius", "tour"] = "urgency"
+    search_radius_km: float = Field(default=1.0, gt=0)
+    vectorized: bool = False
+    job_order: Literal["urgency", "entry_time", "exit_time", "random"] = "urgency"
+    salesman_order: Literal["input", "availability", "proximity"] = "input"
+    n_clusters: Optional[int] = Field(default=None, gt=0)
+    nearest_clusters: Optional[int] = Field(default=None, gt=0)
+    seed: int = 0
+    multi_start: int = Field(default=1, ge=1, le=64)
+    time_budget_secs: float = Field(default=10.0, gt=0)
+    exact_time_limit_secs: float = Field(default=2.0, gt=0)
+    regret_k: int = Field(default=2, ge=1)
+    deadline_secs: Optional[float] = Field(default=None, gt=0)
+    quality_report: bool = False
+    wait_mins: Optional[int] = Field(default=None, gt=0)
@@ -0,0 +1,32 @@
+from pydantic import BaseModel, Field
+from typing import Dict, Optional
+
+from app.models.roster_response import RosterResponse
+
+
+class WarmStart(BaseModel):
+    """
+    Assignments to start a solve from, such as the roster of the same weekday last week.
+
+    Jobs are matched by job_id and salesmen by salesman_id. A matched job starts on its salesman's route
+    if they can still complete it, and the solver fills in the rest.
+
+    Attributes:
+        roster: A previous roster; each job is tried on the salesman it had, in the order of their route
+        hints: Salesman ID for each job ID, tried in the order given after the roster's jobs.
+            A hint overrides the roster for the same job.
+    """
+
+    roster: Optional[RosterResponse] = None
+    hints: Dict[str, str] = Field(default_factory=dict)
+
+    def get_hints(self) -> Dict[str, str]:
+        """Get the salesman ID for each hinted job ID, in the order the jobs should be tried."""
+        hints = {}
+        if self.roster is not None:
+            for salesman_id, route in self.roster.jobs.items():
+                for job in route:
+                    if job.job_id not in self.hints:
+                        hints[job.job_id] = salesman_id
+        hints.update(self.hints)
+        return hints
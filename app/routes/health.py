@@ -0,0 +1,40 @@
+import os
+import time
+from fastapi import APIRouter, Request, Response
+
+from app.services.email_outbox import email_sender, is_email_configured
+from app.services.geocoding_client import geocoding_client
+from app.services.location_helpers import LocationHelpers
+from app.services.solver_pool import solver_pool
+
+router = APIRouter()
+
+
+@router.get("/health")
+async def health(request: Request) -> dict:
+    """Liveness of this worker process: it is answering requests."""
+    started_at = getattr(request.app.state, "started_at", None)
+    uptime_secs = round(time.monotonic() - started_at, 1) if started_at is not None else 0.0
+    return {"status": "ok", "pid": os.getpid(), "uptime_secs": uptime_secs}
+
+
+@router.get("/ready")
+async def ready(request: Request, response: Response) -> dict:
+    """
+    Readiness of this worker process to take rosters: started up and with room in the solver queue.
+    Responds 503 otherwise, so a load balancer can send requests to another worker.
+    """
+    started = getattr(request.app.state, "ready", False)
+    solver_has_room = solver_pool.in_flight < solver_pool.capacity
+    is_ready = started and solver_has_room
+    if not is_ready:
+        response.status_code = 503
+    return {
+        "status": "ready" if is_ready else "not_ready",
+        "pid": os.getpid(),
+        "started": started,
+        "solver": {"in_flight": solver_pool.in_flight, "capacity": solver_pool.capacity},
+        "cached_locations": len(LocationHelpers.locationCache),
+        "geocoding_circuit": geocoding_client.circuit_breaker.state,
+        "email_sender": email_sender.is_running() if is_email_configured() else "not_configured",
+    }
@@ -1,61 +1,75 @@
-import os
-from fastapi import APIRouter, HTTPException
+import asyncio
+from typing import Literal
+from fastapi import APIRouter, Header, HTTPException, Query, Request
+from starlette.concurrency import run_in_threadpool
 
-from app.models.roster_response import RosterResponse
 from app.models.roster_request import RosterRequest
-from app.services.job_assignment import assign_jobs
+from app.services.response_encoding import encode_compact_roster, encode_roster
+from app.services.solver import get_deadline, solve
+from app.services.solver_pool import SolverPoolSaturated, solver_pool
 
 from app.models.contact_us_request import ContactUsRequest
-from sendgrid import SendGridAPIClient
-from sendgrid.helpers.mail import Mail
+from app.services.email_outbox import SENDGRID_API_KEY, SENDGRID_EMAIL_ADDRESS, email_outbox, email_sender
 
 router = APIRouter()
 
+DISCONNECT_POLL_SECS = 0.5
+
+
+async def cancel_on_disconnect(http_request: Request, cancel_event) -> None:
+    """Set cancel_event if the client goes away, so the solve stops instead of finishing for nobody."""
+    while not await http_request.is_disconnected():
+        await asyncio.sleep(DISCONNECT_POLL_SECS)
+    print("Client disconnected, cancelling solve")
+    cancel_event.set()
+
+
 @router.post("/assign_jobs")
-def assign_jobs_endpoint_post(request: RosterRequest) -> dict:
+async def assign_jobs_endpoint_post(
+    request: RosterRequest,
+    http_request: Request,
+    response_format: Literal["full", "compact"] = Query("full", alias="format"),
+    accept: str | None = Header(None),
+):
     try:
-        roster = assign_jobs(request.jobs, request.salesmen)
-        return roster.model_dump()
+        cancel_event = solver_pool.cancel_event()
+        deadline = get_deadline(request.options, cancel_event)
+        watcher = asyncio.create_task(cancel_on_disconnect(http_request, cancel_event))
+        try:
+            hints = request.warm_start.get_hints() if request.warm_start else None
+            roster = await solver_pool.run(solve, request.jobs, request.salesmen, request.options, deadline, hints)
+        finally:
+            watcher.cancel()
+        if response_format == "compact":
+            return encode_compact_roster(roster, accept)
+        return encode_roster(roster)
+    except SolverPoolSaturated as e:
+        raise HTTPException(status_code=429, detail=str(e), headers={"Retry-After": "1"})
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
 
 
 @router.get("/assign_jobs")
-def assign_jobs_endpoint_get() -> str:
+async def assign_jobs_endpoint_get() -> str:
     return "assign_jobs works"
 
-SENDGRID_API_KEY = os.getenv("SENDGRID_API_KEY", "")
-SENDGRID_EMAIL_ADDRESS = os.getenv("SENDGRID_EMAIL_ADDRESS", "")
 
 @router.post("/contact_us")
-def contact_us_endpoint_post(request: ContactUsRequest) -> dict:
+async def contact_us_endpoint_post(request: ContactUsRequest) -> dict:
     if not SENDGRID_API_KEY or not SENDGRID_EMAIL_ADDRESS:
         raise HTTPException(status_code=500, detail="SendGrid API key or email address not configured")
 
-    message = Mail(
-        from_email=SENDGRID_EMAIL_ADDRESS,
-        to_emails=SENDGRID_EMAIL_ADDRESS,
-        subject=f"Caminora Contact Us: {request.name}",
-        plain_text_content=f"Name: {request.name}\nEmail: {request.email}\nPhone: {request.phoneNumber}\nMessage:\n\n{request.message}",
-        html_content=f"""
-            <p><strong>Name:</strong> {request.name}</p>
-            <p><strong>Email:</strong> {request.email}</p>
-            <p><strong>Phone:</strong> {request.phoneNumber}</p>
-            <p><strong>Message:</strong></p>
-            <p>{request.message.replace('\n', '<br/>')}</p>
-        """
-    )
-
     try:
-        sg = SendGridAPIClient(SENDGRID_API_KEY)
-        sg.send(message)
-        return {"message": "Email sent successfully"}
+        await run_in_threadpool(email_outbox.enqueue, request)
     except Exception as e:
-        print(f"SendGrid error: {e}")
+        print(f"Email outbox error: {e}")
         raise HTTPException(status_code=500, detail="Failed to send email")
+    email_sender.wake()
+    return {"message": "Email queued for delivery"}
+
 
 @router.get("/contact_us")
-def contact_us_endpoint() -> str:
+async def contact_us_endpoint() -> str:
     if not SENDGRID_API_KEY:
         raise HTTPException(status_code=500, detail="SendGrid API key not configured")
     if not SENDGRID_EMAIL_ADDRESS:
@@ -0,0 +1,84 @@
+import re
+import unicodedata
+from collections import defaultdict
+from typing import Dict, Optional, Set
+
+# Each word and its abbreviations are mapped to one spelling, so "2 Bass Street" and "2 Bass St." share a key.
+# Keys have no trailing dots, as those are stripped before the lookup.
+ABBREVIATIONS = {
+    "street": "st", "road": "rd", "boulevard": "blvd", "drive": "dr",
+    "lane": "ln", "court": "ct", "square": "sq", "terrace": "tce", "highway": "hwy",
+    "crescent": "cres", "parade": "pde", "apartment": "apt", "unit": "u",
+    "north": "n", "south": "s", "east": "e", "west": "w",
+    # "Av." abbreviates both, which name the same kind of street
+    "avenue": "av", "ave": "av", "avenida": "av", "avda": "av",
+    # "Pl." is read as the English place; the Spanish plaza keeps its full spelling
+    "place": "pl",
+    "p.za": "piazza", "p.zza": "piazza", "pza": "piazza", "v.le": "viale", "c.so": "corso",
+    "c/": "calle",
+}
+
+_SEPARATORS = re.compile(r"[\s,;]+")
+_PUNCTUATION = re.compile(r"[^0-9a-z]+")
+_NUMBER = re.compile(r"\d+")
+
+
+def address_key(address: str) -> str:
+    """
+    Canonical form of an address for cache lookups.
+    Folds unicode to ASCII, lower cases, spells common abbreviations one way and drops punctuation,
+    so "2 Bass Street", " 2 bass st, " and "2 Bass St." all give "2 bass st".
+    """
+    address = address.replace('ª', '').replace('º', '')
+    address = unicodedata.normalize("NFKD", address).encode("ascii", "ignore").decode("ascii").lower()
+    tokens = []
+    for token in _SEPARATORS.split(address):
+        token = ABBREVIATIONS.get(token.rstrip("."), token)
+        tokens.extend(_PUNCTUATION.sub(" ", token).split())
+    return " ".join(tokens)
+
+
+def trigrams(key: str) -> Set[str]:
+    padded = f"  {key} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class TrigramIndex:
+    """
+    Index of address keys for finding near duplicates of an address that isn't cached under its own key,
+    e.g. with a typo or a missing postcode.
+    Keys only match if they contain the same numbers, so "2 bass st" never matches "12 bass st".
+    """
+
+    def __init__(self, threshold: float = 0.8):
+        self.threshold = threshold
+        self._trigrams: Dict[str, Set[str]] = {}
+        self._keys_by_trigram: Dict[str, Set[str]] = defaultdict(set)
+
+    def __len__(self) -> int:
+        return len(self._trigrams)
+
+    def add(self, key: str) -> None:
+        if key in self._trigrams:
+            return
+        self._trigrams[key] = trigrams(key)
+        for trigram in self._trigrams[key]:
+            self._keys_by_trigram[trigram].add(key)
+
+    def closest(self, key: str) -> Optional[str]:
+        """The most similar indexed key by trigram Jaccard similarity, if it reaches the threshold."""
+        if key in self._trigrams:
+            return key
+        query = trigrams(key)
+        shared = defaultdict(int)
+        for trigram in query:
+            for candidate in self._keys_by_trigram.get(trigram, ()):
+                shared[candidate] += 1
+
+        numbers = _NUMBER.findall(key)
+        best, best_similarity = None, self.threshold
+        for candidate, count in shared.items():
+            similarity = count / (len(query) + len(self._trigrams[candidate]) - count)
+            if similarity >= best_similarity and _NUMBER.findall(candidate) == numbers:
+                best, best_similarity = candidate, similarity
+        return best
@@ -0,0 +1,116 @@
+from datetime import datetime, timedelta
+from typing import Dict, List, Tuple
+import numpy as np
+
+from app.models.job import Job
+from app.models.salesman import Salesman
+from app.services.job_table import JobTable
+from app.services.location_helpers import LocationHelpers
+
+# Largest cluster given a travel matrix and tour; larger ones compute travel one row at a time in urgency order
+MAX_PLANNED_CLUSTER_JOBS = 2000
+# Travel between two jobs is never shorter than this (see Location.travel_time_to)
+MIN_TRAVEL = timedelta(minutes=5)
+
+
+class ClusterPlan:
+    """
+    Precomputed data for the jobs of one cluster, built once after clustering.
+
+    Holds the travel time between every pair of the cluster's jobs, a nearest neighbour tour through
+    them by distance starting from the most urgent job, and each job's latest start: the last time it
+    can start and still finish within its window, which is all the slack it has.
+    Jobs keep the order they were given in (urgency order).
+    """
+
+    def __init__(self, jobs: List[Job]):
+        self.jobs = list(jobs)
+        self.table = JobTable(self.jobs)
+        self._positions = {id(job): position for position, job in enumerate(self.jobs)}
+        self.latest_start: List[datetime] = [job.exit_time - timedelta(minutes=job.duration_mins) for job in self.jobs]
+
+        rows = np.arange(len(self.jobs))
+        if len(self.jobs) <= MAX_PLANNED_CLUSTER_JOBS:
+            distances_km = LocationHelpers.get_distance_matrix(self.table.latitude, self.table.longitude)
+            self.travel_secs = get_travel_secs(distances_km, self.table.address)
+            # Travel times are whole minutes, so nearby jobs tie on them; the tour follows distance instead
+            self.tour = get_nearest_neighbour_tour(distances_km)
+        else:
+            self.travel_secs = None
+            self.tour = rows
+        self._tour_positions = np.empty(len(self.jobs), dtype=np.int64)
+        self._tour_positions[self.tour] = np.arange(len(self.tour))
+
+    def __len__(self) -> int:
+        return len(self.jobs)
+
+    def travel_secs_from(self, job: Job) -> np.ndarray:
+        """Travel time in seconds from one of the cluster's jobs to each of them."""
+        position = self._positions[id(job)]
+        if self.travel_secs is not None:
+            return self.travel_secs[position]
+        return self.table.travel_seconds_from(job.location, np.arange(len(self.jobs)))
+
+    def find_next_job(self, salesman: Salesman, from_job: Job, unassigned_jobs: Dict[int, Job]) -> Tuple[Job | None, datetime | None]:
+        """
+        Find the first job after from_job along the tour that the salesman can complete after it.
+        Args:
+            salesman: Salesman who has just finished from_job, one of this cluster's jobs.
+            from_job: The salesman's last job.
+            unassigned_jobs: Unassigned jobs of the cluster, keyed by id(job).
+        Returns:
+            The job and its arrival time, or (None, None) if there is no such job.
+        """
+        travel_secs = self.travel_secs_from(from_job)
+        start = self._tour_positions[self._positions[id(from_job)]]
+        earliest_start = salesman.current_time + MIN_TRAVEL
+        for position in np.roll(self.tour, -start - 1):
+            job = self.jobs[position]
+            # Jobs already done, or whose window closes before the salesman could get there, cost nothing to skip
+            if id(job) not in unassigned_jobs or self.latest_start[position] < earliest_start:
+                continue
+            arrival_time = salesman.get_arrival_time(job, timedelta(seconds=int(travel_secs[position])))
+            completion_time = arrival_time + timedelta(minutes=job.duration_mins)
+            if salesman.can_complete_job_in_time(job.exit_time, completion_time):
+                return job, arrival_time
+        return None, None
+
+
+def get_travel_secs(distances_km: np.ndarray, addresses: np.ndarray) -> np.ndarray:
+    """
+    Travel time matrix in seconds for a distance matrix, matching JobTable.travel_seconds_from row by row.
+    """
+    minutes = np.maximum(LocationHelpers.get_travel_times_for_distances(distances_km), 5)
+    known = addresses != None  # noqa: E711 - elementwise comparison
+    minutes[known[:, None] & known[None, :] & (addresses[:, None] == addresses[None, :])] = 5
+    return (minutes * 60).astype(np.int32)
+
+
+def get_nearest_neighbour_tour(distances: np.ndarray) -> np.ndarray:
+    """
+    Order jobs by a nearest neighbour tour from the first one, ties going to the earlier job.
+    Args:
+        distances: Square matrix of distances between the jobs.
+    Returns:
+        Positions of the jobs in tour order.
+    """
+    n = len(distances)
+    visited = np.zeros(n, dtype=bool)
+    tour = np.empty(n, dtype=np.int64)
+    current = 0
+    for step in range(n):
+        tour[step] = current
+        visited[current] = True
+        if step + 1 < n:
+            current = int(np.argmin(np.where(visited, np.inf, distances[current])))
+    return tour
+
+
+def plan_clusters(jobs: List[Job]) -> Dict[int, ClusterPlan]:
+    """
+    Build a ClusterPlan for each cluster of the jobs, keyed by cluster id.
+    """
+    clusters: Dict[int, List[Job]] = {}
+    for job in jobs:
+        clusters.setdefault(job.cluster, []).append(job)
+    return {cluster_id: ClusterPlan(cluster) for cluster_id, cluster in clusters.items()}
@@ -1,7 +1,10 @@
-from typing import List
+from typing import Dict, List, Tuple
 from sklearn.cluster import KMeans
 import numpy as np
 from app.models.job import Job
+from app.models.salesman import Salesman
+from app.services.location_helpers import LocationHelpers
+from app.services.spatial_index import SpatialGrid
 
 def cluster_jobs(jobs: List[Job], n_clusters: int) -> None:
     """
@@ -12,3 +15,49 @@ def cluster_jobs(jobs: List[Job], n_clusters: int) -> None:
     kmeans = KMeans(n_clusters=n_clusters, random_state=0).fit(job_locations)
     for job, cluster_id in zip(jobs, kmeans.labels_):
         job.cluster = int(cluster_id)
+
+
+def index_clusters(jobs: List[Job], cell_size_km: float = 0.5) -> Dict[int, SpatialGrid[Job]]:
+    """
+    Build a spatial index of the jobs in each cluster, keyed by cluster id.
+    """
+    clusters: Dict[int, List[Job]] = {}
+    for job in jobs:
+        clusters.setdefault(job.cluster, []).append(job)
+    return {
+        cluster_id: SpatialGrid.from_points(
+            ((job, job.location.latitude, job.location.longitude) for job in cluster), cell_size_km
+        )
+        for cluster_id, cluster in clusters.items()
+    }
+
+
+def get_cluster_centroids(jobs: List[Job]) -> Dict[int, Tuple[float, float]]:
+    """
+    Mean (latitude, longitude) of the jobs in each cluster, keyed by cluster id.
+    """
+    clusters: Dict[int, List[Job]] = {}
+    for job in jobs:
+        clusters.setdefault(job.cluster, []).append(job)
+    return {
+        cluster_id: (
+            float(np.mean([job.location.latitude for job in cluster])),
+            float(np.mean([job.location.longitude for job in cluster])),
+        )
+        for cluster_id, cluster in clusters.items()
+    }
+
+
+def get_cluster_affinity(salesmen: List[Salesman], centroids: Dict[int, Tuple[float, float]]) -> Dict[str, List[int]]:
+    """
+    Rank the clusters for each salesman, nearest to their home first, keyed by salesman id.
+    Travel time grows with distance, so ranking by distance to the centroids ranks by travel time without ties.
+    """
+    cluster_ids = list(centroids)
+    latitudes = np.array([centroids[cluster_id][0] for cluster_id in cluster_ids], dtype=np.float64)
+    longitudes = np.array([centroids[cluster_id][1] for cluster_id in cluster_ids], dtype=np.float64)
+    affinity = {}
+    for salesman in salesmen:
+        distances = LocationHelpers.get_distances_between((salesman.location.latitude, salesman.location.longitude), latitudes, longitudes)
+        affinity[salesman.salesman_id] = [cluster_ids[i] for i in np.argsort(distances, kind="stable")]
+    return affinity
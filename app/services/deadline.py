@@ -0,0 +1,67 @@
+import os
+import threading
+import time
+from dotenv import load_dotenv
+
+load_dotenv()
+
+# Deadline for solves that don't set options.deadline_secs, unset for none
+DEFAULT_DEADLINE_SECS = float(os.getenv("SOLVE_DEADLINE_SECS", 0)) or None
+
+DEADLINE_MESSAGE = "Roster incomplete: solve stopped at its deadline"
+
+# A manager's Event is checked with a round trip to the manager process, so at most this often
+CANCEL_CHECK_SECS = 0.05
+
+
+class Deadline:
+    """
+    When a solve has to stop: after secs, once cancel_event is set, or both.
+    Engines check expired() between assignments and return the roster they have so far.
+
+    Deadlines can be sent to solver processes. The time is wall-clock so it means the same there,
+    while a threading.Event can't cross processes and is dropped; use a multiprocessing manager's
+    Event to cancel solves in other processes. That one is only checked every CANCEL_CHECK_SECS.
+    """
+
+    def __init__(self, secs: float | None = None, cancel_event=None):
+        self.at = time.time() + secs if secs is not None else None
+        self.cancel_event = cancel_event
+        self._cancelled = False
+        self._next_cancel_check = 0.0
+
+    def expired(self) -> bool:
+        if self.at is not None and time.time() >= self.at:
+            return True
+        if self.cancel_event is None or self._cancelled:
+            return self._cancelled
+        if isinstance(self.cancel_event, threading.Event):
+            return self.cancel_event.is_set()
+        now = time.monotonic()
+        if now >= self._next_cancel_check:
+            self._next_cancel_check = now + CANCEL_CHECK_SECS
+            self._cancelled = self.cancel_event.is_set()
+        return self._cancelled
+
+    def remaining_secs(self) -> float | None:
+        """Seconds left before the time limit, if there is one."""
+        return max(0.0, self.at - time.time()) if self.at is not None else None
+
+    def __getstate__(self) -> dict:
+        state = dict(self.__dict__)
+        state["_next_cancel_check"] = 0.0
+        if isinstance(self.cancel_event, threading.Event):
+            state["cancel_event"] = None
+        return state
+
+
+def is_expired(deadline: Deadline | None) -> bool:
+    return deadline is not None and deadline.expired()
+
+
+def cap_deadline(deadline: Deadline | None, secs: float) -> Deadline:
+    """A deadline secs from now, or deadline if that is sooner, still cancelled by deadline's cancel_event."""
+    capped = Deadline(secs, deadline.cancel_event if deadline else None)
+    if deadline is not None and deadline.at is not None:
+        capped.at = min(capped.at, deadline.at)
+    return capped
@@ -0,0 +1,256 @@
+import json
+import os
+import random
+import socket
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from typing import Iterator, List, Tuple
+from dotenv import load_dotenv
+from sendgrid import SendGridAPIClient
+from sendgrid.helpers.mail import Mail
+
+from app.models.contact_us_request import ContactUsRequest
+
+load_dotenv()
+
+SENDGRID_API_KEY = os.getenv("SENDGRID_API_KEY", "")
+SENDGRID_EMAIL_ADDRESS = os.getenv("SENDGRID_EMAIL_ADDRESS", "")
+SENDGRID_API_HOST = os.getenv("SENDGRID_API_HOST", "https://api.sendgrid.com")
+
+
+def build_contact_us_mail(request: ContactUsRequest, email_address: str) -> Mail:
+    """Build the email sent to the team for a contact us request."""
+    message_html = request.message.replace('\n', '<br/>')
+    return Mail(
+        from_email=email_address,
+        to_emails=email_address,
+        subject=f"Caminora Contact Us: {request.name}",
+        plain_text_content=f"Name: {request.name}\nEmail: {request.email}\nPhone: {request.phoneNumber}\nMessage:\n\n{request.message}",
+        html_content=f"""
+            <p><strong>Name:</strong> {request.name}</p>
+            <p><strong>Email:</strong> {request.email}</p>
+            <p><strong>Phone:</strong> {request.phoneNumber}</p>
+            <p><strong>Message:</strong></p>
+            <p>{message_html}</p>
+        """
+    )
+
+
+class EmailOutbox:
+    """
+    Durable queue of contact us requests waiting to be emailed, stored in SQLite.
+
+    Rows stay in the outbox until they are sent. Every API worker runs a sender on the same file,
+    so a sender claims the rows it is about to send for lease_secs, and other senders skip them
+    until the lease runs out (the sender died mid-batch). Rows that keep failing are marked
+    as 'failed' after max_attempts so they can be inspected and replayed by hand.
+    """
+
+    def __init__(self, db_path: str, max_attempts: int = 5, backoff_secs: float = 30.0, lease_secs: float = 300.0):
+        self.db_path = db_path
+        self.max_attempts = max_attempts
+        self.backoff_secs = backoff_secs
+        self.lease_secs = lease_secs
+        self._schema_ready = False
+
+    def enqueue(self, request: ContactUsRequest) -> int:
+        """Store a request in the outbox and return its id."""
+        with self._connect() as conn:
+            cursor = conn.execute(
+                "INSERT INTO outbox (payload, next_attempt_at, created_at) VALUES (?, ?, ?)",
+                (request.model_dump_json(), 0, time.time()),
+            )
+            return cursor.lastrowid
+
+    def claim(self, limit: int, owner: str) -> List[Tuple[int, ContactUsRequest]]:
+        """
+        Claim up to limit requests that are due to be (re)tried, oldest first, so no other sender picks them up.
+        Requests claimed by a sender whose lease has run out are claimed again.
+        Args:
+            limit: Most requests to claim.
+            owner: Id of the claiming sender, unique across processes.
+        """
+        now = time.time()
+        lease_until = now + self.lease_secs
+        with self._connect() as conn:
+            # One statement, so two senders can't both claim a row
+            conn.execute(
+                """
+                UPDATE outbox SET status = 'sending', owner = ?, lease_until = ?
+                WHERE id IN (
+                    SELECT id FROM outbox
+                    WHERE (status = 'pending' AND next_attempt_at <= ?) OR (status = 'sending' AND lease_until <= ?)
+                    ORDER BY id LIMIT ?
+                )
+                """,
+                (owner, lease_until, now, now, limit),
+            )
+            rows = conn.execute(
+                "SELECT id, payload FROM outbox WHERE status = 'sending' AND owner = ? AND lease_until = ? ORDER BY id",
+                (owner, lease_until),
+            ).fetchall()
+        return [(row_id, ContactUsRequest(**json.loads(payload))) for row_id, payload in rows]
+
+    def mark_sent(self, row_id: int, owner: str) -> None:
+        with self._connect() as conn:
+            conn.execute("DELETE FROM outbox WHERE id = ? AND owner = ?", (row_id, owner))
+
+    def mark_failed(self, row_id: int, owner: str, error: str) -> None:
+        """
+        Release a claimed request, scheduling a retry with jittered exponential backoff or giving up after max_attempts.
+        Does nothing if the owner's lease ran out and another sender claimed it.
+        """
+        with self._connect() as conn:
+            row = conn.execute("SELECT attempts FROM outbox WHERE id = ? AND owner = ?", (row_id, owner)).fetchone()
+            if row is None:
+                return
+            attempts = row[0] + 1
+            status = "failed" if attempts >= self.max_attempts else "pending"
+            delay = self.backoff_secs * 2 ** (attempts - 1) * random.uniform(0.5, 1.5)
+            conn.execute(
+                """
+                UPDATE outbox SET attempts = ?, status = ?, next_attempt_at = ?, last_error = ?, owner = NULL, lease_until = NULL
+                WHERE id = ? AND owner = ?
+                """,
+                (attempts, status, time.time() + delay, error, row_id, owner),
+            )
+
+    def count(self, status: str = "pending") -> int:
+        with self._connect() as conn:
+            (count,) = conn.execute("SELECT COUNT(*) FROM outbox WHERE status = ?", (status,)).fetchone()
+        return count
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Open a connection for one transaction, committed if the block succeeds and closed after it."""
+        conn = sqlite3.connect(self.db_path, timeout=10)
+        try:
+            if not self._schema_ready:
+                self._create_schema(conn)
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def _create_schema(self, conn: sqlite3.Connection) -> None:
+        conn.execute("PRAGMA journal_mode=WAL")
+        with conn:
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS outbox (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    payload TEXT NOT NULL,
+                    status TEXT NOT NULL DEFAULT 'pending',
+                    attempts INTEGER NOT NULL DEFAULT 0,
+                    next_attempt_at REAL NOT NULL,
+                    created_at REAL NOT NULL,
+                    last_error TEXT,
+                    owner TEXT,
+                    lease_until REAL
+                )
+                """
+            )
+            # Outboxes created before claims were added
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(outbox)")}
+            for column, column_type in [("owner", "TEXT"), ("lease_until", "REAL")]:
+                if column not in columns:
+                    conn.execute(f"ALTER TABLE outbox ADD COLUMN {column} {column_type}")
+        self._schema_ready = True
+
+
+class OutboxSender:
+    """
+    Background thread that delivers outbox emails through one reused SendGrid client.
+
+    The sender wakes up when new mail is enqueued or every poll_interval_secs to pick
+    up retries, and claims and sends up to batch_size emails per pass.
+    """
+
+    def __init__(
+        self,
+        outbox: EmailOutbox,
+        client: SendGridAPIClient,
+        email_address: str,
+        batch_size: int = 20,
+        poll_interval_secs: float = 5.0,
+    ):
+        self.outbox = outbox
+        self.client = client
+        self.email_address = email_address
+        self.batch_size = batch_size
+        self.poll_interval_secs = poll_interval_secs
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="email-outbox", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._wake.set()
+        self._thread.join(timeout)
+        self._thread = None
+
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    @property
+    def owner(self) -> str:
+        """Id the sender claims outbox rows under. Read on each pass, as workers are forked after the sender is created."""
+        return f"{socket.gethostname()}:{os.getpid()}"
+
+    def wake(self) -> None:
+        """Ask the sender to deliver newly enqueued mail now rather than at the next poll."""
+        self._wake.set()
+
+    def flush(self) -> int:
+        """
+        Send one batch of due emails.
+
+        Returns:
+            int: Number of emails sent successfully
+        """
+        sent = 0
+        owner = self.owner
+        for row_id, request in self.outbox.claim(self.batch_size, owner):
+            try:
+                self.client.send(build_contact_us_mail(request, self.email_address))
+                self.outbox.mark_sent(row_id, owner)
+                sent += 1
+            except Exception as e:
+                print(f"SendGrid error for outbox id {row_id}: {e}")
+                self.outbox.mark_failed(row_id, owner, str(e))
+        return sent
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            # Clear before flushing, so a wake() during the flush is seen by the wait below instead of lost
+            self._wake.clear()
+            try:
+                # Keep draining while full batches are going out
+                while self.flush() == self.batch_size and not self._stop.is_set():
+                    pass
+            except Exception as e:
+                print(f"Email outbox error: {e}")
+            self._wake.wait(self.poll_interval_secs)
+
+
+def is_email_configured() -> bool:
+    return bool(SENDGRID_API_KEY and SENDGRID_EMAIL_ADDRESS)
+
+
+email_outbox = EmailOutbox(
+    os.getenv("EMAIL_OUTBOX_PATH", os.path.join(os.path.dirname(__file__), "emailOutbox.sqlite3"))
+)
+sendgrid_client = SendGridAPIClient(SENDGRID_API_KEY, host=SENDGRID_API_HOST)
+sendgrid_client.client.timeout = 10
+email_sender = OutboxSender(email_outbox, sendgrid_client, SENDGRID_EMAIL_ADDRESS)
@@ -0,0 +1,28 @@
+from typing import List
+
+from app.models.job import Job
+from app.models.roster_response import RosterResponse
+from app.models.salesman import Salesman
+from app.models.solver_options import SolverOptions
+from app.services.deadline import Deadline
+from app.services.exact_solver import assign_jobs_exact, is_small_instance
+from app.services.job_assignment import assign_jobs
+from app.services.regret_insertion import assign_jobs_regret
+from app.services.round_robin_assignment import assign_jobs_round_robin
+
+ENGINES = {
+    "greedy": assign_jobs,
+    "round_robin": assign_jobs_round_robin,
+    "exact": assign_jobs_exact,
+    "regret": assign_jobs_regret,
+}
+
+
+def run_engine(
+    jobs: List[Job], salesmen: List[Salesman], options: SolverOptions, deadline: Deadline | None = None
+) -> RosterResponse:
+    """Run the assignment engine selected by options.engine, stopping early if the deadline expires."""
+    engine = options.engine
+    if engine == "auto":
+        engine = "exact" if is_small_instance(jobs, salesmen) else "greedy"
+    return ENGINES[engine](jobs, salesmen, options, deadline)
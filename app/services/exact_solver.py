@@ -0,0 +1,221 @@
+import time
+from bisect import bisect_right
+from itertools import accumulate
+from typing import List, Tuple
+
+from app.models.job import Job
+from app.models.roster_response import RosterResponse
+from app.models.salesman import Salesman
+from app.models.solver_options import SolverOptions
+from app.services.deadline import DEADLINE_MESSAGE, Deadline, is_expired
+from app.services.job_assignment import assign_jobs, generate_roster_message, order_jobs
+from app.services.job_table import JobTable
+
+EXACT_MAX_SALESMEN = 5
+EXACT_MAX_JOBS = 40
+# Travel times are rounded to whole minutes, so inserting a job between two others can shorten
+# a route's travel by up to a minute; the bound allows for it
+MAX_INSERTION_TRAVEL_SAVING_SECS = 60
+
+
+class _OutOfTime(Exception):
+    pass
+
+
+def is_small_instance(jobs: List[Job], salesmen: List[Salesman]) -> bool:
+    """True if the request is small enough for the exact solver to be worth trying."""
+    return len(salesmen) <= EXACT_MAX_SALESMEN and len(jobs) <= EXACT_MAX_JOBS
+
+
+def assign_jobs_exact(
+    jobs: List[Job], salesmen: List[Salesman], options: SolverOptions | None = None, deadline: Deadline | None = None
+) -> RosterResponse:
+    """
+    Assign jobs with a branch and bound search, for small requests.
+
+    Rosters are compared on the number of jobs assigned, then minutes of work assigned, then travel.
+    The search starts from the greedy roster and returns the best roster found when it finishes
+    or when options.exact_time_limit_secs or the deadline runs out, so it is never worse than the greedy.
+
+    Routes follow the same rules as the greedy: the first job starts when both the salesman and the
+    job are available, every later job once the salesman has travelled from the previous one and the
+    job has opened, every job finishes by its exit time and the salesman's end time, and the workday
+    from the first job's start stays within max_workday_mins.
+    """
+    options = options or SolverOptions()
+    roster = RosterResponse()
+    roster.add_salesmen(salesmen)
+
+    if not jobs:
+        roster.message = "No jobs to assign"
+        return roster
+
+    greedy = assign_jobs(
+        [job.model_copy(deep=True) for job in jobs],
+        [salesman.model_copy(deep=True) for salesman in salesmen],
+        options.model_copy(update={"engine": "greedy"}),
+        deadline,
+    )
+    search = _BranchAndBound(order_jobs(jobs, options), salesmen)
+    search.set_incumbent(greedy, salesmen)
+    time_limit_secs = min(options.exact_time_limit_secs, (deadline and deadline.remaining_secs()) or float("inf"))
+    search.run(time.monotonic() + time_limit_secs, deadline)
+    print(f"Exact solver: {search.best_score[0]} jobs assigned after {search.nodes} nodes ({'optimal' if search.finished else 'time limit reached'})")
+
+    table = search.table
+    for s, (salesman, route) in enumerate(zip(salesmen, search.best_routes)):
+        for row, arrival in zip(route, search.arrival_times(s, route)):
+            roster.assign_job_to_salesman(table.jobs[row], salesman, table.to_datetime(arrival))
+    assigned = {row for route in search.best_routes for row in route}
+    roster.unassigned_jobs.extend(job for row, job in enumerate(table.jobs) if row not in assigned)
+    roster.message = generate_roster_message(roster, stopped_early=greedy.message == DEADLINE_MESSAGE)
+    return roster
+
+
+class _BranchAndBound:
+    """
+    Depth-first search over jobs in order. Each job is either inserted at some position of some
+    salesman's route, cheapest insertion first, or left unassigned.
+    Each job sequence of a route is generated exactly once, as later jobs are only ever inserted.
+    """
+
+    def __init__(self, jobs: List[Job], salesmen: List[Salesman]):
+        self.table = JobTable(jobs)
+        n = len(jobs)
+        self.travel = [
+            [int(a.location.travel_time_to(b.location).total_seconds()) if i != j else 0 for j, b in enumerate(jobs)]
+            for i, a in enumerate(jobs)
+        ]
+        self.entry = self.table.entry.tolist()
+        self.exit = self.table.exit.tolist()
+        self.duration = self.table.duration.tolist()
+        self.start = [self.table.to_seconds(salesman.start_time) for salesman in salesmen]
+        self.end = [self.table.to_seconds(salesman.end_time) for salesman in salesmen]
+        self.max_workday = [salesman.max_workday_mins * 60 for salesman in salesmen]
+
+        self.routes: List[List[int]] = [[] for _ in salesmen]
+        self.route_travel = [0] * len(salesmen)
+        # Work each salesman can fit between their start and end time within max_workday_mins
+        self.workday = [min(max_workday, end - start) for max_workday, start, end in zip(self.max_workday, self.start, self.end)]
+        self.route_duration = [0] * len(salesmen)
+        # Only jobs that fit into some salesman's empty day are worth branching on
+        self.order = [row for row in range(n) if any(self._evaluate(s, [row]) for s in range(len(salesmen)))]
+        # For the capacity bound: prefix sums of the sorted durations of the jobs still to place
+        self.suffix_durations = [
+            list(accumulate(sorted(self.duration[row] for row in self.order[depth:]))) for depth in range(len(self.order) + 1)
+        ]
+
+        self.best_score: Tuple[int, int, int] = (0, 0, 0)
+        self.best_routes: List[List[int]] = [[] for _ in salesmen]
+        self.nodes = 0
+        self.finished = False
+        self._deadline = 0.0
+        self._solve_deadline = None
+
+    def set_incumbent(self, roster: RosterResponse, salesmen: List[Salesman]) -> None:
+        """Start from an existing roster of the same jobs and salesmen."""
+        rows = {job.job_id: row for row, job in enumerate(self.table.jobs)}
+        routes = [[rows[job.job_id] for job in roster.jobs.get(salesman.salesman_id, [])] for salesman in salesmen]
+        evaluations = [self._evaluate(s, route) for s, route in enumerate(routes)]
+        if all(evaluations):
+            assigned = [row for route in routes for row in route]
+            self.best_score = (
+                len(assigned),
+                sum(self.duration[row] for row in assigned),
+                -sum(travel for travel, _ in evaluations),
+            )
+            self.best_routes = routes
+
+    def run(self, deadline: float, solve_deadline: Deadline | None = None) -> None:
+        """Search until every branch is explored, the deadline (time.monotonic) passes or the solve deadline expires."""
+        self._deadline = deadline
+        self._solve_deadline = solve_deadline
+        if is_expired(solve_deadline):
+            return
+        try:
+            self._search(0, 0, 0, 0)
+            self.finished = True
+        except _OutOfTime:
+            pass
+
+    def arrival_times(self, s: int, route: List[int]) -> List[int]:
+        """Start time of each job of a feasible route for salesman s, in seconds since the table origin."""
+        arrivals = []
+        previous = None
+        for row in route:
+            if previous is None:
+                arrival = max(self.start[s], self.entry[row])
+            else:
+                arrival = max(arrivals[-1] + self.duration[previous] + self.travel[previous][row], self.entry[row])
+            arrivals.append(arrival)
+            previous = row
+        return arrivals
+
+    def _search(self, depth: int, assigned: int, minutes: int, travel: int) -> None:
+        self.nodes += 1
+        if self.nodes % 1000 == 0 and (time.monotonic() > self._deadline or is_expired(self._solve_deadline)):
+            raise _OutOfTime()
+
+        score = (assigned, minutes, -travel)
+        if score > self.best_score:
+            self.best_score = score
+            self.best_routes = [route.copy() for route in self.routes]
+        if depth == len(self.order) or self._upper_bound(depth, assigned, minutes, travel) <= self.best_score:
+            return
+
+        row = self.order[depth]
+        insertions = []
+        for s, route in enumerate(self.routes):
+            for position in range(len(route) + 1):
+                candidate = route[:position] + [row] + route[position:]
+                evaluation = self._evaluate(s, candidate)
+                if evaluation:
+                    new_travel = evaluation[0]
+                    insertions.append((new_travel - self.route_travel[s], s, position, new_travel))
+        insertions.sort()
+
+        for added_travel, s, position, new_travel in insertions:
+            old_travel = self.route_travel[s]
+            self.routes[s].insert(position, row)
+            self.route_travel[s] = new_travel
+            self.route_duration[s] += self.duration[row]
+            self._search(depth + 1, assigned + 1, minutes + self.duration[row], travel + added_travel)
+            self.routes[s].pop(position)
+            self.route_travel[s] = old_travel
+            self.route_duration[s] -= self.duration[row]
+
+        self._search(depth + 1, assigned, minutes, travel)
+
+    def _upper_bound(self, depth: int, assigned: int, minutes: int, travel: int) -> Tuple[int, int, int]:
+        """
+        Optimistic score: as many remaining jobs as fit into the salesmen's remaining hours.
+        A salesman's remaining hours are their workday less the work already in their route, not less
+        the route's span, as jobs can still be inserted into idle gaps between the route's jobs.
+        """
+        capacity = sum(workday - duration for workday, duration in zip(self.workday, self.route_duration))
+        durations = self.suffix_durations[depth]
+        extra_jobs = bisect_right(durations, capacity)
+        return assigned + extra_jobs, minutes + (durations[-1] if durations else 0), -travel + extra_jobs * MAX_INSERTION_TRAVEL_SAVING_SECS
+
+    def _evaluate(self, s: int, route: List[int]) -> Tuple[int, int] | None:
+        """
+        Check a route for salesman s.
+        Returns:
+            Travel and workday span of the route in seconds, or None if it is infeasible.
+        """
+        finish = first_start = None
+        travel = 0
+        previous = None
+        for row in route:
+            if previous is None:
+                arrival = max(self.start[s], self.entry[row])
+                first_start = arrival
+            else:
+                leg = self.travel[previous][row]
+                travel += leg
+                arrival = max(finish + leg, self.entry[row])
+            finish = arrival + self.duration[row]
+            if finish > self.exit[row] or finish > self.end[s] or finish - first_start > self.max_workday[s]:
+                return None
+            previous = row
+        return travel, (finish - first_start if route else 0)
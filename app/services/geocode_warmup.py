@@ -0,0 +1,127 @@
+"""
+Geocode addresses ahead of time so the first rosters after a deploy don't wait on the Google API.
+
+Reads addresses from text files (one per line) or from past RosterRequest payloads (.json, one
+payload or a list of them, or .jsonl, one payload per line), skips those already in the location
+cache, geocodes the rest concurrently at a limited rate and writes them to the cache in one go.
+
+Usage:
+    python -m app.services.geocode_warmup addresses.txt requests.jsonl [--concurrency 8] [--rate 10]
+        [--base-url http://localhost:8080/geocode/json] [--cache-file app/services/locationCache.json]
+
+Addresses that couldn't be geocoded are listed on stderr and the summary is printed on stdout.
+Exits with status 1 if any uncached address couldn't be geocoded, so a deploy step can tell the cache is incomplete.
+"""
+import argparse
+import json
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, Iterator, List
+
+from app.services.address_keys import address_key
+from app.services.geocoding_client import TokenBucket
+from app.services.location_helpers import LocationHelpers
+
+
+def read_addresses(paths: Iterable[str]) -> Iterator[str]:
+    """Yield addresses from text files and RosterRequest payload files."""
+    for path in paths:
+        with open(path) as file:
+            if path.endswith(".jsonl"):
+                for line in file:
+                    if line.strip():
+                        yield from get_request_addresses(json.loads(line))
+            elif path.endswith(".json"):
+                payloads = json.load(file)
+                for payload in payloads if isinstance(payloads, list) else [payloads]:
+                    yield from get_request_addresses(payload)
+            else:
+                yield from (line.strip() for line in file if line.strip())
+
+
+def get_request_addresses(payload: dict) -> Iterator[str]:
+    """
+    Addresses a RosterRequest payload would geocode: those of jobs and salesmen without coordinates.
+    Reads the raw payload, as validating it as a RosterRequest would geocode the addresses.
+    """
+    for item in payload.get("jobs", []) + payload.get("salesmen", []):
+        location = item.get("location") or {}
+        if location.get("address") and (location.get("latitude") is None or location.get("longitude") is None):
+            yield location["address"]
+
+
+def get_cache_misses(addresses: Iterable[str]) -> List[str]:
+    """Addresses not in the location cache, one per canonical key."""
+    misses = {}
+    for address in addresses:
+        key = address_key(address)
+        if key not in misses and LocationHelpers.lookup_cache(address) is None:
+            misses[key] = address
+    return list(misses.values())
+
+
+def geocode_all(addresses: List[str], concurrency: int = 8, rate_per_sec: float = 10) -> Dict[str, dict]:
+    """
+    Geocode addresses through the API, with at most concurrency requests in flight
+    and rate_per_sec requests started per second (the geocoding client's own limit, GEOCODE_RATE_PER_SEC, still applies).
+
+    Returns:
+        Valid locations by address. Addresses that fail are reported and left out.
+    """
+    limiter = TokenBucket(rate_per_sec)
+
+    def geocode(address: str):
+        limiter.acquire()
+        try:
+            return address, LocationHelpers.get_coordinates_via_api(address)
+        except Exception as e:
+            return address, e
+
+    locations = {}
+    with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="geocode") as executor:
+        for address, result in executor.map(geocode, addresses):
+            if LocationHelpers.is_valid_location(result):
+                locations[address] = result
+            else:
+                print(f"Couldn't geocode {address}: {result or 'no results'}", file=sys.stderr)
+    return locations
+
+
+def warm_cache(paths: Iterable[str], concurrency: int = 8, rate_per_sec: float = 10) -> Dict[str, int]:
+    """
+    Geocode the uncached addresses in the given files and save them to the location cache.
+
+    Returns:
+        Counts of addresses read, cache misses and addresses geocoded.
+    """
+    addresses = list(read_addresses(paths))
+    misses = get_cache_misses(addresses)
+    locations = geocode_all(misses, concurrency, rate_per_sec)
+    if locations:
+        LocationHelpers.add_results_to_cache(locations)
+    return {"addresses": len(addresses), "misses": len(misses), "geocoded": len(locations)}
+
+
+def main(argv: List[str] | None = None) -> int:
+    """Run the warm-up from the command line, returning the exit status."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("paths", nargs="+", help="Address lists (.txt) or RosterRequest payloads (.json, .jsonl)")
+    parser.add_argument("--concurrency", type=int, default=8, help="Requests in flight at once")
+    parser.add_argument("--rate", type=float, default=10, help="Requests started per second")
+    parser.add_argument("--base-url", help="Geocoding API URL, defaults to GEOCODE_API_URL or Google's")
+    parser.add_argument("--cache-file", help="Location cache to warm, defaults to app/services/locationCache.json")
+    args = parser.parse_args(argv)
+
+    if args.base_url:
+        LocationHelpers.geocode_url = args.base_url
+    if args.cache_file:
+        LocationHelpers.locationCache = {}
+        LocationHelpers.load_coordinates(args.cache_file)
+
+    counts = warm_cache(args.paths, args.concurrency, args.rate)
+    print(f"Read {counts['addresses']} addresses, {counts['misses']} not cached, {counts['geocoded']} geocoded")
+    return 0 if counts["geocoded"] == counts["misses"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,221 @@
+import os
+import random
+import threading
+import time
+from collections import deque
+from typing import Dict
+import requests
+from requests.adapters import HTTPAdapter
+from dotenv import load_dotenv
+
+load_dotenv()
+
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+# Statuses Google reports in the body of a 200 response that are worth retrying
+RETRY_API_STATUSES = {"OVER_QUERY_LIMIT", "UNKNOWN_ERROR"}
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling an API that has been failing, until it has had time to recover."""
+
+
+class GeocodingError(Exception):
+    """Raised when the geocoding API answers with an error status in the body, e.g. OVER_QUERY_LIMIT."""
+
+    def __init__(self, status: str, message: str = ""):
+        super().__init__(f"{status} from geocoding API{': ' + message if message else ''}")
+        self.status = status
+
+
+class TokenBucket:
+    """Allows rate_per_sec calls on average, in bursts of up to capacity, across threads."""
+
+    def __init__(self, rate_per_sec: float, capacity: float = 1):
+        self.rate_per_sec = rate_per_sec
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Take a token, waiting for one if the bucket is empty."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate_per_sec)
+            self._updated = now
+            self._tokens -= 1
+            wait_secs = -self._tokens / self.rate_per_sec if self._tokens < 0 else 0
+        time.sleep(wait_secs)
+
+
+class CircuitBreaker:
+    """
+    Stops calls after failure_threshold failures in a row. After reset_timeout_secs one trial call
+    is let through: success closes the circuit again, failure keeps it open for another timeout.
+    """
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout_secs: float = 30):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout_secs = reset_timeout_secs
+        self.failures = 0
+        self._opened_at = None
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        if self._opened_at is None:
+            return "closed"
+        return "half_open" if time.monotonic() - self._opened_at >= self.reset_timeout_secs else "open"
+
+    def before_call(self) -> None:
+        with self._lock:
+            state = self.state
+            if state == "open" or (state == "half_open" and self._trial_in_flight):
+                raise CircuitOpenError(f"Circuit open after {self.failures} failures")
+            self._trial_in_flight = state == "half_open"
+
+    def record_success(self) -> None:
+        with self._lock:
+            self.failures = 0
+            self._opened_at = None
+            self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self.failures += 1
+            self._trial_in_flight = False
+            if self._opened_at is not None or self.failures >= self.failure_threshold:
+                self._opened_at = time.monotonic()
+
+
+class GeocodingClient:
+    """
+    HTTP client for the geocoding API, shared by all lookups.
+
+    Keeps connections alive in a pool, times out slow responses, retries 429s, 5xx responses,
+    OVER_QUERY_LIMIT and UNKNOWN_ERROR answers and connection errors with jittered exponential
+    backoff, limits the request rate with a token bucket and stops calling the API through a
+    circuit breaker while it keeps failing.
+
+    Attributes:
+        timeout_secs: Connect and read timeout of each attempt
+        max_retries: Retries after the first attempt
+        backoff_secs: Base delay before the first retry, doubled for each later one
+    """
+
+    def __init__(
+        self,
+        timeout_secs: float = 5,
+        max_retries: int = 3,
+        backoff_secs: float = 0.5,
+        rate_per_sec: float = 10,
+        burst: int = 10,
+        pool_size: int = 10,
+        failure_threshold: int = 5,
+        reset_timeout_secs: float = 30,
+    ):
+        self.timeout_secs = timeout_secs
+        self.max_retries = max_retries
+        self.backoff_secs = backoff_secs
+        self.rate_limiter = TokenBucket(rate_per_sec, burst)
+        self.circuit_breaker = CircuitBreaker(failure_threshold, reset_timeout_secs)
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self._latencies = deque(maxlen=1000)
+        self._counts = {"requests": 0, "retries": 0, "failures": 0, "rejected": 0}
+        self._metrics_lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls) -> "GeocodingClient":
+        return cls(
+            timeout_secs=float(os.getenv("GEOCODE_TIMEOUT_SECS", 5)),
+            max_retries=int(os.getenv("GEOCODE_MAX_RETRIES", 3)),
+            rate_per_sec=float(os.getenv("GEOCODE_RATE_PER_SEC", 10)),
+        )
+
+    def get_json(self, url: str, params: dict) -> dict:
+        """
+        GET url and return the JSON body.
+        Raises:
+            CircuitOpenError: if the API has been failing
+            requests.RequestException: if every attempt failed, or for a response that isn't worth retrying
+            GeocodingError: if every attempt was answered with a retryable error status in the body
+        """
+        try:
+            self.circuit_breaker.before_call()
+        except CircuitOpenError:
+            self._count("rejected")
+            raise
+
+        for attempt in range(self.max_retries + 1):
+            self.rate_limiter.acquire()
+            self._count("requests")
+            start = time.perf_counter()
+            retry_after = None
+            try:
+                response = self.session.get(url, params=params, timeout=self.timeout_secs)
+                if response.status_code in RETRY_STATUSES:
+                    error = requests.HTTPError(f"{response.status_code} from geocoding API", response=response)
+                    retry_after = response.headers.get("Retry-After")
+                else:
+                    response.raise_for_status()
+                    data = response.json()
+                    status = data.get("status") if isinstance(data, dict) else None
+                    if status not in RETRY_API_STATUSES:
+                        self._record_latency(time.perf_counter() - start)
+                        self.circuit_breaker.record_success()
+                        return data
+                    error = GeocodingError(status, data.get("error_message", ""))
+            except (requests.ConnectionError, requests.Timeout) as e:
+                error = e
+            except requests.RequestException:
+                # A 4xx other than 429 won't get better by retrying, and doesn't mean the API is down
+                self.circuit_breaker.record_success()
+                raise
+            self._record_latency(time.perf_counter() - start)
+
+            if attempt < self.max_retries:
+                self._count("retries")
+                time.sleep(self._get_backoff_secs(attempt, retry_after))
+
+        self._count("failures")
+        self.circuit_breaker.record_failure()
+        raise error
+
+    def metrics(self) -> Dict[str, float]:
+        """Request counts and latency percentiles in milliseconds over the last 1000 attempts."""
+        with self._metrics_lock:
+            latencies = sorted(self._latencies)
+            metrics = dict(self._counts)
+
+        def percentile(p: float) -> float:
+            return latencies[min(len(latencies) - 1, int(p * len(latencies)))] * 1000 if latencies else 0.0
+
+        metrics.update({
+            "latency_p50_ms": percentile(0.5),
+            "latency_p95_ms": percentile(0.95),
+            "latency_max_ms": latencies[-1] * 1000 if latencies else 0.0,
+            "circuit": self.circuit_breaker.state,
+        })
+        return metrics
+
+    def _get_backoff_secs(self, attempt: int, retry_after: str | None) -> float:
+        """Full jitter exponential backoff, or the server's Retry-After if it asks for longer."""
+        backoff = random.uniform(0, self.backoff_secs * 2 ** attempt)
+        if retry_after and retry_after.isdigit():
+            backoff = max(backoff, float(retry_after))
+        return backoff
+
+    def _record_latency(self, secs: float) -> None:
+        with self._metrics_lock:
+            self._latencies.append(secs)
+
+    def _count(self, name: str) -> None:
+        with self._metrics_lock:
+            self._counts[name] += 1
+
+
+geocoding_client = GeocodingClient.from_env()
@@ -0,0 +1,167 @@
+from datetime import datetime
+from typing import List, Tuple
+import numpy as np
+
+from app.models.salesman import Salesman
+from app.services.job_table import JobTable
+
+# Stands in for the cost of a route a job can't be inserted into, so jobs with fewer options have more regret
+INFEASIBLE_REGRET_SECS = 10 ** 7
+
+
+class InsertionRoutes:
+    """
+    Routes under construction, with the cost matrix of inserting each job into each route.
+
+    Times are seconds since the job table's origin. For each route it keeps the arrival and finish
+    of every job and how far each job could be pushed back without breaking a later job's limits,
+    so an insertion is checked in constant time per position for all jobs at once.
+    Travel is computed for the changed route only, to the jobs still unassigned, so memory grows
+    with a route's length rather than with every routed job times every job.
+    """
+
+    def __init__(
+        self,
+        table: JobTable,
+        salesmen: List[Salesman],
+        routes: List[List[int]] | None = None,
+        start_times: List[datetime] | None = None,
+    ):
+        """
+        Args:
+            table: Every job, routed or not
+            salesmen: Salesmen whose routes are built
+            routes: Rows already on each salesman's route, in order; empty by default
+            start_times: When each salesman can start, if not their start_time
+        """
+        self.table = table
+        n = len(table)
+        start_times = start_times or [salesman.start_time for salesman in salesmen]
+        self.start = [table.to_seconds(start_time) for start_time in start_times]
+        self.end = [table.to_seconds(salesman.end_time) for salesman in salesmen]
+        self.max_workday = [salesman.max_workday_mins * 60 for salesman in salesmen]
+
+        self.routes: List[List[int]] = [list(route) for route in routes] if routes is not None else [[] for _ in salesmen]
+        self.arrival: List[List[int]] = [[] for _ in salesmen]
+        self.finish: List[List[int]] = [[] for _ in salesmen]
+        self.max_shift: List[List[int]] = [[] for _ in salesmen]
+        self.waits_after: List[List[int]] = [[] for _ in salesmen]
+
+        self.cost = np.full((n, len(salesmen)), np.inf)
+        self.position = np.zeros((n, len(salesmen)), dtype=np.int64)
+        for route in self.routes:
+            for row in route:
+                table.mark_assigned(table.jobs[row])
+        for s in range(len(salesmen)):
+            self._refresh(s)
+
+    def insert_next(self, k: int) -> bool:
+        """
+        Insert the job with the highest regret into its cheapest route, where regret is how much more
+        the job's next k-1 cheapest routes cost than its cheapest.
+        Returns:
+            False if no unassigned job fits into any route.
+        """
+        rows = np.flatnonzero(self.table.unassigned)
+        costs = self.cost[rows]
+        cheapest = costs.min(axis=1)
+        insertable = np.isfinite(cheapest)
+        if not insertable.any():
+            return False
+        rows, costs, cheapest = rows[insertable], costs[insertable], cheapest[insertable]
+
+        k = min(k, costs.shape[1])
+        nearest = np.sort(np.where(np.isfinite(costs), costs, INFEASIBLE_REGRET_SECS), axis=1)[:, :k]
+        regret = (nearest - nearest[:, :1]).sum(axis=1)
+        best = np.lexsort((rows, cheapest, -regret))[0]
+
+        row = int(rows[best])
+        s = int(np.argmin(self.cost[row]))
+        self._insert(s, int(self.position[row, s]), row)
+        return True
+
+    def _insert(self, s: int, position: int, row: int) -> None:
+        self.routes[s].insert(position, row)
+        self.table.mark_assigned(self.table.jobs[row])
+        self.cost[row] = np.inf
+        self._refresh(s)
+
+    def _refresh(self, s: int) -> None:
+        """Reschedule route s and recompute the insertion costs into it."""
+        route_travel = self._route_travel(s)
+        self._schedule(s, route_travel[1])
+        self._update_costs(s, route_travel)
+
+    def _route_travel(self, s: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        The unassigned jobs, the travel between the jobs on route s, and from each of those to each unassigned job.
+        Travel times are symmetric, so these also give the travel from an unassigned job to a routed one.
+        """
+        route = self.routes[s]
+        candidates = np.flatnonzero(self.table.unassigned)
+        columns = np.concatenate([np.array(route, dtype=np.int64), candidates])
+        travel = np.array(
+            [self.table.travel_seconds_from(self.table.jobs[row].location, columns) for row in route], dtype=np.int64
+        ).reshape(len(route), len(columns))
+        return candidates, travel[:, :len(route)], travel[:, len(route):]
+
+    def _schedule(self, s: int, legs: np.ndarray) -> None:
+        """Recompute arrivals, finishes and slack along route s, legs[i, j] being the travel between its jobs i and j."""
+        route, entry, duration = self.routes[s], self.table.entry, self.table.duration
+        arrival, finish, waits = [], [], []
+        for i, row in enumerate(route):
+            ready = self.start[s] if i == 0 else finish[-1] + int(legs[i - 1, i])
+            arrival.append(max(ready, int(entry[row])))
+            finish.append(arrival[-1] + int(duration[row]))
+            waits.append(arrival[-1] - ready if i > 0 else 0)
+
+        # max_shift[i]: how far job i can start later before some job from i on breaks its limit.
+        # waits_after[i]: waiting after job i, which absorbs a delay before it reaches the route's end.
+        max_shift, waits_after = [0] * len(route), [0] * len(route)
+        for i in reversed(range(len(route))):
+            slack = min(int(self.table.exit[route[i]]), self.end[s]) - finish[i]
+            if i + 1 < len(route):
+                max_shift[i] = min(slack, waits[i + 1] + max_shift[i + 1])
+                waits_after[i] = waits[i + 1] + waits_after[i + 1]
+            else:
+                max_shift[i] = slack
+        self.arrival[s], self.finish[s], self.max_shift[s], self.waits_after[s] = arrival, finish, max_shift, waits_after
+
+    def _update_costs(self, s: int, route_travel: Tuple[np.ndarray, np.ndarray, np.ndarray] | None = None) -> None:
+        """Recompute every unassigned job's cheapest insertion into route s, checking each position for all jobs at once."""
+        candidates, legs, travel = route_travel if route_travel is not None else self._route_travel(s)
+        route, arrival, finish = self.routes[s], self.arrival[s], self.finish[s]
+        entry, duration = self.table.entry[candidates], self.table.duration[candidates]
+        limit = np.minimum(self.table.exit[candidates], self.end[s])
+        best = np.full(len(candidates), np.inf)
+        best_position = np.zeros(len(candidates), dtype=np.int64)
+
+        for position in range(len(route) + 1):
+            if position == 0:
+                job_arrival = np.maximum(self.start[s], entry)
+                added = travel[0] if route else np.zeros(len(candidates), dtype=np.int64)
+            else:
+                job_arrival = np.maximum(finish[position - 1] + travel[position - 1], entry)
+                added = travel[position - 1]
+            job_finish = job_arrival + duration
+            feasible = job_finish <= limit
+
+            if position < len(route):
+                following_entry = int(self.table.entry[route[position]])
+                shift = np.maximum(np.maximum(job_finish + travel[position], following_entry) - arrival[position], 0)
+                feasible &= shift <= self.max_shift[s][position]
+                route_finish = finish[-1] + np.maximum(shift - self.waits_after[s][position], 0)
+                if position > 0:
+                    added = added + travel[position] - int(legs[position - 1, position])
+            else:
+                route_finish = job_finish
+            first_start = job_arrival if position == 0 else arrival[0]
+            feasible &= route_finish - first_start <= self.max_workday[s]
+
+            better = feasible & (added < best)
+            best[better] = added[better]
+            best_position[better] = position
+
+        self.cost[:, s] = np.inf
+        self.cost[candidates, s] = best
+        self.position[candidates, s] = best_position
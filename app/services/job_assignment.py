@@ -1,33 +1,59 @@
-from typing import List
+import random
+from typing import Dict, Iterable, List, Set, Tuple
 from datetime import datetime, timedelta
 from sklearn.cluster import KMeans
 import numpy as np
 
 from app.models.job import Job
+from app.models.location import Location
 from app.models.roster_response import RosterResponse
 from app.models.salesman import Salesman
-from app.services.clustering_service import cluster_jobs
+from app.models.solver_options import SolverOptions
+from app.services.cluster_plan import MIN_TRAVEL, plan_clusters
+from app.services.clustering_service import cluster_jobs, get_cluster_affinity, get_cluster_centroids, index_clusters
+from app.services.deadline import DEADLINE_MESSAGE, Deadline, is_expired
+from app.services.insertion_routes import InsertionRoutes
+from app.services.job_table import JobTable
+from app.services.spatial_index import SpatialGrid
 
 
-def assign_jobs(jobs: List[Job], salesmen: List[Salesman]) -> RosterResponse:
+def assign_jobs(
+    jobs: List[Job],
+    salesmen: List[Salesman],
+    options: SolverOptions | None = None,
+    deadline: Deadline | None = None,
+    hints: Dict[str, str] | None = None,
+) -> RosterResponse:
     """
     Optimally assign jobs to salesmen based on urgency, clusters, and time constraints.
     
     The flow is:
-    1. Sort jobs by urgency.
-    2. Cluster jobs into 4 clusters.
-    3. Copy jobs and salesmen into unassigned/ unrostered lists.
+    1. Sort jobs by urgency (or options.job_order).
+    2. Cluster jobs into 4 clusters (or options.n_clusters).
+    3. Copy jobs and salesmen into unassigned/ unrostered lists. Unassigned jobs are also grouped by
+       cluster once, so assigning a job removes it in constant time and no list is rebuilt in the loop.
+       With hints (job_id -> salesman_id, from a warm start), each salesman's route is first seeded with
+       the jobs hinted to them, in hint order, skipping any they can no longer complete. As the loop below
+       only adds jobs to the end of routes, the time left before and between seeded jobs is filled in at step 5.
     4. For each salesman (one at a time) assign jobs until they reach capacity:
-         a. Look over unassigned jobs (skipping jobs whose clusters are in exhausted_clusters)
+         a. Look over unassigned jobs (skipping jobs whose clusters are in exhausted_clusters, and
+            with options.nearest_clusters those outside the salesman's nearest clusters to home)
             to find the first job the salesman can complete.
          b. Once found, focus on that job’s cluster:
-             i. Iterate over jobs in that cluster (ordered by urgency) and assign all that the salesman can complete.
+             i. Iterate over jobs in that cluster (ordered by urgency, by distance or along the cluster's
+                precomputed tour depending on options.job_selection) and assign all that the salesman can complete.
             ii. Remove each assigned job from the working list and, if no more jobs in this cluster can be assigned, mark the cluster as exhausted.
-         c. If no assignable job is found outside exhausted clusters, the salesman is considered at capacity.
+         c. If no assignable job is found outside exhausted clusters and the salesman hasn't started yet,
+            their start is moved to the next entry time of a job they skipped. Otherwise the nearest clusters
+            are exhausted and the next nearest come into reach, or if there are none the salesman is at capacity.
          d. Remove all jobs assigned in this iteration from unassigned jobs.
-    5. After all salesmen are processed (or no more assignable jobs exist),
-       any remaining jobs are left as unassigned in the final roster.
+    5. After all salesmen are processed (or no more assignable jobs exist), with hints the remaining jobs
+       are inserted wherever they still fit into the routes, by regret as the regret engine does.
+       Any jobs left after that are unassigned in the final roster.
+
+    If the deadline expires, assignment stops there and the roster so far is returned, flagged in its message.
     """
+    options = options or SolverOptions()
     roster = RosterResponse()
     roster.add_salesmen(salesmen)
 
@@ -35,13 +61,29 @@ def assign_jobs(jobs: List[Job], salesmen: List[Salesman]) -> RosterResponse:
         roster.message = "No jobs to assign"
         return roster
     
-    n_clusters=min(len(jobs), 4)
+    n_clusters=min(len(jobs), options.n_clusters or 4)
     cluster_jobs(jobs, n_clusters)
-    unassigned_jobs = sorted(jobs, reverse=True)
-    unrostered_salesmen = salesmen.copy()
+    ordered_jobs = order_jobs(jobs, options)
+    # Keyed by id(job) in order: removal is constant time and doesn't compare jobs field by field
+    unassigned_jobs = {id(job): job for job in ordered_jobs}
+    clustered_jobs = group_by_cluster(unassigned_jobs)
+    unrostered_salesmen = order_salesmen(salesmen, jobs, options)
+    job_table = JobTable(ordered_jobs) if options.vectorized else None
+    use_spatial_index = options.job_selection in ("nearest", "urgency_within_radius") and job_table is None
+    cluster_indexes = index_clusters(ordered_jobs) if use_spatial_index else {}
+    cluster_plans = plan_clusters(ordered_jobs) if options.job_selection == "tour" else {}
+    del ordered_jobs
+    cluster_affinity = get_cluster_affinity(salesmen, get_cluster_centroids(jobs)) if options.nearest_clusters else {}
+    if hints:
+        start_times = [salesman.start_time for salesman in salesmen]
+        seed_routes(roster, salesmen, hints, unassigned_jobs, clustered_jobs, cluster_indexes, job_table)
 
     # Process one salesman at a time.
+    stopped_early = False
     while unassigned_jobs and unrostered_salesmen:
+        if is_expired(deadline):
+            stopped_early = True
+            break
         # Get the next salesman to work
         salesman = unrostered_salesmen.pop(0)
         exhausted_clusters = set()  # Clusters that this salesman cannot accept any more jobs from
@@ -49,57 +91,345 @@ def assign_jobs(jobs: List[Job], salesmen: List[Salesman]) -> RosterResponse:
 
         # Continue assigning jobs until salesman is at capacity or all clusters are exhaused or empty.
         while not salesman.is_at_max_capacity() and unassigned_jobs and len(exhausted_clusters) < n_clusters:
+            if is_expired(deadline):
+                stopped_early = True
+                break
             ############################################################################
             ## Step 1: Try assign first job of iteration from non-exhausted clusters. ##
             ############################################################################
-            first_job = None
-            for job in unassigned_jobs:
-                # Skip jobs from exhausted clusters or those that start before the salesman.
-                if job_starts_after_salesman(roster, salesman, job) or job.cluster in exhausted_clusters:
-                    continue
-                arrival_time = get_arrival_time_if_possible(salesman, job)
-                if arrival_time is not None:
-                    roster.assign_job_to_salesman(job, salesman, arrival_time)
-                    unassigned_jobs.remove(job)
-                    first_job = job
-                    break # Once a job is assigned, break out of the loop to start assigning from the cluster.
+            far_clusters = get_far_clusters(cluster_affinity.get(salesman.salesman_id), exhausted_clusters, options.nearest_clusters)
+            skipped_clusters = exhausted_clusters | far_clusters
+            first_job, arrival_time = find_first_job(roster, salesman, unassigned_jobs.values(), skipped_clusters, job_table)
             if first_job is None:
-                # Potentially couldnt find a job because salesman starts too early
-                salesman.wait(15)
+                if options.wait_mins is not None:
+                    # Potentially couldnt find a job because salesman starts too early
+                    salesman.wait(options.wait_mins)
+                    continue
+                # Jump straight to the next time a job opens up; waiting any less can't help
+                next_time = get_next_entry_time(roster, salesman, unassigned_jobs.values(), skipped_clusters, job_table)
+                if next_time is None and far_clusters:
+                    # Nothing more to do near home, so look further out
+                    exhausted_clusters.update(set(cluster_affinity[salesman.salesman_id]) - skipped_clusters)
+                    continue
+                if next_time is None:
+                    break
+                salesman.wait_until(next_time)
                 continue
+            roster.assign_job_to_salesman(first_job, salesman, arrival_time)
+            remove_assigned_job(first_job, unassigned_jobs, clustered_jobs, cluster_indexes, job_table)
 
             #############################################################
             ## Step 2: Try to assign subsequent jobs from same cluster ##
             #############################################################
 
             current_cluster = first_job.cluster
-            clustered_unassigned_jobs = [job for job in unassigned_jobs if job.cluster == current_cluster]
+            clustered_unassigned_jobs = clustered_jobs[current_cluster]
+            last_job = first_job
 
             # Iterate to assign as many jobs from this cluster as possible.
             while not salesman.is_at_max_capacity() and clustered_unassigned_jobs:
-                job_assigned_in_cluster = False
-                for job in clustered_unassigned_jobs.copy():
-                    arrival_time = get_arrival_time_if_possible(salesman, job)
-                    if arrival_time is not None:
-                        roster.assign_job_to_salesman(job, salesman, arrival_time)
-                        unassigned_jobs.remove(job)
-                        clustered_unassigned_jobs.remove(job)
-                        job_assigned_in_cluster = True
-                        break # Once a job is assigned, restart the loop over clustered_jobs in case now some are available given new start time
+                if is_expired(deadline):
+                    stopped_early = True
+                    break
+                # Restart the search after every assignment in case more jobs are now available given the new start time
+                if current_cluster in cluster_plans:
+                    job, arrival_time = cluster_plans[current_cluster].find_next_job(salesman, last_job, clustered_unassigned_jobs)
+                else:
+                    job, arrival_time = find_next_cluster_job(
+                        salesman, clustered_unassigned_jobs.values(), current_cluster, cluster_indexes.get(current_cluster), job_table, options
+                    )
                 # If no job in the current cluster could be assigned, mark this cluster exhausted until the next salesman
-                if not job_assigned_in_cluster:
+                if job is None:
                     exhausted_clusters.add(current_cluster)
                     break  # Exit the clustered_jobs loop and try to find a job from a different cluster.
+                roster.assign_job_to_salesman(job, salesman, arrival_time)
+                remove_assigned_job(job, unassigned_jobs, clustered_jobs, cluster_indexes, job_table)
+                last_job = job
 
             #################################################################
             ## Step 3: If the salesman is still not at capacity, try again ##
             #################################################################
 
+    if hints and unassigned_jobs and not stopped_early:
+        stopped_early = fill_gaps(roster, salesmen, start_times, unassigned_jobs, options, deadline)
+
     # Whatever jobs remain are unassigned.
-    roster.unassigned_jobs.extend(unassigned_jobs)
-    roster.message = _generate_roster_message(roster)
+    roster.unassigned_jobs.extend(unassigned_jobs.values())
+    roster.message = generate_roster_message(roster, stopped_early=stopped_early)
     return roster
 
+def group_by_cluster(jobs: Dict[int, Job]) -> Dict[int, Dict[int, Job]]:
+    """
+    Group jobs keyed by id(job) by cluster, keeping their order and sharing their keys.
+    """
+    clusters: Dict[int, Dict[int, Job]] = {}
+    for key, job in jobs.items():
+        clusters.setdefault(job.cluster, {})[key] = job
+    return clusters
+
+
+def seed_routes(
+    roster: RosterResponse,
+    salesmen: List[Salesman],
+    hints: Dict[str, str],
+    unassigned_jobs: Dict[int, Job],
+    clustered_jobs: Dict[int, Dict[int, Job]],
+    cluster_indexes: Dict[int, SpatialGrid[Job]],
+    job_table: JobTable | None,
+) -> None:
+    """
+    Assign each hinted job to the end of its salesman's route, in hint order, if the salesman can still complete it.
+    Hints for jobs or salesmen not in the request are ignored.
+    """
+    salesmen_by_id = {salesman.salesman_id: salesman for salesman in salesmen}
+    jobs_by_id = {job.job_id: job for job in unassigned_jobs.values()}
+    seeded = 0
+    for job_id, salesman_id in hints.items():
+        job, salesman = jobs_by_id.get(job_id), salesmen_by_id.get(salesman_id)
+        if job is None or salesman is None or id(job) not in unassigned_jobs or salesman.is_at_max_capacity():
+            continue
+        arrival_time = get_arrival_time_if_possible(salesman, job)
+        if arrival_time is None:
+            continue
+        roster.assign_job_to_salesman(job, salesman, arrival_time)
+        remove_assigned_job(job, unassigned_jobs, clustered_jobs, cluster_indexes, job_table)
+        seeded += 1
+    print(f"Warm start: seeded {seeded} of {len(hints)} hinted jobs")
+
+
+def fill_gaps(
+    roster: RosterResponse,
+    salesmen: List[Salesman],
+    start_times: List[datetime],
+    unassigned_jobs: Dict[int, Job],
+    options: SolverOptions,
+    deadline: Deadline | None = None,
+) -> bool:
+    """
+    Insert unassigned jobs wherever they still fit into the salesmen's routes, such as before or between
+    jobs seeded from a warm start. Jobs after an inserted one may start later, within their limits.
+    Args:
+        start_times: When each salesman could start before the roster moved their start to their first job.
+    Returns:
+        True if the deadline expired before every job that fits was inserted.
+    """
+    table = JobTable([job for salesman in salesmen for job in roster.jobs[salesman.salesman_id]] + list(unassigned_jobs.values()))
+    routes = InsertionRoutes(
+        table, salesmen, [[table.row_of(job) for job in roster.jobs[salesman.salesman_id]] for salesman in salesmen], start_times
+    )
+    stopped_early = False
+    while routes.insert_next(options.regret_k):
+        if is_expired(deadline):
+            stopped_early = True
+            break
+
+    filled = 0
+    for s, salesman in enumerate(salesmen):
+        route = [table.jobs[row] for row in routes.routes[s]]
+        if len(route) == len(roster.jobs[salesman.salesman_id]):
+            continue
+        for job, arrival in zip(route, routes.arrival[s]):
+            if unassigned_jobs.pop(id(job), None) is not None:
+                filled += 1
+            job.assign_salesman(salesman.salesman_id, table.to_datetime(arrival), salesman.salesman_name)
+        roster.jobs[salesman.salesman_id] = route
+    print(f"Warm start: filled {filled} jobs into gaps in the routes")
+    return stopped_early
+
+
+def remove_assigned_job(
+    job: Job,
+    unassigned_jobs: Dict[int, Job],
+    clustered_jobs: Dict[int, Dict[int, Job]],
+    cluster_indexes: Dict[int, SpatialGrid[Job]],
+    job_table: JobTable | None,
+) -> None:
+    """
+    Remove a job that has just been assigned from every structure the solver searches.
+    """
+    del unassigned_jobs[id(job)]
+    del clustered_jobs[job.cluster][id(job)]
+    remove_from_index(cluster_indexes, job)
+    if job_table is not None:
+        job_table.mark_assigned(job)
+
+
+def order_jobs(jobs: List[Job], options: SolverOptions) -> List[Job]:
+    """
+    Get the jobs in the order the solver should consider them.
+    """
+    if options.job_order == "entry_time":
+        return sorted(jobs, key=lambda job: job.entry_time)
+    if options.job_order == "exit_time":
+        return sorted(jobs, key=lambda job: job.exit_time)
+    if options.job_order == "random":
+        shuffled = jobs.copy()
+        random.Random(options.seed).shuffle(shuffled)
+        return shuffled
+    return order_by_urgency(jobs)
+
+
+def order_by_urgency(jobs: List[Job]) -> List[Job]:
+    """
+    Most urgent jobs first, ties in their given order.
+    Same as sorted(jobs, reverse=True), with one argsort over the urgencies instead of comparing jobs.
+    """
+    urgency = np.fromiter((job.urgency for job in jobs), dtype=np.float64, count=len(jobs))
+    return [jobs[row] for row in np.argsort(-urgency, kind="stable")]
+
+
+def order_salesmen(salesmen: List[Salesman], jobs: List[Job], options: SolverOptions) -> List[Salesman]:
+    """
+    Get the salesmen in the order they should be rostered.
+    """
+    if options.salesman_order == "availability":
+        return sorted(salesmen)
+    if options.salesman_order == "proximity":
+        centre = Location(
+            latitude=float(np.mean([job.location.latitude for job in jobs])),
+            longitude=float(np.mean([job.location.longitude for job in jobs])),
+        )
+        return sorted(salesmen, key=lambda salesman: salesman.location.travel_time_to(centre))
+    return salesmen.copy()
+
+
+def get_far_clusters(ranked_clusters: List[int] | None, exhausted_clusters: Set[int], nearest_clusters: int | None) -> Set[int]:
+    """
+    Get the clusters beyond the salesman's nearest_clusters unexhausted clusters to home.
+    Args:
+        ranked_clusters: Cluster ids nearest to the salesman's home first, or None to search every cluster.
+        exhausted_clusters: Clusters the salesman can't take any more jobs from.
+        nearest_clusters: Number of clusters to search.
+    """
+    if ranked_clusters is None:
+        return set()
+    open_clusters = [cluster for cluster in ranked_clusters if cluster not in exhausted_clusters]
+    return set(open_clusters[nearest_clusters:])
+
+
+def find_first_job(
+    roster: RosterResponse, salesman: Salesman, unassigned_jobs: Iterable[Job], exhausted_clusters: Set[int], job_table: JobTable | None
+) -> Tuple[Job | None, datetime | None]:
+    """
+    Find the most urgent job outside exhausted clusters that the salesman can complete.
+    Returns:
+        The job and its arrival time, or (None, None) if there is no such job.
+    """
+    if job_table is not None:
+        rows = np.flatnonzero(job_table.unassigned & ~np.isin(job_table.cluster, list(exhausted_clusters)))
+        if len(roster.jobs[salesman.salesman_id]) == 0:
+            rows = rows[job_table.entry[rows] <= job_table.to_seconds(salesman.current_time)]
+        arrival_times, feasible = get_arrival_times_if_possible(salesman, job_table, rows)
+        if not feasible.any():
+            return None, None
+        best = np.argmax(feasible)
+        return job_table.jobs[rows[best]], job_table.to_datetime(arrival_times[best])
+
+    # A working salesman needs at least MIN_TRAVEL to reach any job, so jobs that must start sooner are out of reach
+    earliest_start = salesman.current_time + MIN_TRAVEL if roster.jobs[salesman.salesman_id] else None
+    for job in unassigned_jobs:
+        # Skip jobs from exhausted clusters or those that start before the salesman.
+        if job_starts_after_salesman(roster, salesman, job) or job.cluster in exhausted_clusters:
+            continue
+        if earliest_start is not None and job.exit_time - timedelta(minutes=job.duration_mins) < earliest_start:
+            continue
+        arrival_time = get_arrival_time_if_possible(salesman, job)
+        if arrival_time is not None:
+            return job, arrival_time
+    return None, None
+
+
+def get_next_entry_time(
+    roster: RosterResponse, salesman: Salesman, unassigned_jobs: Iterable[Job], exhausted_clusters: Set[int], job_table: JobTable | None
+) -> datetime | None:
+    """
+    Get the next time waiting could give the salesman a job, if any.
+
+    Before their first job a salesman skips jobs that open after their current time, so the next
+    candidate appears at the earliest such entry time. Once working, arrival times already include
+    any wait for a job to open, so waiting longer can only make jobs later.
+    """
+    if len(roster.jobs[salesman.salesman_id]) > 0:
+        return None
+    if job_table is not None:
+        current = job_table.to_seconds(salesman.current_time)
+        candidates = job_table.unassigned & ~np.isin(job_table.cluster, list(exhausted_clusters)) & (job_table.entry > current)
+        if not candidates.any():
+            return None
+        return job_table.to_datetime(job_table.entry[candidates].min())
+    entry_times = [
+        job.entry_time for job in unassigned_jobs
+        if job.cluster not in exhausted_clusters and job_starts_after_salesman(roster, salesman, job)
+    ]
+    return min(entry_times, default=None)
+
+
+def find_next_cluster_job(
+    salesman: Salesman,
+    clustered_unassigned_jobs: Iterable[Job],
+    cluster: int,
+    index: SpatialGrid[Job] | None,
+    job_table: JobTable | None,
+    options: SolverOptions,
+) -> Tuple[Job | None, datetime | None]:
+    """
+    Find the next job from the current cluster that the salesman can complete, according to options.job_selection.
+    Returns:
+        The job and its arrival time, or (None, None) if there is no such job.
+    """
+    if job_table is not None:
+        rows = np.flatnonzero(job_table.unassigned & (job_table.cluster == cluster))
+        arrival_times, feasible = get_arrival_times_if_possible(salesman, job_table, rows)
+        if not feasible.any():
+            return None, None
+        if options.job_selection == "urgency":
+            best = np.argmax(feasible)
+        else:
+            distances = np.where(feasible, job_table.distances_km_from(salesman.current_location, rows), np.inf)
+            nearby = distances <= options.search_radius_km
+            if options.job_selection == "urgency_within_radius" and nearby.any():
+                best = np.argmax(nearby)
+            else:
+                best = np.argmin(distances)
+        return job_table.jobs[rows[best]], job_table.to_datetime(arrival_times[best])
+
+    for job in get_cluster_candidates(salesman, clustered_unassigned_jobs, index, options):
+        arrival_time = get_arrival_time_if_possible(salesman, job)
+        if arrival_time is not None:
+            return job, arrival_time
+    return None, None
+
+
+def get_cluster_candidates(
+    salesman: Salesman, clustered_unassigned_jobs: Iterable[Job], index: SpatialGrid[Job] | None, options: SolverOptions
+) -> Iterable[Job]:
+    """
+    Get the unassigned jobs of the current cluster in the order they should be tried.
+    Without a spatial index this is urgency order. The caller stops at the first job that fits
+    and only then removes it, so the jobs needn't be copied.
+    """
+    if index is None:
+        return clustered_unassigned_jobs
+    latitude, longitude = salesman.current_location.latitude, salesman.current_location.longitude
+    if options.job_selection == "nearest":
+        return index.nearest(latitude, longitude)
+    return _urgency_within_radius(index, latitude, longitude, options.search_radius_km)
+
+
+def _urgency_within_radius(index: SpatialGrid[Job], latitude: float, longitude: float, radius_km: float) -> Iterable[Job]:
+    nearby = index.within(latitude, longitude, radius_km)
+    yield from order_by_urgency(nearby)
+    nearby_ids = {id(job) for job in nearby}
+    for job in index.nearest(latitude, longitude):
+        if id(job) not in nearby_ids:
+            yield job
+
+
+def remove_from_index(cluster_indexes: Dict[int, SpatialGrid[Job]], job: Job) -> None:
+    if job.cluster in cluster_indexes:
+        cluster_indexes[job.cluster].remove(job)
+
+
 def job_starts_after_salesman(roster, salesman, job):
     """
     First job should be assigned to the salesman at the start of their workday.
@@ -126,10 +456,36 @@ def get_arrival_time_if_possible(salesman: Salesman, job: Job) -> datetime | Non
     return arrival_time
 
 
-def _generate_roster_message(roster: RosterResponse) -> str:
+def get_arrival_times_if_possible(salesman: Salesman, job_table: JobTable, rows: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Batched get_arrival_time_if_possible over the given rows of a job table.
+    Args:
+        salesman: Salesman to check.
+        job_table: Table holding the candidate jobs.
+        rows: Rows of the candidate jobs.
+    Returns:
+        Arrival times in seconds since job_table.origin, and a mask of the jobs the salesman can complete.
+    """
+    entry = job_table.entry[rows]
+    start = job_table.to_seconds(salesman.start_time)
+    if salesman.is_first_job():
+        arrival_times = np.maximum(start, entry)
+    else:
+        current = job_table.to_seconds(salesman.current_time)
+        arrival_times = np.maximum(current + job_table.travel_seconds_from(salesman.current_location, rows), entry)
+    completion_times = arrival_times + job_table.duration[rows]
+
+    finished_in_time = completion_times <= np.minimum(job_table.to_seconds(salesman.end_time), job_table.exit[rows])
+    within_max_hours = completion_times - start <= salesman.max_workday_mins * 60
+    return arrival_times, finished_in_time & within_max_hours
+
+
+def generate_roster_message(roster: RosterResponse, stopped_early: bool = False) -> str:
     """
     Generate a status message for the roster.
     """
+    if stopped_early:
+        return DEADLINE_MESSAGE
     if not any(roster.jobs.values()):
         return "No jobs to assign"
     elif roster.unassigned_jobs:
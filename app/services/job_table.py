@@ -0,0 +1,60 @@
+from datetime import datetime, timedelta
+from typing import List
+import numpy as np
+
+from app.models.job import Job
+from app.models.location import Location
+from app.services.location_helpers import LocationHelpers
+
+
+class JobTable:
+    """
+    Column arrays over a list of jobs, used to evaluate many candidate jobs at once.
+
+    Row i holds jobs[i]. Times are whole seconds since origin so that arithmetic on
+    them is exact.
+    """
+
+    def __init__(self, jobs: List[Job]):
+        self.jobs = list(jobs)
+        self.origin = min(job.entry_time for job in jobs)
+        self.latitude = np.array([job.location.latitude for job in jobs], dtype=np.float64)
+        self.longitude = np.array([job.location.longitude for job in jobs], dtype=np.float64)
+        self.address = np.array([job.location.address for job in jobs], dtype=object)
+        self.entry = np.array([self.to_seconds(job.entry_time) for job in jobs], dtype=np.int64)
+        self.exit = np.array([self.to_seconds(job.exit_time) for job in jobs], dtype=np.int64)
+        self.duration = np.array([job.duration_mins * 60 for job in jobs], dtype=np.int64)
+        self.cluster = np.array([-1 if job.cluster is None else job.cluster for job in jobs], dtype=np.int64)
+        self.unassigned = np.ones(len(jobs), dtype=bool)
+        self._rows = {id(job): row for row, job in enumerate(jobs)}
+
+    def __len__(self) -> int:
+        return len(self.jobs)
+
+    def row_of(self, job: Job) -> int:
+        return self._rows[id(job)]
+
+    def mark_assigned(self, job: Job) -> None:
+        self.unassigned[self.row_of(job)] = False
+
+    def to_seconds(self, time: datetime) -> int:
+        return int((time - self.origin).total_seconds())
+
+    def to_datetime(self, seconds: int) -> datetime:
+        return self.origin + timedelta(seconds=int(seconds))
+
+    def distances_km_from(self, location: Location, rows: np.ndarray) -> np.ndarray:
+        """Distance from a location to the jobs in rows, as the crow flies."""
+        return LocationHelpers.get_distances_between(
+            (location.latitude, location.longitude), self.latitude[rows], self.longitude[rows]
+        )
+
+    def travel_seconds_from(self, location: Location, rows: np.ndarray) -> np.ndarray:
+        """Batched Location.travel_time_to from a location to the jobs in rows."""
+        minutes = LocationHelpers.get_travel_times_minutes(
+            (location.latitude, location.longitude), self.latitude[rows], self.longitude[rows]
+        )
+        minutes = np.maximum(minutes, 5)
+        if location.address is not None:
+            minutes[self.address[rows] == location.address] = 5
+        return minutes * 60
@@ -1,15 +1,44 @@
 import os
-import requests
 import json
+import threading
+import time
+import numpy as np
 from dotenv import load_dotenv
 from math import radians, sin, cos, sqrt, atan2
 
+from app.services.address_keys import TrigramIndex, address_key
+from app.services.geocoding_client import GeocodingError, geocoding_client
+
 # Load environment variables
 load_dotenv()
 
+
+class _Flight:
+    """An API lookup in progress, shared by every caller asking for the same address."""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
 class LocationHelpers:
     cache_file_path = os.path.join(os.path.dirname(__file__), 'locationCache.json')
+    geocode_url = os.getenv('GEOCODE_API_URL', "https://maps.googleapis.com/maps/api/geocode/json")
     locationCache = {}
+    # Canonical address keys mapped to the raw address they are cached under
+    keyIndex = {}
+    # Set GEOCODE_FUZZY_THRESHOLD (e.g. 0.8) to also match near duplicate addresses
+    fuzzy_threshold = float(os.getenv('GEOCODE_FUZZY_THRESHOLD', 0)) or None
+    fuzzyIndex = None
+    # Canonical addresses the API couldn't geocode, mapped to when they may be retried
+    negativeCache = {}
+    negative_cache_ttl_secs = float(os.getenv('GEOCODE_NEGATIVE_TTL_SECS', 300))
+    # Set by app.services.travel_time_table when TRAVEL_TIME_TABLE_PATH is set
+    travelTimeTable = None
+    _flights = {}
+    _flights_lock = threading.Lock()
+    _cache_file_lock = threading.Lock()
 
     @staticmethod
     def load_coordinates(file_path=None):
@@ -32,7 +61,22 @@ class LocationHelpers:
         except Exception as e:
             print(f"Unexpected error while loading cache: {e}")
             LocationHelpers.locationCache = {}
+        LocationHelpers.index_cache()
 
+    @staticmethod
+    def index_cache():
+        """Rebuild the canonical and fuzzy key indexes over the cached addresses."""
+        LocationHelpers.keyIndex = {}
+        LocationHelpers.fuzzyIndex = TrigramIndex(LocationHelpers.fuzzy_threshold) if LocationHelpers.fuzzy_threshold else None
+        for address in LocationHelpers.locationCache:
+            LocationHelpers.index_address(address)
+
+    @staticmethod
+    def index_address(address: str):
+        key = address_key(address)
+        LocationHelpers.keyIndex.setdefault(key, address)
+        if LocationHelpers.fuzzyIndex is not None:
+            LocationHelpers.fuzzyIndex.add(key)
 
     @staticmethod
     def get_coordinates_from_address(address: str) -> dict:
@@ -42,21 +86,71 @@ class LocationHelpers:
         """
         result = LocationHelpers.get_coordinates_from_cache(address)
         if not LocationHelpers.is_valid_location(result):
-            result = LocationHelpers.get_coordinates_via_api(address)
+            key = address_key(address)
+            retry_at = LocationHelpers.negativeCache.get(key)
+            if retry_at is not None and time.monotonic() < retry_at:
+                raise ValueError(f"Invalid location data from API for {address} (cached)")
+
+            result = LocationHelpers.single_flight(key, lambda: LocationHelpers.get_coordinates_via_api(address))
             if LocationHelpers.is_valid_location(result):
-                LocationHelpers.add_result_to_cache(address, result)
+                LocationHelpers.negativeCache.pop(key, None)
+                if LocationHelpers.locationCache.get(address) != result:
+                    LocationHelpers.add_result_to_cache(address, result)
             else:
+                LocationHelpers.negativeCache[key] = time.monotonic() + LocationHelpers.negative_cache_ttl_secs
                 raise ValueError(f"Invalid location data from API for {address}")
         return result
+
+    @staticmethod
+    def single_flight(key: str, lookup):
+        """
+        Run lookup once for concurrent callers with the same key.
+        The first caller runs it, the others wait and share its result or exception.
+        """
+        with LocationHelpers._flights_lock:
+            flight = LocationHelpers._flights.get(key)
+            is_leader = flight is None
+            if is_leader:
+                flight = LocationHelpers._flights[key] = _Flight()
+
+        if not is_leader:
+            flight.done.wait()
+        else:
+            try:
+                flight.result = lookup()
+            except Exception as e:
+                flight.error = e
+            finally:
+                with LocationHelpers._flights_lock:
+                    del LocationHelpers._flights[key]
+                flight.done.set()
+
+        if flight.error is not None:
+            raise flight.error
+        return flight.result
     
     @staticmethod
     def add_result_to_cache(address: str, location: dict):
         """
         Add the result to the cache and save it to a JSON file.
         """
-        LocationHelpers.locationCache[address] = location
-        with open(LocationHelpers.cache_file_path, 'w') as file:
-            json.dump(LocationHelpers.locationCache, file)
+        LocationHelpers.add_results_to_cache({address: location})
+
+    @staticmethod
+    def add_results_to_cache(locations: dict):
+        """
+        Add many results to the cache and save it to the JSON file once.
+        """
+        with LocationHelpers._cache_file_lock:
+            for address, location in locations.items():
+                LocationHelpers.locationCache[address] = location
+                LocationHelpers.index_address(address)
+            with open(LocationHelpers.cache_file_path, 'w') as file:
+                json.dump(LocationHelpers.locationCache, file)
+        if LocationHelpers.travelTimeTable is not None:
+            LocationHelpers.travelTimeTable.add_sites(
+                (location['latitude'], location['longitude']) for location in locations.values()
+            )
 
     
     @staticmethod
@@ -77,37 +171,51 @@ class LocationHelpers:
     def get_coordinates_from_cache(rawAddress: str) -> dict:
         """
         Get coordinates from a JSON file cache.
+        Addresses are matched as given, then by their canonical key (see address_key),
+        then to a near duplicate if fuzzy matching is enabled.
         """
-        try:
-            result = LocationHelpers.locationCache[rawAddress]
-            print(f"Coordinates found in cache    : {rawAddress}")
-            return result
-        except KeyError:
+        result = LocationHelpers.lookup_cache(rawAddress)
+        if result is None:
             print(f"Coordinates not found in cache: {rawAddress}")
-            return None
+        else:
+            print(f"Coordinates found in cache    : {rawAddress}")
+        return result
         
 
+    @staticmethod
+    def lookup_cache(rawAddress: str) -> dict:
+        """get_coordinates_from_cache without logging."""
+        result = LocationHelpers.locationCache.get(rawAddress)
+        if result is None:
+            key = address_key(rawAddress)
+            if key not in LocationHelpers.keyIndex and LocationHelpers.fuzzyIndex is not None:
+                key = LocationHelpers.fuzzyIndex.closest(key)
+            cachedAddress = LocationHelpers.keyIndex.get(key)
+            result = LocationHelpers.locationCache.get(cachedAddress) if cachedAddress is not None else None
+        return result
+
     @staticmethod
     def get_coordinates_via_api(address: str) -> dict:
         """
         Get latitude, longitude (rounded to 4 decimals), and formatted address 
         from a partial address using Google Maps API.
-        Returns a dictionary with keys: 'latitude', 'longitude', 'address'.
+        Returns a dictionary with keys: 'latitude', 'longitude', 'address',
+        or an empty dictionary if Google found no such address (ZERO_RESULTS).
+        Raises GeocodingError for the other error statuses, such as OVER_QUERY_LIMIT,
+        which say nothing about the address and so mustn't be cached.
         """
         address = LocationHelpers.normalise_address(address)
         api_key = os.getenv('GOOGLE_MAPS_API_KEY')
         if not api_key:
             raise ValueError("GOOGLE_MAPS_API_KEY is not set in the environment variables.")
         
-        url = "https://maps.googleapis.com/maps/api/geocode/json"
+        url = LocationHelpers.geocode_url
         params = {
             'address': address,
             'key': api_key
         }
         try:
-            response = requests.get(url, params=params)
-            response.raise_for_status()
-            data = response.json()
+            data = geocoding_client.get_json(url, params)
 
             if data.get('results'):
                 result = data['results'][0]
@@ -117,8 +225,10 @@ class LocationHelpers:
                     'longitude': round(location['lng'], 4),
                     'address': result.get('formatted_address', '')
                 }
-            else:
+            elif data.get('status') == 'ZERO_RESULTS':
                 return {}
+            else:
+                raise GeocodingError(data.get('status', 'UNKNOWN_ERROR'), data.get('error_message', ''))
             
         except Exception as e:
             print(f"Error getting coordinates from API for {address}: {e}")
@@ -165,6 +275,53 @@ class LocationHelpers:
         distance_km = R * c
         return distance_km
 
+    @staticmethod
+    def get_travel_times_minutes(coord: tuple[float, float], latitudes: np.ndarray, longitudes: np.ndarray, average_speed_kmh: int = 5) -> np.ndarray:
+        """
+        Batched get_travel_time_minutes from one location to many.
+        Returns:
+            Array of estimated travel times in whole minutes.
+        """
+        distance_km = LocationHelpers.get_distances_between(coord, latitudes, longitudes)
+        return LocationHelpers.get_travel_times_for_distances(distance_km, average_speed_kmh)
+
+    @staticmethod
+    def get_travel_times_for_distances(distance_km: np.ndarray, average_speed_kmh: int = 5) -> np.ndarray:
+        """
+        Travel times in whole minutes for distances as the crow flies, as in get_travel_time_minutes.
+        """
+        return np.round(distance_km / average_speed_kmh * 60).astype(np.int64)
+
+    @staticmethod
+    def get_distances_between(coord: tuple[float, float], latitudes: np.ndarray, longitudes: np.ndarray) -> np.ndarray:
+        """
+        Batched get_distance_between from one location to many, using the Haversine formula.
+        """
+        R = 6371.0 # Radius of the Earth in kilometers
+        lat1, lon1 = radians(coord[0]), radians(coord[1])
+        lat2, lon2 = np.radians(latitudes), np.radians(longitudes)
+
+        dlat = lat2 - lat1
+        dlon = lon2 - lon1
+        a = np.sin(dlat / 2)**2 + cos(lat1) * np.cos(lat2) * np.sin(dlon / 2)**2
+        c = 2 * np.arctan2(np.sqrt(a), np.sqrt(1 - a))
+        return R * c
+
+    @staticmethod
+    def get_distance_matrix(latitudes: np.ndarray, longitudes: np.ndarray) -> np.ndarray:
+        """
+        Distances between every pair of locations, using the Haversine formula.
+        Row i holds the distances from location i, as get_distances_between would give them.
+        """
+        R = 6371.0 # Radius of the Earth in kilometers
+        lat, lon = np.radians(latitudes), np.radians(longitudes)
+
+        dlat = lat[None, :] - lat[:, None]
+        dlon = lon[None, :] - lon[:, None]
+        a = np.sin(dlat / 2)**2 + np.cos(lat)[:, None] * np.cos(lat)[None, :] * np.sin(dlon / 2)**2
+        c = 2 * np.arctan2(np.sqrt(a), np.sqrt(1 - a))
+        return R * c
+
 
 # Load coordinates when the class is imported
 LocationHelpers.load_coordinates()
\ No newline at end of file
@@ -0,0 +1,129 @@
+import os
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, TimeoutError, as_completed
+from itertools import product
+from typing import Dict, List, Tuple
+from dotenv import load_dotenv
+
+from app.models.job import Job
+from app.models.roster_response import RosterResponse
+from app.models.salesman import Salesman
+from app.models.solver_options import SolverOptions
+from app.services.deadline import DEADLINE_MESSAGE, Deadline, cap_deadline, is_expired
+from app.services.engines import run_engine
+from app.services.roster_metrics import roster_objective
+from app.services.solver_pool import get_solver_context
+
+load_dotenv()
+
+# Variants run in parallel by default. The pool starts processes as variants are submitted,
+# so a solve uses at most min(multi_start, CPU count) of them.
+MULTI_START_PROCESSES = int(os.getenv("MULTI_START_PROCESSES", os.cpu_count() or 1))
+
+JOB_ORDERS = ["urgency", "entry_time", "exit_time"]
+SALESMAN_ORDERS = ["input", "availability", "proximity"]
+CLUSTER_COUNTS = [2, 3, 6, 8]
+
+_executors: Dict[int, Executor] = {}
+
+
+def get_variants(options: SolverOptions) -> List[SolverOptions]:
+    """
+    Get options.multi_start variants of the solve to try, starting with options itself.
+
+    Variants cover the other job and salesman orderings, then other cluster counts,
+    then random job orders with consecutive seeds from options.seed.
+    """
+    base = options.model_copy(update={"multi_start": 1})
+    variants = [base]
+    updates = [{"job_order": j, "salesman_order": s} for j, s in product(JOB_ORDERS, SALESMAN_ORDERS)]
+    updates += [{"n_clusters": n} for n in CLUSTER_COUNTS]
+    for update in updates:
+        variant = base.model_copy(update=update)
+        if variant not in variants:
+            variants.append(variant)
+    seed = options.seed
+    while len(variants) < options.multi_start:
+        variants.append(base.model_copy(update={"job_order": "random", "seed": seed}))
+        seed += 1
+    return variants[:options.multi_start]
+
+
+def assign_jobs_multi_start(
+    jobs: List[Job],
+    salesmen: List[Salesman],
+    options: SolverOptions,
+    processes: int = MULTI_START_PROCESSES,
+    deadline: Deadline | None = None,
+) -> RosterResponse:
+    """
+    Run several variants of the selected engine and return the best roster found within options.time_budget_secs.
+
+    The variants run on a pool of worker processes, or one after another in this process if
+    processes is 0. At least the first variant always completes. The others stop when the budget
+    runs out and are dropped if they didn't finish. The returned roster's options record the
+    variant (and seed) that produced it, so the solve can be reproduced.
+    If the solve deadline expires, no more variants are started and running ones stop early.
+    """
+    budget_secs = min(options.time_budget_secs, (deadline and deadline.remaining_secs()) or float("inf"))
+    budget_ends = time.monotonic() + budget_secs
+    # Variants after the first stop at the end of the budget, so they don't hold workers nobody waits for
+    variant_deadline = cap_deadline(deadline, budget_secs)
+    variants = get_variants(options)
+    if processes > 0:
+        results = _run_on_pool(jobs, salesmen, variants, budget_ends, processes, deadline, variant_deadline)
+    else:
+        results = []
+        for variant in variants:
+            if results and (time.monotonic() >= budget_ends or is_expired(deadline)):
+                break
+            results.append(run_variant(jobs, salesmen, variant, variant_deadline if results else deadline))
+    results = results[:1] + [result for result in results[1:] if result[0].message != DEADLINE_MESSAGE]
+
+    roster, variant = max(results, key=lambda result: roster_objective(result[0]))
+    roster.options = variant
+    print(f"Multi-start: {len(results)}/{len(variants)} variants finished, best {variant}")
+    return roster
+
+
+def run_variant(
+    jobs: List[Job], salesmen: List[Salesman], options: SolverOptions, deadline: Deadline | None = None
+) -> Tuple[RosterResponse, SolverOptions]:
+    """Run the engine on copies of the inputs, as engines update jobs and salesmen in place."""
+    jobs = [job.model_copy(deep=True) for job in jobs]
+    salesmen = [salesman.model_copy(deep=True) for salesman in salesmen]
+    return run_engine(jobs, salesmen, options, deadline), options
+
+
+def _run_on_pool(
+    jobs: List[Job],
+    salesmen: List[Salesman],
+    variants: List[SolverOptions],
+    budget_ends: float,
+    processes: int,
+    deadline: Deadline | None = None,
+    variant_deadline: Deadline | None = None,
+) -> List[Tuple[RosterResponse, SolverOptions]]:
+    """Run the variants on the pool, returning the first variant's result first."""
+    executor = _get_executor(processes)
+    futures = [
+        executor.submit(run_variant, jobs, salesmen, variant, deadline if i == 0 else variant_deadline)
+        for i, variant in enumerate(variants)
+    ]
+    finished = set()
+    try:
+        for future in as_completed(futures, timeout=max(budget_ends - time.monotonic(), 0)):
+            finished.add(future)
+    except TimeoutError:
+        pass
+    # Drop variants that haven't started yet; running ones see their deadline expire and stop
+    for future in futures[1:]:
+        future.cancel()
+    # Out of time before the first variant finished, wait for it
+    return [futures[0].result()] + [future.result() for future in futures[1:] if future in finished]
+
+
+def _get_executor(processes: int) -> Executor:
+    if processes not in _executors:
+        _executors[processes] = ProcessPoolExecutor(max_workers=processes, mp_context=get_solver_context())
+    return _executors[processes]
@@ -0,0 +1,51 @@
+from typing import List
+
+from app.models.job import Job
+from app.models.roster_response import RosterResponse
+from app.models.salesman import Salesman
+from app.models.solver_options import SolverOptions
+from app.services.deadline import Deadline, is_expired
+from app.services.job_assignment import generate_roster_message, order_jobs
+from app.services.insertion_routes import InsertionRoutes
+from app.services.job_table import JobTable
+
+
+def assign_jobs_regret(
+    jobs: List[Job], salesmen: List[Salesman], options: SolverOptions | None = None, deadline: Deadline | None = None
+) -> RosterResponse:
+    """
+    Assign jobs by regret-k insertion.
+
+    Every unassigned job has an insertion cost into every salesman's route: the least extra travel
+    over the positions it can be inserted at without breaking a time window, the salesman's end time
+    or max_workday_mins. At each step the job with the highest regret is inserted at its cheapest
+    position, where regret is how much more the job's next k-1 cheapest routes cost than its cheapest
+    (options.regret_k, default 2). Jobs with few routes left are placed before they lose them.
+    Ties go to the cheaper insertion, then the more urgent job.
+
+    Only the changed route's insertion costs are recomputed after each step. Routes follow the same
+    rules as the greedy, with travel to the first job unpaid.
+    If the deadline expires, the roster so far is returned, flagged in its message.
+    """
+    options = options or SolverOptions()
+    roster = RosterResponse()
+    roster.add_salesmen(salesmen)
+
+    if not jobs:
+        roster.message = "No jobs to assign"
+        return roster
+
+    routes = InsertionRoutes(JobTable(order_jobs(jobs, options)), salesmen)
+    stopped_early = False
+    while routes.insert_next(options.regret_k):
+        if is_expired(deadline):
+            stopped_early = True
+            break
+
+    table = routes.table
+    for s, salesman in enumerate(salesmen):
+        for row, arrival in zip(routes.routes[s], routes.arrival[s]):
+            roster.assign_job_to_salesman(table.jobs[row], salesman, table.to_datetime(arrival))
+    roster.unassigned_jobs.extend(job for job, unassigned in zip(table.jobs, table.unassigned) if unassigned)
+    roster.message = generate_roster_message(roster, stopped_early=stopped_early and bool(roster.unassigned_jobs))
+    return roster
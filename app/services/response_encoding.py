@@ -0,0 +1,38 @@
+import msgpack
+from fastapi import Response
+
+from app.models.compact_roster_response import CompactRosterResponse
+from app.models.roster_response import RosterResponse
+
+JSON_MEDIA_TYPE = "application/json"
+MSGPACK_MEDIA_TYPE = "application/msgpack"
+
+
+def wants_msgpack(accept: str | None) -> bool:
+    """True if the client's Accept header asks for msgpack."""
+    if not accept:
+        return False
+    media_types = [part.split(";")[0].strip().lower() for part in accept.split(",")]
+    return MSGPACK_MEDIA_TYPE in media_types or "application/x-msgpack" in media_types
+
+
+def encode_roster(roster: RosterResponse) -> Response:
+    """
+    Serialize a full roster to JSON bytes in one pass with pydantic-core,
+    instead of returning a dict for FastAPI to walk with jsonable_encoder and serialize again.
+    """
+    return Response(content=roster.model_dump_json(), media_type=JSON_MEDIA_TYPE)
+
+
+def encode_compact_roster(roster: RosterResponse, accept: str | None = None) -> Response:
+    """
+    Serialize a roster as a CompactRosterResponse.
+
+    Uses msgpack if the client accepts it, JSON otherwise. JSON is serialized to bytes in one pass
+    by pydantic-core; msgpack packs the model's JSON-mode dump. Neither goes through FastAPI's JSON encoder.
+    """
+    compact = CompactRosterResponse.from_roster(roster)
+    if wants_msgpack(accept):
+        content = msgpack.packb(compact.model_dump(mode="json"))
+        return Response(content=content, media_type=MSGPACK_MEDIA_TYPE)
+    return Response(content=compact.model_dump_json(), media_type=JSON_MEDIA_TYPE)
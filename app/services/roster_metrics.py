@@ -0,0 +1,29 @@
+from typing import List, Tuple
+
+from app.models.job import Job
+from app.models.roster_response import RosterResponse
+
+
+def get_route_travel_minutes(route: List[Job]) -> float:
+    """
+    Travel time along a salesman's route. Travel to the first job isn't paid, so it isn't counted.
+    """
+    return sum(
+        previous.location.travel_time_to(job.location).total_seconds() / 60
+        for previous, job in zip(route, route[1:])
+    )
+
+
+def roster_objective(roster: RosterResponse) -> Tuple[int, int, float]:
+    """
+    Score a roster for comparison with other rosters of the same request, higher is better.
+
+    Returns:
+        Tuple of the number of assigned jobs, minutes of assigned work and negated travel minutes,
+        so rosters are compared on jobs first and travel last.
+    """
+    routes = list(roster.jobs.values())
+    assigned_jobs = sum(len(route) for route in routes)
+    assigned_minutes = sum(job.duration_mins for route in routes for job in route)
+    travel_minutes = sum(get_route_travel_minutes(route) for route in routes)
+    return assigned_jobs, assigned_minutes, -travel_minutes
@@ -0,0 +1,105 @@
+from bisect import bisect_right
+from datetime import timedelta
+from itertools import accumulate
+from typing import List
+import numpy as np
+
+from app.models.job import Job
+from app.models.roster_quality import RosterBounds, RosterQuality, SalesmanQuality
+from app.models.roster_response import RosterResponse
+from app.models.salesman import Salesman
+from app.services.job_table import JobTable
+from app.services.roster_metrics import get_route_travel_minutes
+
+
+def get_capacity_bounds(jobs: List[Job], salesmen: List[Salesman]) -> RosterBounds:
+    """
+    Bound the work any roster can assign from total demand against the salesmen's capacity.
+    Call before solving, as engines move salesmen's start times.
+    """
+    capacity_mins = sum(
+        max(0, min(salesman.max_workday_mins, (salesman.end_time - salesman.start_time).total_seconds() / 60))
+        for salesman in salesmen
+    )
+    durations = sorted(job.duration_mins for job in jobs if _fits_some_salesman(job, salesmen))
+    return RosterBounds(
+        max_jobs=bisect_right(list(accumulate(durations)), capacity_mins),
+        max_work_mins=int(min(sum(durations), capacity_mins)),
+    )
+
+
+def get_min_travel_mins(jobs: List[Job], n_routes: int) -> float:
+    """
+    Least travel needed to visit the jobs with n_routes routes.
+    The routes form a spanning forest of n_routes trees over the jobs, so they travel at least as far as
+    a minimum spanning tree with its n_routes - 1 longest edges removed.
+    """
+    if len(jobs) <= n_routes:
+        return 0.0
+    table = JobTable(jobs)
+    rows = np.arange(len(table))
+    in_tree = np.zeros(len(table), dtype=bool)
+    cost = np.full(len(table), np.inf)
+    cost[0] = 0.0
+    edges = []
+    for _ in range(len(table)):
+        row = int(np.argmin(np.where(in_tree, np.inf, cost)))
+        in_tree[row] = True
+        edges.append(cost[row])
+        cost = np.minimum(cost, table.travel_seconds_from(table.jobs[row].location, rows))
+    edges = sorted(edges[1:])
+    return float(sum(edges[: len(edges) - (n_routes - 1)])) / 60
+
+
+def get_roster_quality(roster: RosterResponse, bounds: RosterBounds, salesmen: List[Salesman]) -> RosterQuality:
+    """
+    Report utilization, travel and idle time of a roster, and how far it may be from optimal.
+
+    Args:
+        roster: Roster to report on
+        bounds: Capacity bounds from get_capacity_bounds for the same request
+        salesmen: Salesmen of the request
+    """
+    max_workday_mins = {salesman.salesman_id: salesman.max_workday_mins for salesman in salesmen}
+    report = [
+        _get_salesman_quality(salesman_id, route, max_workday_mins.get(salesman_id))
+        for salesman_id, route in roster.jobs.items()
+    ]
+    assigned = [job for route in roster.jobs.values() for job in route]
+    n_routes = sum(1 for route in roster.jobs.values() if route)
+    work_mins = sum(salesman.work_mins for salesman in report)
+    bounds = bounds.model_copy(update={"min_travel_mins": get_min_travel_mins(assigned, n_routes)})
+    return RosterQuality(
+        salesmen=report,
+        assigned_jobs=len(assigned),
+        work_mins=work_mins,
+        travel_mins=sum(salesman.travel_mins for salesman in report),
+        idle_mins=sum(salesman.idle_mins for salesman in report),
+        bounds=bounds,
+        gap=max(0.0, 1 - work_mins / bounds.max_work_mins) if bounds.max_work_mins else 0.0,
+    )
+
+
+def _get_salesman_quality(salesman_id: str, route: List[Job], max_workday_mins: int | None) -> SalesmanQuality:
+    if not route:
+        return SalesmanQuality(salesman_id=salesman_id)
+    work_mins = sum(job.duration_mins for job in route)
+    travel_mins = get_route_travel_minutes(route)
+    span_mins = (route[-1].start_time + timedelta(minutes=route[-1].duration_mins) - route[0].start_time).total_seconds() / 60
+    return SalesmanQuality(
+        salesman_id=salesman_id,
+        utilization=work_mins / max_workday_mins if max_workday_mins else 0.0,
+        work_mins=work_mins,
+        travel_mins=travel_mins,
+        idle_mins=max(0.0, span_mins - work_mins - travel_mins),
+    )
+
+
+def _fits_some_salesman(job: Job, salesmen: List[Salesman]) -> bool:
+    """True if the job's time window overlaps some salesman's hours for long enough to do it."""
+    duration = timedelta(minutes=job.duration_mins)
+    return any(
+        max(job.entry_time, salesman.start_time) + duration <= min(job.exit_time, salesman.end_time)
+        and job.duration_mins <= salesman.max_workday_mins
+        for salesman in salesmen
+    )
@@ -0,0 +1,225 @@
+import heapq
+from itertools import islice
+from math import sqrt
+from typing import Iterator, List, Tuple
+import numpy as np
+
+from app.models.job import Job
+from app.models.roster_response import RosterResponse
+from app.models.salesman import Salesman
+from app.models.solver_options import SolverOptions
+from app.services.cluster_plan import MIN_TRAVEL
+from app.services.deadline import Deadline, is_expired
+from app.services.job_assignment import generate_roster_message, get_arrival_times_if_possible, order_jobs, order_salesmen
+from app.services.job_table import JobTable
+from app.services.spatial_index import KM_PER_DEGREE_LATITUDE, KM_PER_DEGREE_LONGITUDE_AT_EQUATOR, SpatialGrid
+
+# Jobs checked at once when looking for a salesman's next job; later batches double in size
+FIRST_BATCH_SIZE = 128
+# Average jobs per cell of the grid used for nearest job selection, and its smallest cell
+JOBS_PER_CELL = 4
+MIN_CELL_SIZE_KM = 0.01
+# Nearest jobs are checked in batches of these sizes, then all open jobs at once
+NEAREST_BATCH_SIZES = (32, 64, 128)
+
+
+def assign_jobs_round_robin(
+    jobs: List[Job], salesmen: List[Salesman], options: SolverOptions | None = None, deadline: Deadline | None = None
+) -> RosterResponse:
+    """
+    Assign jobs by advancing all salesmen together in simulated time.
+
+    Salesmen sit in a priority queue keyed on their earliest availability. At each event:
+    1. Pop the next available salesman.
+    2. Pick the best job they can complete: the one they can start soonest (ties go to the
+       more urgent job), or the nearest one if options.job_selection is not urgency.
+    3. Assign it and push the salesman back with their new availability.
+    A salesman leaves the queue once they are at capacity or can't complete any remaining job,
+    as waiting can only make every job later.
+
+    Candidates are only the open jobs (see _OpenJobs), checked in batches until no later job can
+    beat the best one found, rather than every unassigned job at every event.
+    If the deadline expires, the roster so far is returned, flagged in its message.
+    """
+    options = options or SolverOptions()
+    roster = RosterResponse()
+    roster.add_salesmen(salesmen)
+
+    if not jobs:
+        roster.message = "No jobs to assign"
+        return roster
+
+    job_table = JobTable(order_jobs(jobs, options))
+    open_jobs = _OpenJobs(job_table, by_distance=options.job_selection != "urgency")
+    queue = [
+        (salesman.earliest_availability(), position, salesman)
+        for position, salesman in enumerate(order_salesmen(salesmen, jobs, options))
+    ]
+    heapq.heapify(queue)
+
+    stopped_early = False
+    while queue and open_jobs:
+        if is_expired(deadline):
+            stopped_early = True
+            break
+        available_at, position, salesman = heapq.heappop(queue)
+        if salesman.is_at_max_capacity():
+            continue
+
+        open_jobs.advance_to(job_table.to_seconds(available_at))
+        if options.job_selection == "urgency":
+            row, arrival_time = open_jobs.soonest_start(salesman)
+        else:
+            row, arrival_time = open_jobs.nearest(salesman)
+        if row is None:
+            continue
+
+        job = job_table.jobs[row]
+        roster.assign_job_to_salesman(job, salesman, job_table.to_datetime(arrival_time))
+        job_table.mark_assigned(job)
+        open_jobs.remove(row)
+        heapq.heappush(queue, (salesman.earliest_availability(), position, salesman))
+
+    roster.unassigned_jobs.extend(job for job, unassigned in zip(job_table.jobs, job_table.unassigned) if unassigned)
+    roster.message = generate_roster_message(roster, stopped_early=stopped_early)
+    return roster
+
+
+class _OpenJobs:
+    """
+    Unassigned jobs that some salesman can still complete, for round-robin events.
+
+    Events come in order of salesman availability, and no salesman can start a job before they
+    are available, so a job whose latest start has passed is closed for good, and a job that has
+    opened stays open. The soonest start is searched among the opened jobs in urgency order, stopping
+    at the first one the salesman can start as soon as they possibly could, then among the jobs still
+    to open in order of entry time, stopping at the first one opening after the best start found
+    (it can't start sooner, nor tie with it).
+    For the nearest job, open jobs are kept in a spatial grid and checked nearest first.
+    """
+
+    def __init__(self, job_table: JobTable, by_distance: bool = False):
+        self.table = job_table
+        self.open = job_table.unassigned.copy()
+        self.opened = np.zeros(len(job_table), dtype=bool)
+        self._count = int(self.open.sum())
+        self._latest_start = job_table.exit - job_table.duration
+        self._by_latest_start = np.argsort(self._latest_start, kind="stable")
+        self._closed_count = 0
+        self._by_entry = np.argsort(job_table.entry, kind="stable")
+        self._opened_count = 0
+        # Rows are in urgency order, as the table is
+        self._by_urgency = np.flatnonzero(self.open)
+        self._grid = _make_grid(job_table) if by_distance else None
+
+    def __len__(self) -> int:
+        return self._count
+
+    def remove(self, row: int) -> None:
+        if self.open[row]:
+            self.open[row] = False
+            self._count -= 1
+            if self._grid is not None:
+                self._grid.remove(self.table.jobs[row])
+
+    def advance_to(self, time_secs: int) -> None:
+        """Close the jobs that can't start by time_secs and mark the ones open by then as opened."""
+        by_latest_start, by_entry = self._by_latest_start, self._by_entry
+        while self._closed_count < len(by_latest_start) and self._latest_start[by_latest_start[self._closed_count]] < time_secs:
+            self.remove(int(by_latest_start[self._closed_count]))
+            self._closed_count += 1
+        opened_count = int(np.searchsorted(self.table.entry[by_entry], time_secs, side="right"))
+        self.opened[by_entry[self._opened_count:opened_count]] = True
+        self._opened_count = opened_count
+
+    def soonest_start(self, salesman: Salesman) -> Tuple[int | None, int | None]:
+        """
+        The open job the salesman can start soonest, ties going to the more urgent job.
+        Returns:
+            Its row and arrival time in seconds, or (None, None) if the salesman can't complete any open job.
+        """
+        if salesman.is_first_job():
+            earliest_start = self.table.to_seconds(salesman.start_time)
+        else:
+            earliest_start = self.table.to_seconds(salesman.current_time) + int(MIN_TRAVEL.total_seconds())
+
+        best: Tuple[int, int] | None = None
+        for rows in _batches(self._open_rows()):
+            best = self._soonest_of(salesman, rows[self.opened[rows]], best)
+            if best is not None and best[0] == earliest_start:
+                break
+
+        entry = self.table.entry
+        for rows in _batches(self._by_entry[self._opened_count:]):
+            if best is not None and entry[rows[0]] > best[0]:
+                break
+            best = self._soonest_of(salesman, rows[self.open[rows]], best)
+        if best is None:
+            return None, None
+        return best[1], best[0]
+
+    def nearest(self, salesman: Salesman) -> Tuple[int | None, int | None]:
+        """
+        The open job nearest to the salesman that they can complete.
+        Returns:
+            Its row and arrival time in seconds, or (None, None) if the salesman can't complete any open job.
+        """
+        location = salesman.current_location
+        nearest_first = self._grid.nearest(location.latitude, location.longitude)
+        for size in NEAREST_BATCH_SIZES:
+            batch = [self.table.row_of(job) for job in islice(nearest_first, size)]
+            row, arrival_time = self._first_feasible(salesman, batch)
+            if row is not None or len(batch) < size:
+                return row, arrival_time
+
+        # Few of the nearest jobs fit the salesman's day, so check the rest at once rather than one by one
+        rows = self._open_rows()
+        arrival_times, feasible = get_arrival_times_if_possible(salesman, self.table, rows)
+        if not feasible.any():
+            return None, None
+        nearest = np.argmin(np.where(feasible, self.table.distances_km_from(location, rows), np.inf))
+        return int(rows[nearest]), int(arrival_times[nearest])
+
+    def _open_rows(self) -> np.ndarray:
+        """Open rows in urgency order, dropping the others from the kept order once they make up most of it."""
+        if 2 * self._count < len(self._by_urgency):
+            self._by_urgency = self._by_urgency[self.open[self._by_urgency]]
+        return self._by_urgency[self.open[self._by_urgency]]
+
+    def _soonest_of(self, salesman: Salesman, rows: np.ndarray, best: Tuple[int, int] | None) -> Tuple[int, int] | None:
+        """The (arrival time, row) of the job of rows the salesman can start soonest, if sooner than best."""
+        arrival_times, feasible = get_arrival_times_if_possible(salesman, self.table, rows)
+        if not feasible.any():
+            return best
+        arrival_times, rows = arrival_times[feasible], rows[feasible]
+        soonest = arrival_times.min()
+        candidate = (int(soonest), int(rows[arrival_times == soonest].min()))
+        return candidate if best is None else min(best, candidate)
+
+    def _first_feasible(self, salesman: Salesman, rows: List[int]) -> Tuple[int | None, int | None]:
+        if not rows:
+            return None, None
+        rows = np.array(rows)
+        arrival_times, feasible = get_arrival_times_if_possible(salesman, self.table, rows)
+        if not feasible.any():
+            return None, None
+        first = int(np.argmax(feasible))
+        return int(rows[first]), int(arrival_times[first])
+
+
+def _batches(rows: np.ndarray) -> Iterator[np.ndarray]:
+    """Split rows into batches doubling in size, so a search that ends early checks few rows."""
+    start, size = 0, FIRST_BATCH_SIZE
+    while start < len(rows):
+        yield rows[start:start + size]
+        start, size = start + size, size * 2
+
+
+def _make_grid(job_table: JobTable) -> SpatialGrid[Job]:
+    """Spatial grid over the table's jobs, with cells holding a few jobs each on average."""
+    height_km = np.ptp(job_table.latitude) * KM_PER_DEGREE_LATITUDE
+    width_km = np.ptp(job_table.longitude) * KM_PER_DEGREE_LONGITUDE_AT_EQUATOR * np.cos(np.radians(job_table.latitude.mean()))
+    cell_size_km = max(sqrt(height_km * width_km * JOBS_PER_CELL / len(job_table)), MIN_CELL_SIZE_KM)
+    return SpatialGrid.from_points(
+        ((job, job.location.latitude, job.location.longitude) for job in job_table.jobs), cell_size_km
+    )
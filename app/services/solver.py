@@ -0,0 +1,49 @@
+from typing import Dict, List
+
+from app.models.job import Job
+from app.models.roster_response import RosterResponse
+from app.models.salesman import Salesman
+from app.models.solver_options import SolverOptions
+from app.services.deadline import DEFAULT_DEADLINE_SECS, Deadline
+from app.services.engines import run_engine
+from app.services.job_assignment import assign_jobs
+from app.services.multi_start import assign_jobs_multi_start
+from app.services.roster_quality import get_capacity_bounds, get_roster_quality
+
+
+def solve(
+    jobs: List[Job],
+    salesmen: List[Salesman],
+    options: SolverOptions | None = None,
+    deadline: Deadline | None = None,
+    hints: Dict[str, str] | None = None,
+) -> RosterResponse:
+    """
+    Build a roster using the solve mode selected by options.
+    Without a deadline, one is set from options.deadline_secs or SOLVE_DEADLINE_SECS if either is set.
+    With hints (job_id -> salesman_id, from a warm start), the greedy engine fills in around the hinted
+    jobs, whatever options.engine and options.multi_start say.
+    """
+    options = options or SolverOptions()
+    if deadline is None:
+        deadline = get_deadline(options)
+    bounds = get_capacity_bounds(jobs, salesmen) if options.quality_report else None
+    if hints:
+        roster = assign_jobs(jobs, salesmen, options, deadline, hints=hints)
+        roster.options = options.model_copy(update={"engine": "greedy", "multi_start": 1})
+    elif options.multi_start > 1:
+        roster = assign_jobs_multi_start(jobs, salesmen, options, deadline=deadline)
+    else:
+        roster = run_engine(jobs, salesmen, options, deadline)
+        roster.options = options
+    if bounds is not None:
+        roster.quality = get_roster_quality(roster, bounds, salesmen)
+    return roster
+
+
+def get_deadline(options: SolverOptions, cancel_event=None) -> Deadline | None:
+    """The deadline for a solve with these options, or None if it has neither a time limit nor a cancel event."""
+    secs = options.deadline_secs or DEFAULT_DEADLINE_SECS
+    if secs is None and cancel_event is None:
+        return None
+    return Deadline(secs, cancel_event)
@@ -0,0 +1,136 @@
+import asyncio
+import multiprocessing
+import multiprocessing.forkserver
+import os
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Callable
+from dotenv import load_dotenv
+
+load_dotenv()
+
+# Solves are CPU-bound, so by default each core gets a solver process
+DEFAULT_SOLVER_PROCESSES = os.cpu_count() or 1
+
+# Imported once by the fork server that starts solver processes, so they share them copy-on-write
+# instead of each importing NumPy and scikit-learn and loading the geocode cache again
+SOLVER_PRELOAD = ["app.services.solver"]
+
+
+def get_solver_context() -> multiprocessing.context.BaseContext:
+    """
+    The multiprocessing context for solver processes.
+
+    They are forked from a fork server, a single-threaded process started on first use that has
+    imported SOLVER_PRELOAD. Forking the API process itself isn't safe as it is multi-threaded.
+    """
+    context = multiprocessing.get_context("forkserver")
+    context.set_forkserver_preload(SOLVER_PRELOAD)
+    return context
+
+
+class SolverPoolSaturated(Exception):
+    """Raised when the solver pool can't accept any more work."""
+
+
+class SolverPool:
+    """
+    Runs CPU-bound solves away from the event loop and the request threadpool.
+
+    Attributes:
+        processes: Number of worker processes. 0 solves on a single dedicated thread
+            in this process instead, which is handy for tests that patch the solver.
+        max_queue: Number of solves allowed to wait for a free worker before new
+            requests are rejected.
+    """
+
+    def __init__(self, processes: int = 0, max_queue: int = 8):
+        self.processes = processes
+        self.max_queue = max_queue
+        self._executor: Executor | None = None
+        self._manager = None
+        self._in_flight = 0
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls) -> "SolverPool":
+        return cls(
+            processes=int(os.getenv("SOLVER_PROCESSES", DEFAULT_SOLVER_PROCESSES)),
+            max_queue=int(os.getenv("SOLVER_MAX_QUEUE", "8")),
+        )
+
+    @property
+    def capacity(self) -> int:
+        """Maximum number of solves running or queued at once."""
+        return max(self.processes, 1) + self.max_queue
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    async def run(self, fn: Callable, *args):
+        """
+        Run fn(*args) on the pool and await its result.
+
+        The solve keeps its slot until the pool has finished it, even if the caller stops waiting,
+        as a solve that has started runs to the end.
+
+        Raises:
+            SolverPoolSaturated: If the pool is already at capacity.
+        """
+        with self._lock:
+            if self._in_flight >= self.capacity:
+                raise SolverPoolSaturated("Solver is busy, try again later")
+            self._in_flight += 1
+            executor = self._get_executor()
+        try:
+            future = executor.submit(fn, *args)
+        except BaseException:
+            self._release()
+            raise
+        future.add_done_callback(lambda _: self._release())
+        return await asyncio.wrap_future(future)
+
+    def _release(self) -> None:
+        with self._lock:
+            self._in_flight -= 1
+
+    def start(self) -> None:
+        """
+        Start the fork server for solver processes and the manager process that shares cancel events with them.
+
+        Call it at startup, as starting a process blocks; the app's lifespan does.
+        """
+        if self.processes == 0:
+            return
+        with self._lock:
+            get_solver_context()
+            multiprocessing.forkserver.ensure_running()
+            if self._manager is None:
+                self._manager = multiprocessing.get_context("spawn").Manager()
+
+    def cancel_event(self):
+        """An event that a solve running on this pool sees once it is set, to cancel it."""
+        if self.processes == 0:
+            return threading.Event()
+        self.start()
+        return self._manager.Event()
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+        if self._manager is not None:
+            self._manager.shutdown()
+            self._manager = None
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            if self.processes > 0:
+                self._executor = ProcessPoolExecutor(max_workers=self.processes, mp_context=get_solver_context())
+            else:
+                self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="solver")
+        return self._executor
+
+
+solver_pool = SolverPool.from_env()
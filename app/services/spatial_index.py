@@ -0,0 +1,127 @@
+import heapq
+from math import cos, floor, radians, sqrt
+from typing import Dict, Generic, Iterable, Iterator, List, Set, Tuple, TypeVar
+
+T = TypeVar("T")
+
+KM_PER_DEGREE_LATITUDE = 110.574
+KM_PER_DEGREE_LONGITUDE_AT_EQUATOR = 111.320
+
+
+class SpatialGrid(Generic[T]):
+    """
+    Uniform grid index over lat/lon points, supporting deletion and nearest-first iteration.
+
+    Points are projected onto a local plane (equirectangular around reference_latitude),
+    which is accurate to well under 1% at city scale. Items don't need to be hashable;
+    they are tracked by identity.
+    """
+
+    def __init__(self, cell_size_km: float = 0.5, reference_latitude: float = 0.0):
+        self.cell_size_km = cell_size_km
+        self._km_per_degree_longitude = KM_PER_DEGREE_LONGITUDE_AT_EQUATOR * cos(radians(reference_latitude))
+        self._items: Dict[int, Tuple[T, float, float, Tuple[int, int]]] = {}
+        self._cells: Dict[Tuple[int, int], Set[int]] = {}
+
+    @classmethod
+    def from_points(cls, points: Iterable[Tuple[T, float, float]], cell_size_km: float = 0.5) -> "SpatialGrid[T]":
+        """Build a grid from (item, latitude, longitude) tuples, centred on their mean latitude."""
+        points = list(points)
+        reference_latitude = sum(lat for _, lat, _ in points) / len(points) if points else 0.0
+        grid = cls(cell_size_km, reference_latitude)
+        for item, latitude, longitude in points:
+            grid.add(item, latitude, longitude)
+        return grid
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __contains__(self, item: T) -> bool:
+        return id(item) in self._items
+
+    def add(self, item: T, latitude: float, longitude: float) -> None:
+        x, y = self._project(latitude, longitude)
+        cell = self._cell_of(x, y)
+        self._items[id(item)] = (item, x, y, cell)
+        self._cells.setdefault(cell, set()).add(id(item))
+
+    def remove(self, item: T) -> None:
+        """Remove an item from the index. Does nothing if the item isn't indexed."""
+        entry = self._items.pop(id(item), None)
+        if entry is None:
+            return
+        cell = entry[3]
+        self._cells[cell].discard(id(item))
+        if not self._cells[cell]:
+            del self._cells[cell]
+
+    def within(self, latitude: float, longitude: float, radius_km: float) -> List[T]:
+        """Get all items within radius_km of a point, in no particular order."""
+        x, y = self._project(latitude, longitude)
+        cx, cy = self._cell_of(x, y)
+        reach = int(radius_km // self.cell_size_km) + 1
+        found = []
+        for dx in range(-reach, reach + 1):
+            for dy in range(-reach, reach + 1):
+                for key in self._cells.get((cx + dx, cy + dy), ()):
+                    item, ix, iy, _ = self._items[key]
+                    if sqrt((ix - x) ** 2 + (iy - y) ** 2) <= radius_km:
+                        found.append(item)
+        return found
+
+    def nearest(self, latitude: float, longitude: float) -> Iterator[T]:
+        """
+        Yield items in increasing distance from a point.
+
+        Cells are visited in rings of growing radius, so taking the first k items only
+        touches the cells around the point rather than the whole index.
+        Don't add items while iterating; removing already yielded items is fine.
+        """
+        x, y = self._project(latitude, longitude)
+        cx, cy = self._cell_of(x, y)
+        remaining = len(self._items)
+        heap: List[Tuple[float, int]] = []
+        ring = 0
+        while remaining > 0 or heap:
+            if remaining > 0:
+                # Once rings outgrow the occupied cells, sweep those instead of walking empty rings
+                sweep = 8 * ring > len(self._cells)
+                if sweep:
+                    cells = [cell for cell in self._cells if max(abs(cell[0] - cx), abs(cell[1] - cy)) >= ring]
+                else:
+                    cells = self._ring_cells(cx, cy, ring)
+                for cell in cells:
+                    for key in self._cells.get(cell, ()):
+                        _, ix, iy, _ = self._items[key]
+                        heapq.heappush(heap, (sqrt((ix - x) ** 2 + (iy - y) ** 2), key))
+                        remaining -= 1
+                if sweep:
+                    remaining = 0
+                # Anything not yet seen lies outside the ring, so at least this far away
+                settled_km = ring * self.cell_size_km if remaining > 0 else float("inf")
+                ring += 1
+            else:
+                settled_km = float("inf")
+            while heap and heap[0][0] <= settled_km:
+                _, key = heapq.heappop(heap)
+                entry = self._items.get(key)
+                if entry is not None:
+                    yield entry[0]
+
+    def _project(self, latitude: float, longitude: float) -> Tuple[float, float]:
+        return longitude * self._km_per_degree_longitude, latitude * KM_PER_DEGREE_LATITUDE
+
+    def _cell_of(self, x: float, y: float) -> Tuple[int, int]:
+        return floor(x / self.cell_size_km), floor(y / self.cell_size_km)
+
+    @staticmethod
+    def _ring_cells(cx: int, cy: int, ring: int) -> Iterator[Tuple[int, int]]:
+        if ring == 0:
+            yield cx, cy
+            return
+        for dx in range(-ring, ring + 1):
+            yield cx + dx, cy - ring
+            yield cx + dx, cy + ring
+        for dy in range(-ring + 1, ring):
+            yield cx - ring, cy + dy
+            yield cx + ring, cy + dy
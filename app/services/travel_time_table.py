@@ -0,0 +1,149 @@
+import fcntl
+import json
+import os
+import threading
+from contextlib import contextmanager
+from typing import Iterable, Iterator, List, Tuple
+import numpy as np
+from dotenv import load_dotenv
+
+from app.services.location_helpers import LocationHelpers
+
+load_dotenv()
+
+MISSING = -1
+SATURATED = np.iinfo(np.int16).max
+
+
+class TravelTimeTable:
+    """
+    Travel minutes between known sites, kept on disk so they survive restarts.
+
+    The matrix is an int16 .npy file opened as a memory map, so loading it only reads its header
+    and lookups only touch the pages they need. Site ids are the row numbers, in the order sites were
+    added, and are listed in a JSON file next to it. A site is a cached location's coordinates.
+    Times too long for int16 (over 3 weeks of walking) aren't stored.
+
+    Every worker process opens the table. Sites are added under an exclusive lock on a lock file
+    next to it, after picking up the sites other processes have added, so every process agrees
+    on the site ids. Until then a process looks up the sites it knows, which never change.
+    """
+
+    def __init__(self, path: str, initial_capacity: int = 256):
+        self.path = path
+        self.sites_path = f"{path}.sites.json"
+        self.lock_path = f"{path}.lock"
+        self.initial_capacity = initial_capacity
+        self._lock = threading.Lock()
+        self.sites: List[str] = []
+        self.matrix = None
+        self._inode = None
+        self._ids = {}
+        with self._exclusive():
+            self._refresh()
+
+    @classmethod
+    def from_env(cls) -> "TravelTimeTable | None":
+        """The table at TRAVEL_TIME_TABLE_PATH, if set, updated with every cached location."""
+        path = os.getenv("TRAVEL_TIME_TABLE_PATH")
+        if not path:
+            return None
+        table = cls(path)
+        table.add_sites(
+            (location["latitude"], location["longitude"]) for location in LocationHelpers.locationCache.values()
+        )
+        return table
+
+    def __len__(self) -> int:
+        return len(self.sites)
+
+    @staticmethod
+    def site_key(coord: Tuple[float, float]) -> str:
+        return f"{coord[0]:.4f},{coord[1]:.4f}"
+
+    def lookup(self, coord1: Tuple[float, float], coord2: Tuple[float, float]) -> int | None:
+        """Travel minutes between two sites as LocationHelpers.get_travel_time_minutes, or None if either isn't known."""
+        i = self._ids.get(self.site_key(coord1))
+        j = self._ids.get(self.site_key(coord2))
+        if i is None or j is None:
+            return None
+        minutes = int(self.matrix[i, j])
+        return None if minutes in (MISSING, SATURATED) else minutes
+
+    def add_sites(self, coords: Iterable[Tuple[float, float]]) -> int:
+        """
+        Add sites not in the table yet, computing their travel times to every site.
+        Returns:
+            Number of sites added.
+        """
+        with self._exclusive():
+            self._refresh()
+            new_sites = list(dict.fromkeys(key for key in map(self.site_key, coords) if key not in self._ids))
+            if not new_sites:
+                return 0
+
+            first_new = len(self.sites)
+            sites = self.sites + new_sites
+            self._ensure_capacity(len(sites))
+            coords = np.array([[float(value) for value in site.split(",")] for site in sites])
+            for site_id in range(first_new, len(sites)):
+                minutes = LocationHelpers.get_travel_times_minutes(tuple(coords[site_id]), coords[:, 0], coords[:, 1])
+                minutes = np.minimum(minutes, SATURATED).astype(np.int16)
+                self.matrix[site_id, :len(sites)] = minutes
+                self.matrix[:len(sites), site_id] = minutes
+            self.matrix.flush()
+            # Lookups only see the new sites once their times are in the matrix.
+            self.sites = sites
+            self._ids = {site: site_id for site_id, site in enumerate(sites)}
+            self._save_sites()
+            return len(new_sites)
+
+    @contextmanager
+    def _exclusive(self) -> Iterator[None]:
+        """Hold the table against other threads and processes."""
+        with self._lock, open(self.lock_path, "a") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _refresh(self) -> None:
+        """Pick up the sites other processes have added, and the matrix file if they replaced it to grow it."""
+        if not (os.path.exists(self.path) and os.path.exists(self.sites_path)):
+            return
+        if os.stat(self.path).st_ino != self._inode:
+            self._open_matrix()
+        with open(self.sites_path) as file:
+            self.sites = json.load(file)
+        self._ids = {site: site_id for site_id, site in enumerate(self.sites)}
+
+    def _open_matrix(self) -> None:
+        self.matrix = np.lib.format.open_memmap(self.path, mode="r+")
+        self._inode = os.stat(self.path).st_ino
+
+    def _ensure_capacity(self, n_sites: int) -> None:
+        capacity = 0 if self.matrix is None else self.matrix.shape[0]
+        if n_sites <= capacity:
+            return
+        capacity = max(self.initial_capacity, 2 * capacity, n_sites)
+        temp_path = f"{self.path}.tmp"
+        matrix = np.lib.format.open_memmap(temp_path, mode="w+", dtype=np.int16, shape=(capacity, capacity))
+        matrix[:] = MISSING
+        if self.matrix is not None:
+            old_capacity = self.matrix.shape[0]
+            matrix[:old_capacity, :old_capacity] = self.matrix
+        matrix.flush()
+        del matrix
+        os.replace(temp_path, self.path)
+        self._open_matrix()
+
+    def _save_sites(self) -> None:
+        temp_path = f"{self.sites_path}.tmp"
+        with open(temp_path, "w") as file:
+            json.dump(self.sites, file)
+        os.replace(temp_path, self.sites_path)
+
+
+travel_time_table = TravelTimeTable.from_env()
+LocationHelpers.travelTimeTable = travel_time_table
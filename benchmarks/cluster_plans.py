@@ -0,0 +1,41 @@
+"""
+Benchmark picking each cluster's next job along its precomputed tour against the
+urgency and nearest job selections, on solve time and travel.
+
+Usage:
+    python -m benchmarks.cluster_plans
+"""
+import contextlib
+import io
+import time
+
+from app.models.solver_options import SolverOptions
+from app.services.job_assignment import assign_jobs
+from app.services.roster_metrics import roster_objective
+from benchmarks.regret_insertion import make_request
+
+
+def run(options: SolverOptions, n_jobs: int, n_salesmen: int, repeats: int = 3):
+    timings, scores = [], []
+    for seed in range(repeats):
+        jobs, salesmen = make_request(seed, n_jobs, n_salesmen)
+        with contextlib.redirect_stdout(io.StringIO()):
+            start = time.perf_counter()
+            roster = assign_jobs(jobs, salesmen, options)
+            timings.append(time.perf_counter() - start)
+        scores.append(roster_objective(roster))
+    assigned, minutes, travel = (sum(score[i] for score in scores) / repeats for i in range(3))
+    return sum(timings) / repeats, assigned, minutes / 60, -travel
+
+
+def main():
+    print(f"{'jobs':>6} {'salesmen':>8} {'selection':>10} {'mean time (s)':>14} {'assigned':>9} {'work (h)':>9} {'travel (min)':>13}")
+    for n_jobs, n_salesmen in [(500, 20), (2000, 50), (5000, 100)]:
+        for selection in ["urgency", "nearest", "tour"]:
+            options = SolverOptions(job_selection=selection, n_clusters=max(4, n_jobs // 500))
+            elapsed, assigned, work_hours, travel = run(options, n_jobs, n_salesmen)
+            print(f"{n_jobs:>6} {n_salesmen:>8} {selection:>10} {elapsed:>14.3f} {assigned:>9.1f} {work_hours:>9.1f} {travel:>13.0f}")
+
+
+if __name__ == "__main__":
+    main()
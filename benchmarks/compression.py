@@ -0,0 +1,72 @@
+"""
+Benchmark gzip levels on RosterRequest bodies of typical sizes, to pick GZIP_LEVEL.
+
+For each size and level reports the compressed size, compression ratio and the time
+to compress and decompress, i.e. the CPU paid for each byte saved on the wire.
+
+Usage:
+    python -m benchmarks.compression
+"""
+import gzip
+import json
+import random
+import time
+from datetime import datetime, timedelta
+
+
+def make_request_body(n_jobs: int, n_salesmen: int, seed: int = 0) -> bytes:
+    rng = random.Random(seed)
+    day = datetime(2025, 2, 5)
+    jobs = []
+    for i in range(n_jobs):
+        entry_time = day + timedelta(hours=8, minutes=rng.randrange(0, 8 * 60, 5))
+        jobs.append({
+            "job_id": str(i),
+            "client_name": f"Airbnb {i}",
+            "date": day.isoformat(),
+            "location": {
+                "latitude": round(43.77 + rng.uniform(-0.02, 0.02), 4),
+                "longitude": round(11.25 + rng.uniform(-0.02, 0.02), 4),
+                "address": f"Via dei Calzaiuoli {rng.randrange(1, 200)}, Florence",
+            },
+            "duration_mins": rng.choice([30, 45, 60, 90, 120]),
+            "entry_time": entry_time.isoformat(),
+            "exit_time": (entry_time + timedelta(minutes=rng.randrange(60, 8 * 60, 5))).isoformat(),
+        })
+    salesmen = [
+        {
+            "salesman_id": str(100 + i),
+            "location": {"latitude": 43.77, "longitude": 11.25, "address": f"Via Roma {i}, Florence"},
+            "start_time": (day + timedelta(hours=8)).isoformat(),
+            "end_time": (day + timedelta(hours=18)).isoformat(),
+        }
+        for i in range(n_salesmen)
+    ]
+    return json.dumps({"jobs": jobs, "salesmen": salesmen}).encode()
+
+
+def best_time(fn, repeats: int = 5) -> float:
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    print(f"{'jobs':>6} {'body (KB)':>10} {'level':>6} {'gzipped (KB)':>13} {'ratio':>6} {'compress (ms)':>14} {'decompress (ms)':>16}")
+    for n_jobs, n_salesmen in [(100, 5), (1_000, 30), (10_000, 200)]:
+        body = make_request_body(n_jobs, n_salesmen)
+        for level in [1, 5, 9]:
+            compressed = gzip.compress(body, compresslevel=level)
+            compress = best_time(lambda: gzip.compress(body, compresslevel=level))
+            decompress = best_time(lambda: gzip.decompress(compressed))
+            print(
+                f"{n_jobs:>6} {len(body) / 1024:>10.0f} {level:>6} {len(compressed) / 1024:>13.0f} "
+                f"{len(body) / len(compressed):>6.1f} {compress * 1000:>14.2f} {decompress * 1000:>16.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""
+Replay a log of geocoded addresses and count how many would need a Google API call
+when the cache is keyed on the raw address, on its canonical key, and on the canonical key
+with fuzzy matching.
+
+With no log, replays a synthetic log of the cached addresses written the way users type them:
+different case and spacing, abbreviations spelled out, stray punctuation and the odd typo.
+
+Usage:
+    python -m benchmarks.geocode_cache_hits [address_log.txt] [--threshold 0.8]
+"""
+import argparse
+import json
+import random
+import time
+
+from app.services.address_keys import TrigramIndex, address_key
+from app.services.location_helpers import LocationHelpers
+
+EXPANSIONS = {"St": "Street", "Rd": "Road", "Via": "via", "Piazza": "P.zza", "Viale": "V.le"}
+
+
+def make_log(addresses, n_lookups: int, seed: int = 0):
+    rng = random.Random(seed)
+    log = []
+    for _ in range(n_lookups):
+        words = rng.choice(addresses).split()
+        if rng.random() < 0.3:
+            words = [EXPANSIONS.get(word, word) for word in words]
+        address = " ".join(words)
+        if rng.random() < 0.3:
+            address = address.lower() if rng.random() < 0.5 else address.upper()
+        if rng.random() < 0.3:
+            address = f" {address.replace(' ', '  ')}, "
+        if rng.random() < 0.1:
+            letters = [i for i, char in enumerate(address) if char.isalpha()]
+            i = rng.choice(letters)
+            address = address[:i] + address[i + 1:]
+        log.append(address)
+    return log
+
+
+def replay(log, key=None, threshold=None):
+    """Returns the number of API calls and the replay time, starting from an empty cache."""
+    cached = set()
+    index = TrigramIndex(threshold) if threshold else None
+    api_calls = 0
+    start = time.perf_counter()
+    for address in log:
+        lookup = key(address) if key else address
+        if lookup not in cached and index is not None:
+            lookup = index.closest(lookup) or lookup
+        if lookup not in cached:
+            api_calls += 1
+            cached.add(lookup)
+            if index is not None:
+                index.add(lookup)
+    return api_calls, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("log", nargs="?", help="File with one looked up address per line")
+    parser.add_argument("--threshold", type=float, default=0.8, help="Trigram similarity for fuzzy matches")
+    args = parser.parse_args()
+
+    if args.log:
+        with open(args.log) as file:
+            log = [line.rstrip("\n") for line in file if line.strip()]
+    else:
+        with open(LocationHelpers.cache_file_path) as file:
+            log = make_log(list(json.load(file)), n_lookups=5000)
+
+    print(f"{len(log)} lookups, {len(set(log))} distinct raw addresses")
+    print(f"{'cache key':>18} {'API calls':>10} {'hit rate':>9} {'time (ms)':>10}")
+    for label, key, threshold in [
+        ("raw address", None, None),
+        ("canonical", address_key, None),
+        (f"fuzzy ({args.threshold})", address_key, args.threshold),
+    ]:
+        api_calls, elapsed = replay(log, key, threshold)
+        print(f"{label:>18} {api_calls:>10} {1 - api_calls / len(log):>9.1%} {elapsed * 1000:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
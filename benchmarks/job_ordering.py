@@ -0,0 +1,70 @@
+"""
+Benchmark putting jobs in urgency order, as the greedy solver does at the start of each solve.
+
+Compares sorting with Job.__lt__ recomputing urgency on every comparison (as before urgency was
+memoized), sorting with memoized urgency, and order_by_urgency's single argsort.
+
+Usage:
+    python -m benchmarks.job_ordering
+"""
+import random
+import time
+from datetime import datetime, timedelta
+
+from app.models.job import Job
+from app.models.location import Location
+from app.services.job_assignment import order_by_urgency
+
+
+def make_jobs(n_jobs: int, seed: int = 0):
+    rng = random.Random(seed)
+    day = datetime(2025, 2, 5)
+    location = Location(latitude=43.77, longitude=11.25)
+    jobs = []
+    for i in range(n_jobs):
+        entry_time = day + timedelta(hours=8, minutes=rng.randrange(0, 8 * 60, 5))
+        jobs.append(Job(
+            job_id=str(i),
+            date=day,
+            location=location,
+            duration_mins=rng.choice([30, 45, 60, 90, 120]),
+            entry_time=entry_time,
+            exit_time=entry_time + timedelta(minutes=rng.randrange(60, 8 * 60, 5)),
+        ))
+    return jobs
+
+
+class RecomputedUrgency:
+    """Job.__lt__ before urgency was memoized."""
+
+    def __enter__(self):
+        self.lt = Job.__lt__
+        Job.__lt__ = lambda job, other: job.get_urgency() < other.get_urgency()
+
+    def __exit__(self, *exc):
+        Job.__lt__ = self.lt
+
+
+def best_time(fn, repeats=3):
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    print(f"{'jobs':>7} {'recomputed __lt__ (ms)':>23} {'memoized __lt__ (ms)':>21} {'argsort (ms)':>13}")
+    for n_jobs in [1_000, 10_000, 50_000]:
+        jobs = make_jobs(n_jobs)
+        with RecomputedUrgency():
+            recomputed = best_time(lambda: sorted(jobs, reverse=True))
+        memoized = best_time(lambda: sorted(jobs, reverse=True))
+        argsort = best_time(lambda: order_by_urgency(jobs))
+        assert order_by_urgency(jobs) == sorted(jobs, reverse=True)
+        print(f"{n_jobs:>7} {recomputed * 1000:>23.1f} {memoized * 1000:>21.1f} {argsort * 1000:>13.1f}")
+
+
+if __name__ == "__main__":
+    main()
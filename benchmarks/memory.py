@@ -0,0 +1,91 @@
+"""
+Benchmark the memory taken by large roster requests, with tracemalloc.
+
+Requests repeat addresses, days, times and client names across their jobs, as real ones do.
+Compares the jobs validated on their own with the same jobs validated as a RosterRequest,
+which shares the repeated values, then measures the peak memory of solving the request.
+
+Usage:
+    python -m benchmarks.memory
+"""
+import contextlib
+import gc
+import io
+import random
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+from typing import List
+
+from pydantic import TypeAdapter
+
+from app.models.job import Job
+from app.models.roster_request import RosterRequest
+from app.services.job_assignment import assign_jobs
+
+
+def make_payload(seed: int, n_jobs: int, n_salesmen: int) -> dict:
+    rng = random.Random(seed)
+    day = datetime(2025, 2, 5)
+    addresses = [
+        (43.77 + rng.uniform(-0.05, 0.05), 11.25 + rng.uniform(-0.05, 0.05), f"Via Roma {i}, Firenze")
+        for i in range(max(1, n_jobs // 5))
+    ]
+    jobs = []
+    for i in range(n_jobs):
+        entry_time = day + timedelta(hours=8, minutes=rng.randrange(0, 8 * 60, 5))
+        latitude, longitude, address = rng.choice(addresses)
+        jobs.append({
+            "job_id": str(i),
+            "client_name": f"Client {i % 1000}",
+            "date": day.isoformat(),
+            "location": {"latitude": latitude, "longitude": longitude, "address": address},
+            "duration_mins": rng.choice([30, 45, 60, 90, 120]),
+            "entry_time": entry_time.isoformat(),
+            "exit_time": (entry_time + timedelta(minutes=rng.randrange(60, 8 * 60, 5))).isoformat(),
+        })
+    salesmen = [
+        {
+            "salesman_id": str(i),
+            "location": {"latitude": 43.77, "longitude": 11.25},
+            "start_time": (day + timedelta(hours=8)).isoformat(),
+            "end_time": (day + timedelta(hours=18)).isoformat(),
+        }
+        for i in range(n_salesmen)
+    ]
+    return {"jobs": jobs, "salesmen": salesmen}
+
+
+def measure(fn):
+    """Run fn, returning its result, the memory it still holds and its peak memory in MB."""
+    gc.collect()
+    tracemalloc.start()
+    result = fn()
+    gc.collect()
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, current / 1e6, peak / 1e6
+
+
+def main():
+    jobs_adapter = TypeAdapter(List[Job])
+    print(f"{'jobs':>7} {'stage':>20} {'held (MB)':>10} {'peak (MB)':>10} {'time (s)':>9}")
+    for n_jobs in [10_000, 100_000]:
+        payload = make_payload(0, n_jobs, n_salesmen=50)
+        start = time.perf_counter()
+        jobs, held, peak = measure(lambda: jobs_adapter.validate_python(payload["jobs"]))
+        print(f"{n_jobs:>7} {'jobs on their own':>20} {held:>10.1f} {peak:>10.1f} {time.perf_counter() - start:>9.2f}")
+        del jobs
+
+        start = time.perf_counter()
+        request, held, peak = measure(lambda: RosterRequest.model_validate(payload))
+        print(f"{n_jobs:>7} {'roster request':>20} {held:>10.1f} {peak:>10.1f} {time.perf_counter() - start:>9.2f}")
+
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            _, held, peak = measure(lambda: assign_jobs(request.jobs, request.salesmen))
+        print(f"{n_jobs:>7} {'assign_jobs':>20} {held:>10.1f} {peak:>10.1f} {time.perf_counter() - start:>9.2f}")
+
+
+if __name__ == "__main__":
+    main()
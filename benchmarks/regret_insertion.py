@@ -0,0 +1,76 @@
+"""
+Benchmark the regret insertion engine against the greedy and round robin engines,
+on roster quality and solve time.
+
+Usage:
+    python -m benchmarks.regret_insertion
+"""
+import contextlib
+import io
+import random
+import time
+from datetime import datetime, timedelta
+
+from app.models.job import Job
+from app.models.location import Location
+from app.models.salesman import Salesman
+from app.models.solver_options import SolverOptions
+from app.services.engines import run_engine
+from app.services.roster_metrics import roster_objective
+
+
+def make_request(seed: int, n_jobs: int, n_salesmen: int):
+    rng = random.Random(seed)
+    day = datetime(2025, 2, 5)
+    jobs = []
+    for i in range(n_jobs):
+        entry_time = day + timedelta(hours=8, minutes=rng.randrange(0, 8 * 60, 5))
+        jobs.append(Job(
+            job_id=str(i),
+            date=day,
+            location=Location(latitude=43.77 + rng.uniform(-0.02, 0.02), longitude=11.25 + rng.uniform(-0.02, 0.02)),
+            duration_mins=rng.choice([30, 45, 60, 90, 120]),
+            entry_time=entry_time,
+            exit_time=entry_time + timedelta(minutes=rng.randrange(60, 8 * 60, 5)),
+        ))
+    salesmen = [
+        Salesman(
+            salesman_id=str(i),
+            location=Location(latitude=43.77 + rng.uniform(-0.02, 0.02), longitude=11.25 + rng.uniform(-0.02, 0.02)),
+            start_time=day + timedelta(hours=8, minutes=rng.randrange(0, 120, 15)),
+            end_time=day + timedelta(hours=18),
+        )
+        for i in range(n_salesmen)
+    ]
+    return jobs, salesmen
+
+
+def run(options: SolverOptions, n_jobs: int, n_salesmen: int, repeats: int = 3):
+    timings, scores = [], []
+    for seed in range(repeats):
+        jobs, salesmen = make_request(seed, n_jobs, n_salesmen)
+        with contextlib.redirect_stdout(io.StringIO()):
+            start = time.perf_counter()
+            roster = run_engine(jobs, salesmen, options)
+            timings.append(time.perf_counter() - start)
+        scores.append(roster_objective(roster))
+    assigned, minutes, travel = (sum(score[i] for score in scores) / repeats for i in range(3))
+    return sum(timings) / repeats, assigned, minutes / 60, -travel
+
+
+def main():
+    engines = [
+        ("greedy", SolverOptions()),
+        ("round_robin", SolverOptions(engine="round_robin")),
+        ("regret-2", SolverOptions(engine="regret")),
+        ("regret-3", SolverOptions(engine="regret", regret_k=3)),
+    ]
+    print(f"{'jobs':>6} {'salesmen':>8} {'engine':>12} {'mean time (s)':>14} {'assigned':>9} {'work (h)':>9} {'travel (min)':>13}")
+    for n_jobs, n_salesmen in [(100, 5), (500, 20), (2000, 50)]:
+        for label, options in engines:
+            elapsed, assigned, work_hours, travel = run(options, n_jobs, n_salesmen)
+            print(f"{n_jobs:>6} {n_salesmen:>8} {label:>12} {elapsed:>14.3f} {assigned:>9.1f} {work_hours:>9.1f} {travel:>13.0f}")
+
+
+if __name__ == "__main__":
+    main()
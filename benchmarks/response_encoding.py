@@ -0,0 +1,91 @@
+"""
+Benchmark serializing a full roster response of 10k jobs.
+
+Compares the previous path, returning roster.model_dump() for FastAPI to run through
+jsonable_encoder and JSONResponse, with encode_roster's single model_dump_json pass,
+and with the compact response. Reports the best time and peak memory allocated.
+
+Usage:
+    python -m benchmarks.response_encoding
+"""
+import contextlib
+import io
+import random
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+from app.models.job import Job
+from app.models.location import Location
+from app.models.roster_response import RosterResponse
+from app.models.salesman import Salesman
+from app.services.response_encoding import encode_compact_roster, encode_roster
+
+
+def make_roster(n_jobs: int, n_salesmen: int, seed: int = 0) -> RosterResponse:
+    rng = random.Random(seed)
+    day = datetime(2025, 2, 5)
+    salesmen = [
+        Salesman(
+            salesman_id=str(i),
+            location=Location(latitude=43.77, longitude=11.25, address=f"Via Roma {i}, Florence"),
+            start_time=day + timedelta(hours=8),
+            end_time=day + timedelta(hours=18),
+        )
+        for i in range(n_salesmen)
+    ]
+    roster = RosterResponse()
+    roster.add_salesmen(salesmen)
+    with contextlib.redirect_stdout(io.StringIO()):
+        for i in range(n_jobs):
+            entry_time = day + timedelta(hours=8, minutes=rng.randrange(0, 8 * 60, 5))
+            job = Job(
+                job_id=str(i),
+                client_name=f"Client {i}",
+                date=day,
+                location=Location(
+                    latitude=43.77 + rng.uniform(-0.02, 0.02),
+                    longitude=11.25 + rng.uniform(-0.02, 0.02),
+                    address=f"Via dei Calzaiuoli {i}, Florence",
+                ),
+                duration_mins=60,
+                entry_time=entry_time,
+                exit_time=entry_time + timedelta(hours=2),
+            )
+            if i % 10:
+                roster.assign_job_to_salesman(job, salesmen[i % n_salesmen], entry_time)
+            else:
+                roster.unassigned_jobs.append(job)
+    return roster
+
+
+def measure(encode, repeats: int = 5):
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        body = encode()
+        timings.append(time.perf_counter() - start)
+    tracemalloc.start()
+    encode()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return min(timings), peak, len(body)
+
+
+def main():
+    roster = make_roster(n_jobs=10_000, n_salesmen=100)
+    print(f"{'path':>34} {'best time (ms)':>15} {'peak memory (MB)':>17} {'body (KB)':>10}")
+    for label, encode in [
+        ("model_dump + jsonable_encoder", lambda: JSONResponse(jsonable_encoder(roster.model_dump())).body),
+        ("model_dump_json (encode_roster)", lambda: encode_roster(roster).body),
+        ("compact JSON", lambda: encode_compact_roster(roster).body),
+    ]:
+        elapsed, peak, size = measure(encode)
+        print(f"{label:>34} {elapsed * 1000:>15.1f} {peak / 2 ** 20:>17.1f} {size / 1024:>10.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+Benchmark the greedy solver on rosters where salesmen start at staggered times,
+mostly well before their first job opens.
+
+Compares the event-driven clock (default) with the old fixed 15 minute wait steps.
+
+Usage:
+    python -m benchmarks.staggered_starts
+"""
+import contextlib
+import io
+import random
+import time
+from datetime import datetime, timedelta
+
+from app.models.job import Job
+from app.models.location import Location
+from app.models.salesman import Salesman
+from app.models.solver_options import SolverOptions
+from app.services.job_assignment import assign_jobs
+
+
+def make_request(seed: int, n_jobs: int, n_salesmen: int):
+    rng = random.Random(seed)
+    day = datetime(2025, 2, 5)
+    jobs = []
+    for i in range(n_jobs):
+        entry_time = day + timedelta(hours=10, minutes=rng.randrange(0, 6 * 60))
+        jobs.append(Job(
+            job_id=str(i),
+            date=day,
+            location=Location(latitude=43.77 + rng.uniform(-0.02, 0.02), longitude=11.25 + rng.uniform(-0.02, 0.02)),
+            duration_mins=rng.choice([30, 45, 60, 90, 120]),
+            entry_time=entry_time,
+            exit_time=entry_time + timedelta(minutes=rng.randrange(120, 6 * 60)),
+        ))
+    salesmen = [
+        Salesman(
+            salesman_id=str(i),
+            location=Location(latitude=43.77 + rng.uniform(-0.02, 0.02), longitude=11.25 + rng.uniform(-0.02, 0.02)),
+            start_time=day + timedelta(hours=5, minutes=rng.randrange(0, 5 * 60)),
+            end_time=day + timedelta(hours=20),
+        )
+        for i in range(n_salesmen)
+    ]
+    return jobs, salesmen
+
+
+def run(options: SolverOptions, n_jobs: int, n_salesmen: int, repeats: int = 3):
+    timings = []
+    for seed in range(repeats):
+        jobs, salesmen = make_request(seed, n_jobs, n_salesmen)
+        with contextlib.redirect_stdout(io.StringIO()):
+            start = time.perf_counter()
+            roster = assign_jobs(jobs, salesmen, options)
+            timings.append(time.perf_counter() - start)
+    assigned = sum(len(route) for route in roster.jobs.values())
+    first_starts = [route[0].start_time for route in roster.jobs.values() if route]
+    mean_first_start = sum((t - t.replace(hour=0, minute=0)).total_seconds() / 60 for t in first_starts) / len(first_starts)
+    return min(timings), assigned, mean_first_start
+
+
+def main():
+    print(f"{'jobs':>6} {'salesmen':>8} {'mode':>14} {'best time (s)':>14} {'assigned':>9} {'mean first start':>17}")
+    for n_jobs, n_salesmen in [(100, 5), (500, 20), (2000, 50)]:
+        for label, options in [("wait 15 min", SolverOptions(wait_mins=15)), ("event-driven", SolverOptions())]:
+            elapsed, assigned, mean_first_start = run(options, n_jobs, n_salesmen)
+            hours, minutes = divmod(mean_first_start, 60)
+            print(f"{n_jobs:>6} {n_salesmen:>8} {label:>14} {elapsed:>14.3f} {assigned:>9} {int(hours):>11}:{minutes:05.2f}")
+
+
+if __name__ == "__main__":
+    main()
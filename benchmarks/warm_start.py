@@ -0,0 +1,56 @@
+"""
+Benchmark warm starting the solver from the previous week's roster on a steady-state day,
+where most jobs repeat, some are new and the salesmen can cover them.
+
+Compares a cold solve with a warm start on solve time, jobs assigned and stability:
+the share of repeated jobs that keep their salesman.
+
+Usage:
+    python -m benchmarks.warm_start
+"""
+import contextlib
+import io
+import time
+
+from app.models.warm_start import WarmStart
+from app.services.job_assignment import assign_jobs
+from benchmarks.regret_insertion import make_request
+
+
+def make_days(n_jobs: int, n_salesmen: int, churn: float = 0.1):
+    """The same request last week and today, with churn of today's jobs replaced by new ones."""
+    last_week, _ = make_request(0, n_jobs, n_salesmen)
+    today, salesmen = make_request(0, n_jobs, n_salesmen)
+    new_jobs, _ = make_request(1, int(n_jobs * churn), n_salesmen)
+    for job in new_jobs:
+        job.job_id = f"new-{job.job_id}"
+    return last_week, today[len(new_jobs):] + new_jobs, salesmen
+
+
+def salesman_of(roster):
+    return {job.job_id: salesman_id for salesman_id, route in roster.jobs.items() for job in route}
+
+
+def main():
+    print(f"{'jobs':>6} {'salesmen':>8} {'start':>6} {'time (s)':>9} {'assigned':>9} {'kept salesman':>14}")
+    for n_jobs, n_salesmen in [(300, 100), (1500, 500), (3000, 1000)]:
+        last_week_jobs, today_jobs, _ = make_days(n_jobs, n_salesmen)
+        with contextlib.redirect_stdout(io.StringIO()):
+            last_week = assign_jobs(last_week_jobs, make_request(0, n_jobs, n_salesmen)[1])
+        previous = salesman_of(last_week)
+        hints = WarmStart(roster=last_week).get_hints()
+
+        for label, start_hints in [("cold", None), ("warm", hints)]:
+            jobs, salesmen = make_days(n_jobs, n_salesmen)[1:]
+            with contextlib.redirect_stdout(io.StringIO()):
+                start = time.perf_counter()
+                roster = assign_jobs(jobs, salesmen, hints=start_hints)
+                elapsed = time.perf_counter() - start
+            current = salesman_of(roster)
+            repeated = [job_id for job_id in previous if job_id in current]
+            kept = sum(current[job_id] == previous[job_id] for job_id in repeated) / max(1, len(repeated))
+            print(f"{n_jobs:>6} {n_salesmen:>8} {label:>6} {elapsed:>9.3f} {len(current):>9} {kept:>13.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""
+Production server: gunicorn managing uvicorn workers.
+
+The app is imported once in the master before forking (preload_app), so the geocode cache,
+the travel time table and heavy libraries like NumPy and scikit-learn are loaded once and
+shared copy-on-write by the web workers. Per-worker state (solver pool, email sender) starts in
+each worker's lifespan.
+
+Solves don't run in the web workers but in each worker's solver processes. Those are forked from
+a fork server the worker starts, which loads the solver modules and the geocode cache once, so
+they share them copy-on-write too: each fork server holds about 90 MB, and each solver process
+adds about 4 MB of its own before it starts solving, rather than 85 MB and several seconds of imports.
+
+    gunicorn app.main:app -c gunicorn.conf.py
+
+With preload_app, workers replaced on SIGHUP are forked from the master as it was loaded, so
+they keep its geocode cache and code. After updating locationCache.json or deploying new code,
+restart gunicorn or upgrade it in place: send SIGUSR2 to start a new master, then SIGTERM the old one.
+"""
+import gc
+import multiprocessing
+import os
+from dotenv import load_dotenv
+
+load_dotenv()
+
+bind = f"0.0.0.0:{os.getenv('PORT', '8000')}"
+workers = int(os.getenv("WEB_CONCURRENCY", multiprocessing.cpu_count()))
+worker_class = "uvicorn.workers.UvicornWorker"
+preload_app = True
+
+# Each worker has its own solver pool, so split the cores between them rather than giving each one all of them.
+# Set before the app is preloaded, which creates the pool.
+os.environ.setdefault("SOLVER_PROCESSES", str(max(multiprocessing.cpu_count() // workers, 1)))
+
+# Solves can take a while, graceful_timeout lets in-flight ones finish on reload or shutdown
+timeout = int(os.getenv("GUNICORN_TIMEOUT", 120))
+graceful_timeout = int(os.getenv("GUNICORN_GRACEFUL_TIMEOUT", 60))
+keepalive = 5
+
+# Recycle workers now and then, staggered so they don't all restart together
+max_requests = int(os.getenv("GUNICORN_MAX_REQUESTS", 1000))
+max_requests_jitter = max_requests // 10
+
+accesslog = "-"
+
+
+def pre_fork(server, worker):
+    # Move everything loaded so far out of the collector's reach, so garbage collection in the
+    # workers doesn't touch (and copy) the shared pages
+    gc.freeze()
+
+
+def post_fork(server, worker):
+    server.log.info(f"Worker {worker.pid} forked from preloaded app")
@@ -0,0 +1,68 @@
+import gzip
+import json
+import zlib
+from unittest.mock import patch
+import pytest
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+from app.main import app
+from app.middleware.request_decompression import RequestDecompressionMiddleware
+from app.services.location_helpers import LocationHelpers
+
+echo_app = FastAPI()
+echo_app.add_middleware(RequestDecompressionMiddleware, max_size=1000)
+
+
+@echo_app.post("/echo")
+async def echo(request: Request):
+    body = await request.body()
+    return {"body": body.decode(), "content_length": request.headers["content-length"], "encoding": request.headers.get("content-encoding")}
+
+
+echo_client = TestClient(echo_app)
+
+
+@pytest.mark.parametrize("encoding, compress", [("gzip", gzip.compress), ("deflate", zlib.compress)])
+def test_request_body_is_decompressed(encoding, compress):
+    response = echo_client.post("/echo", content=compress(b"hello world"), headers={"Content-Encoding": encoding})
+
+    assert response.status_code == 200
+    assert response.json() == {"body": "hello world", "content_length": "11", "encoding": None}
+
+
+def test_plain_request_body_is_untouched():
+    response = echo_client.post("/echo", content=b"hello world")
+    assert response.json() == {"body": "hello world", "content_length": "11", "encoding": None}
+
+
+def test_decompressed_body_size_is_limited():
+    response = echo_client.post("/echo", content=gzip.compress(b"0" * 1001), headers={"Content-Encoding": "gzip"})
+    assert response.status_code == 413
+
+    response = echo_client.post("/echo", content=gzip.compress(b"0" * 1000), headers={"Content-Encoding": "gzip"})
+    assert response.status_code == 200
+
+
+def test_invalid_request_encodings_are_rejected():
+    assert echo_client.post("/echo", content=b"not gzip", headers={"Content-Encoding": "gzip"}).status_code == 400
+    assert echo_client.post("/echo", content=gzip.compress(b"hello")[:-4], headers={"Content-Encoding": "gzip"}).status_code == 400
+    assert echo_client.post("/echo", content=b"hello", headers={"Content-Encoding": "zstd"}).status_code == 415
+
+
+def test_assign_jobs_accepts_gzip_and_compresses_response():
+    client = TestClient(app)
+    with open("tests/app/routes/roster_request_florence.json", "rb") as file:
+        body = file.read()
+    with patch.object(LocationHelpers, 'get_travel_time_minutes', return_value=20):
+        plain = client.post("/assign_jobs", content=body, headers={"Content-Type": "application/json", "Accept-Encoding": "identity"})
+        compressed = client.post(
+            "/assign_jobs",
+            content=gzip.compress(body),
+            headers={"Content-Type": "application/json", "Content-Encoding": "gzip", "Accept-Encoding": "gzip"},
+        )
+
+    assert compressed.status_code == 200
+    assert "content-encoding" not in plain.headers
+    assert compressed.headers["content-encoding"] == "gzip"
+    assert int(compressed.headers["content-length"]) < len(plain.content) / 3
+    assert compressed.json() == json.loads(plain.content)
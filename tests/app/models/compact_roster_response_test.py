@@ -0,0 +1,56 @@
+from datetime import datetime
+from app.models.compact_roster_response import CompactRosterResponse
+from app.models.roster_response import RosterResponse
+from app.models.job import Job
+from app.models.salesman import Salesman
+from app.models.location import Location
+
+
+def test_compact_roster_from_roster():
+    sman = Salesman(
+        salesman_id="1",
+        location=Location(latitude=40.730610, longitude=-73.935242),
+        start_time=datetime(2025, 2, 5, 9, 0, 0),
+        end_time=datetime(2025, 2, 5, 17, 0, 0),
+    )
+    job1 = Job(
+        job_id="1",
+        date=datetime(2025, 2, 5),
+        location=Location(latitude=40.7128, longitude=-74.0060),
+        duration_mins=60,
+        entry_time=datetime(2025, 2, 5, 10, 0, 0),
+        exit_time=datetime(2025, 2, 5, 14, 0, 0),
+    )
+    job2 = Job(
+        job_id="2",
+        date=datetime(2025, 2, 5),
+        location=Location(latitude=40.7130, longitude=-74.0055),
+        duration_mins=30,
+        entry_time=datetime(2025, 2, 5, 11, 0, 0),
+        exit_time=datetime(2025, 2, 5, 15, 0, 0),
+    )
+    job3 = Job(
+        job_id="3",
+        date=datetime(2025, 2, 5),
+        location=Location(latitude=40.7130, longitude=-74.0055),
+        duration_mins=30,
+        entry_time=datetime(2025, 2, 5, 18, 0, 0),
+        exit_time=datetime(2025, 2, 5, 19, 0, 0),
+    )
+    roster = RosterResponse()
+    roster.add_salesman(sman)
+    roster.assign_job_to_salesman(job1, sman, datetime(2025, 2, 5, 10, 0, 0))
+    roster.assign_job_to_salesman(job2, sman, datetime(2025, 2, 5, 11, 20, 0))
+    roster.unassigned_jobs.append(job3)
+    roster.message = "Roster completed with unassigned jobs"
+
+    compact = CompactRosterResponse.from_roster(roster)
+
+    assert [(a.job_id, a.salesman_id, a.order) for a in compact.assignments] == [
+        ("1", "1", 0),
+        ("2", "1", 1),
+    ], "Assignments should be listed in route order"
+    assert compact.assignments[1].start_time == datetime(2025, 2, 5, 11, 20, 0)
+    assert compact.unassigned_job_ids == ["3"]
+    assert compact.message == roster.message
+    assert "location" not in compact.model_dump_json(), "Compact response should not repeat job details"
@@ -179,3 +179,24 @@ def test_exit_time_adjustment():
     
     # Assert that exit_time has been adjusted to 1 hour after entry_time
     assert job.exit_time == datetime(2025, 2, 6, 11, 0, 0), f"Expected exit_time to be adjusted to 11:00, but got {job.exit_time}"
+
+
+def test_job_urgency_is_memoized():
+    job = Job(
+        job_id="1",
+        date=datetime(2025, 2, 6),
+        location=Location(latitude=40.7128, longitude=-74.0060),
+        duration_mins=60,
+        entry_time=datetime(2025, 2, 6, 10, 0, 0),
+        exit_time=datetime(2025, 2, 6, 14, 0, 0),
+    )
+
+    assert job._urgency == 15, "Urgency should be computed when the job is validated"
+    assert job.model_copy(deep=True).urgency == 15
+    job.exit_time = datetime(2025, 2, 6, 11, 0, 0)
+    assert job.urgency == 60, "Urgency should be recomputed after the time window changes"
+    job.duration_mins = 30
+    assert job.urgency == 15, "Urgency should be recomputed after the duration changes"
+    job.salesman_id = "7"
+    assert job._urgency == 15, "Other assignments should keep the computed urgency"
+    assert Job.model_construct(**job.model_dump()).urgency == 15, "Unvalidated jobs compute urgency on first use"
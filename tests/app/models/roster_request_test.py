@@ -0,0 +1,63 @@
+from datetime import datetime, timedelta, timezone
+from app.models.roster_request import RosterRequest
+
+
+def make_payload(addresses, entry_times):
+    return {
+        "jobs": [
+            {
+                "job_id": str(i),
+                "client_name": "Client",
+                "date": "2025-02-05T00:00:00",
+                "location": {"latitude": latitude, "longitude": longitude, "address": address},
+                "duration_mins": 60,
+                "entry_time": entry_time,
+                "exit_time": "2025-02-05T17:00:00+00:00",
+            }
+            for i, ((latitude, longitude, address), entry_time) in enumerate(zip(addresses, entry_times))
+        ],
+        "salesmen": [
+            {
+                "salesman_id": "101",
+                "location": {"latitude": 43.77, "longitude": 11.25},
+                "start_time": "2025-02-05T09:00:00+00:00",
+                "end_time": "2025-02-05T17:00:00+00:00",
+            }
+        ],
+    }
+
+
+def test_request_shares_repeated_values():
+    address = (43.7696, 11.2558, "Piazza della Signoria, Firenze")
+    request = RosterRequest.model_validate(make_payload([address] * 3, ["2025-02-05T09:00:00+00:00"] * 3))
+
+    first, *others = request.jobs
+    for job in others:
+        assert job.location is first.location, "Jobs at the same place should share one Location"
+        assert job.entry_time is first.entry_time
+        assert job.client_name is first.client_name
+    assert request.salesmen[0].end_time is first.exit_time
+    assert request.jobs[0].model_dump() == {**request.jobs[1].model_dump(), "job_id": "0"}, "Sharing should not change any value"
+
+
+def test_request_keeps_distinct_values_apart():
+    request = RosterRequest.model_validate(make_payload(
+        [(43.7696, 11.2558, "Piazza della Signoria"), (43.7696, 11.2558, "Palazzo Vecchio"), (43.7696, 11.2558, "Palazzo Vecchio")],
+        ["2025-02-05T09:00:00+00:00", "2025-02-05T10:00:00+01:00", "2025-02-05T09:00:00+00:00"],
+    ))
+
+    locations = [job.location for job in request.jobs]
+    entry_times = [job.entry_time for job in request.jobs]
+    assert locations[0] is not locations[1], "Locations with different addresses should stay apart"
+    assert locations[1] is locations[2]
+    assert entry_times[0] == entry_times[1], "Pre assertion - the same instant"
+    assert entry_times[1].utcoffset() == timedelta(hours=1), "Times in other timezones should keep their timezone"
+    assert entry_times[0] is entry_times[2]
+
+
+def test_values_are_not_shared_outside_requests():
+    payload = make_payload([(43.7696, 11.2558, None)] * 2, ["2025-02-05T09:00:00+00:00"] * 2)
+    first, second = (RosterRequest.model_validate(payload) for _ in range(2))
+
+    assert first.jobs[0].location is not second.jobs[0].location, "Each request should have its own values"
+    assert first.jobs[0].entry_time == datetime(2025, 2, 5, 9, tzinfo=timezone.utc)
@@ -0,0 +1,30 @@
+from datetime import datetime
+from app.models.job import Job
+from app.models.location import Location
+from app.models.roster_response import RosterResponse
+from app.models.warm_start import WarmStart
+
+
+def make_job(job_id):
+    return Job(
+        job_id=job_id,
+        date=datetime(2025, 2, 5),
+        location=Location(latitude=43.77, longitude=11.25),
+        duration_mins=60,
+        entry_time=datetime(2025, 2, 5, 9, 0, 0),
+        exit_time=datetime(2025, 2, 5, 17, 0, 0),
+    )
+
+
+def test_get_hints_from_roster_and_hints():
+    roster = RosterResponse(jobs={"a": [make_job("2"), make_job("1")], "b": [make_job("3")]})
+    warm_start = WarmStart(roster=roster, hints={"3": "a", "4": "b"})
+
+    hints = warm_start.get_hints()
+
+    assert hints == {"2": "a", "1": "a", "3": "a", "4": "b"}, "Hints should override the roster"
+    assert list(hints) == ["2", "1", "3", "4"], "Roster jobs should come first in route order"
+
+
+def test_get_hints_empty():
+    assert WarmStart().get_hints() == {}
@@ -0,0 +1,41 @@
+import os
+from unittest.mock import patch
+from fastapi.testclient import TestClient
+from app.main import app
+from app.services.solver_pool import solver_pool
+
+
+def test_health():
+    with TestClient(app) as client:
+        response = client.get("/health")
+
+    assert response.status_code == 200
+    assert response.json()["status"] == "ok"
+    assert response.json()["pid"] == os.getpid()
+
+
+def test_ready_after_startup():
+    with TestClient(app) as client:
+        response = client.get("/ready")
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["status"] == "ready"
+    assert body["solver"] == {"in_flight": 0, "capacity": solver_pool.capacity}
+    assert body["geocoding_circuit"] == "closed"
+
+
+def test_not_ready_when_solver_is_saturated():
+    with TestClient(app) as client, patch.object(solver_pool, "_in_flight", solver_pool.capacity):
+        response = client.get("/ready")
+
+    assert response.status_code == 503
+    assert response.json()["status"] == "not_ready"
+
+
+def test_not_ready_before_startup(monkeypatch):
+    monkeypatch.setattr(app.state, "ready", False, raising=False)
+    response = TestClient(app).get("/ready")
+
+    assert response.status_code == 503
+    assert response.json()["started"] is False
@@ -1,8 +1,16 @@
+import asyncio
 import json
+import threading
+import msgpack
+from fastapi.encoders import jsonable_encoder
 from fastapi.testclient import TestClient
 from app.main import app
+from app.routes import scheduler
+from app.services.deadline import DEADLINE_MESSAGE
+from app.services.email_outbox import EmailOutbox
 from unittest.mock import patch
 from app.services.location_helpers import LocationHelpers
+from app.services.solver_pool import SolverPoolSaturated, solver_pool
 
 client = TestClient(app)
 
@@ -297,3 +305,119 @@ def test_assign_jobs_florence():
 #     assert (
 #         response_json["message"] == "No jobs to assign"
 #     ), "Message should indicate no jobs to assign"
+
+
+def test_assign_jobs_compact_json():
+    with open("tests/app/routes/roster_request_florence.json", "r") as file:
+        request = json.load(file)
+    with patch.object(LocationHelpers, 'get_travel_time_minutes', return_value=20):
+        full = client.post("/assign_jobs", json=request).json()
+        response = client.post("/assign_jobs?format=compact", json=request)
+
+    assert response.status_code == 200, "Response should have status 200"
+    assert response.headers["content-type"] == "application/json"
+    compact = response.json()
+
+    expected = [
+        {"job_id": job["job_id"], "salesman_id": salesman_id, "start_time": job["start_time"], "order": i}
+        for salesman_id, jobs in full["jobs"].items()
+        for i, job in enumerate(jobs)
+    ]
+    assert compact["assignments"] == expected, "Compact assignments should match the full roster"
+    assert compact["unassigned_job_ids"] == [job["job_id"] for job in full["unassigned_jobs"]]
+    assert compact["message"] == full["message"]
+    assert len(response.content) < len(json.dumps(full)), "Compact response should be smaller"
+
+
+def test_assign_jobs_compact_msgpack():
+    with open("tests/app/routes/roster_request_florence.json", "r") as file:
+        request = json.load(file)
+    with patch.object(LocationHelpers, 'get_travel_time_minutes', return_value=20):
+        json_response = client.post("/assign_jobs?format=compact", json=request)
+        response = client.post("/assign_jobs?format=compact", json=request, headers={"Accept": "application/msgpack"})
+
+    assert response.status_code == 200, "Response should have status 200"
+    assert response.headers["content-type"] == "application/msgpack"
+    assert msgpack.unpackb(response.content) == json_response.json(), "msgpack and JSON should carry the same data"
+
+
+def test_assign_jobs_full_response_matches_fastapi_encoding():
+    with open("tests/app/routes/roster_request_florence.json", "r") as file:
+        request = json.load(file)
+    request["jobs"][0]["client_name"] = "Caffè Gilli"
+    rosters = []
+
+    async def solve_and_keep(fn, *args):
+        rosters.append(fn(*args))
+        return rosters[-1]
+
+    with patch.object(LocationHelpers, 'get_travel_time_minutes', return_value=20), \
+            patch.object(solver_pool, 'run', side_effect=solve_and_keep):
+        response = client.post("/assign_jobs", json=request)
+
+    assert response.status_code == 200, "Response should have status 200"
+    assert response.headers["content-type"] == "application/json"
+    assert response.json() == jsonable_encoder(rosters[0].model_dump()), "Body should match FastAPI's encoding of the roster"
+    assert "Caffè Gilli".encode() in response.content
+
+
+def test_assign_jobs_deadline_returns_partial_roster():
+    with open("tests/app/routes/roster_request_florence.json", "r") as file:
+        request = json.load(file)
+    request["options"] = {"deadline_secs": 1e-9}
+    with patch.object(LocationHelpers, 'get_travel_time_minutes', return_value=20):
+        response = client.post("/assign_jobs", json=request)
+
+    assert response.status_code == 200, "Response should have status 200"
+    assert response.json()["message"] == DEADLINE_MESSAGE
+    assert len(response.json()["unassigned_jobs"]) == len(request["jobs"])
+
+
+def test_assign_jobs_warm_start():
+    with open("tests/app/routes/roster_request_florence.json", "r") as file:
+        request = json.load(file)
+    request["warm_start"] = {"hints": {"2": "103", "6": "104"}}
+    with patch.object(LocationHelpers, 'get_travel_time_minutes', return_value=20):
+        response = client.post("/assign_jobs", json=request)
+
+    assert response.status_code == 200, "Response should have status 200"
+    routes = {salesman_id: [job["job_id"] for job in jobs] for salesman_id, jobs in response.json()["jobs"].items()}
+    assert routes["103"][0] == "2", "Hinted jobs should start their salesman's route"
+    assert routes["104"][0] == "6"
+
+
+def test_client_disconnect_cancels_solve():
+    class DisconnectingRequest:
+        polls = 0
+
+        async def is_disconnected(self):
+            self.polls += 1
+            return self.polls > 2
+
+    cancel_event = threading.Event()
+    with patch.object(scheduler, "DISCONNECT_POLL_SECS", 0):
+        asyncio.run(scheduler.cancel_on_disconnect(DisconnectingRequest(), cancel_event))
+    assert cancel_event.is_set()
+
+
+def test_assign_jobs_returns_429_when_solver_busy():
+    with open("tests/app/routes/roster_request_florence.json", "r") as file:
+        request = json.load(file)
+    with patch.object(solver_pool, 'run', side_effect=SolverPoolSaturated("Solver is busy, try again later")):
+        response = client.post("/assign_jobs", json=request)
+
+    assert response.status_code == 429, "Response should have status 429 when the solver is saturated"
+    assert response.headers["retry-after"] == "1"
+
+
+def test_contact_us_queues_email(tmp_path):
+    outbox = EmailOutbox(str(tmp_path / "outbox.sqlite3"))
+    request = {"name": "Ada", "email": "ada@example.com", "phoneNumber": "123", "message": "Hello"}
+    with patch.object(scheduler, 'SENDGRID_API_KEY', "key"), \
+         patch.object(scheduler, 'SENDGRID_EMAIL_ADDRESS', "team@example.com"), \
+         patch.object(scheduler, 'email_outbox', outbox):
+        response = client.post("/contact_us", json=request)
+
+    assert response.status_code == 200, "Response should have status 200"
+    assert response.json() == {"message": "Email queued for delivery"}
+    assert outbox.count() == 1, "Email should be waiting in the outbox"
@@ -0,0 +1,37 @@
+import pytest
+from app.services.address_keys import TrigramIndex, address_key
+
+
+@pytest.mark.parametrize("address, expected", [
+    ("2 Bass St", "2 bass st"),
+    (" 2 bass st, ", "2 bass st"),
+    ("2 Bass Street", "2 bass st"),
+    ("2 Bass St.", "2 bass st"),
+    ("P.zza della Signoria 10", "piazza della signoria 10"),
+    ("Via de' Tornabuoni 3, Florence", "via de tornabuoni 3 florence"),
+    ("C/ MIGUEL SERVET, 18-8ª, VALENCIA, ESPAÑA", "calle miguel servet 18 8 valencia espana"),
+    ("Plaza Mayor 1, Madrid", "plaza mayor 1 madrid"),
+])
+def test_address_key(address, expected):
+    assert address_key(address) == expected
+
+
+@pytest.mark.parametrize("spellings", [
+    ["2 Bass Place", "2 Bass Pl", "2 Bass Pl."],
+    ["Avenida de Francia 3", "Avda. de Francia 3", "Avda de Francia 3", "Av. de Francia 3", "Av de Francia 3"],
+    ["5 Park Avenue", "5 Park Ave", "5 Park Ave.", "5 Park Av."],
+])
+def test_spellings_of_a_word_share_a_key(spellings):
+    assert len({address_key(spelling) for spelling in spellings}) == 1
+
+
+def test_trigram_index_closest():
+    index = TrigramIndex(threshold=0.7)
+    for address in ["Via dei Calzaiuoli 45, Florence", "Via dei Servi 14, Florence", "2 Bass St"]:
+        index.add(address_key(address))
+
+    assert len(index) == 3
+    assert index.closest(address_key("Via dei Calzaioli 45, Florence")) == "via dei calzaiuoli 45 florence"
+    assert index.closest(address_key("Via dei Servi 41, Florence")) is None, "Numbers must match"
+    assert index.closest(address_key("12 Bass St")) is None
+    assert index.closest(address_key("Piazza Santa Croce 7")) is None
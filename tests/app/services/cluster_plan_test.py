@@ -0,0 +1,76 @@
+from datetime import datetime
+import numpy as np
+import pytest
+from unittest.mock import patch
+from app.models.job import Job
+from app.models.location import Location
+from app.models.salesman import Salesman
+from app.models.solver_options import SolverOptions
+from app.services import cluster_plan
+from app.services.cluster_plan import ClusterPlan, get_nearest_neighbour_tour
+from app.services.job_assignment import assign_jobs, order_by_urgency
+
+
+def test_cluster_plan_travel_matches_locations(make_instance):
+    jobs, _ = make_instance(seed=20, n_jobs=30)
+    plan = ClusterPlan(jobs)
+
+    for i, a in enumerate(jobs):
+        for j, b in enumerate(jobs):
+            if i != j:
+                assert plan.travel_secs[i, j] == a.location.travel_time_to(b.location).total_seconds()
+
+
+def test_nearest_neighbour_tour():
+    # Stops on a line, out of order
+    positions = np.array([0, 7, 3, 1, 9, 4])
+    distances = np.abs(positions[:, None] - positions[None, :])
+
+    tour = get_nearest_neighbour_tour(distances)
+
+    assert positions[tour].tolist() == [0, 1, 3, 4, 7, 9]
+
+
+def test_tour_starts_at_most_urgent_job(make_instance):
+    jobs, _ = make_instance(seed=21, n_jobs=40)
+    plan = ClusterPlan(order_by_urgency(jobs))
+
+    assert plan.tour[0] == 0
+    assert sorted(plan.tour.tolist()) == list(range(40)), "The tour should visit every job once"
+
+
+def test_assign_jobs_along_tour():
+    salesman = Salesman(
+        salesman_id="101",
+        location=Location(latitude=43.7700, longitude=11.2500),
+        start_time=datetime(2025, 2, 5, 9, 0, 0),
+        end_time=datetime(2025, 2, 5, 17, 0, 0),
+    )
+    # Jobs on a line heading east; urgency order zig-zags along it
+    longitudes = [11.2500, 11.2530, 11.2510, 11.2540, 11.2520]
+    durations = [60, 15, 50, 20, 40]
+    jobs = [
+        Job(
+            job_id=str(i + 1),
+            date=datetime(2025, 2, 5),
+            location=Location(latitude=43.7700, longitude=longitude),
+            duration_mins=duration,
+            entry_time=datetime(2025, 2, 5, 9, 0, 0),
+            exit_time=datetime(2025, 2, 5, 17, 0, 0),
+        )
+        for i, (longitude, duration) in enumerate(zip(longitudes, durations))
+    ]
+
+    roster = assign_jobs(jobs, [salesman], SolverOptions(job_selection="tour", n_clusters=1))
+
+    assert [job.job_id for job in roster.jobs["101"]] == ["1", "3", "5", "2", "4"], "Jobs should be visited along the line"
+
+
+@pytest.mark.parametrize("max_planned_jobs", [cluster_plan.MAX_PLANNED_CLUSTER_JOBS, 10])
+def test_assign_jobs_along_tour_roster_is_valid(max_planned_jobs, make_instance, assert_valid_roster):
+    with patch.object(cluster_plan, "MAX_PLANNED_CLUSTER_JOBS", max_planned_jobs):
+        for seed in range(3):
+            jobs, salesmen = make_instance(seed=seed)
+            roster = assign_jobs(jobs, salesmen, SolverOptions(job_selection="tour"))
+            assert_valid_roster(roster, jobs, salesmen)
+            assert sum(len(route) for route in roster.jobs.values()) > 0
@@ -0,0 +1,146 @@
+import json
+import random
+import threading
+import time
+from datetime import datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+import pytest
+from app.models.job import Job
+from app.models.location import Location
+from app.models.salesman import Salesman
+
+
+@pytest.fixture
+def make_instance():
+    """Factory for random but reproducible roster requests around Florence."""
+    def make_instance(seed, n_jobs=60, n_salesmen=4):
+        rng = random.Random(seed)
+        day = datetime(2025, 2, 5)
+        jobs = []
+        for i in range(n_jobs):
+            entry_time = day + timedelta(hours=8, minutes=rng.randrange(0, 8 * 60, 5))
+            jobs.append(Job(
+                job_id=str(i),
+                date=day,
+                location=Location(latitude=43.77 + rng.uniform(-0.01, 0.01), longitude=11.25 + rng.uniform(-0.01, 0.01)),
+                duration_mins=rng.choice([30, 45, 60, 90, 120]),
+                entry_time=entry_time,
+                exit_time=entry_time + timedelta(minutes=rng.randrange(60, 8 * 60, 5)),
+            ))
+        salesmen = [
+            Salesman(
+                salesman_id=str(100 + i),
+                location=Location(latitude=43.77 + rng.uniform(-0.01, 0.01), longitude=11.25 + rng.uniform(-0.01, 0.01)),
+                start_time=day + timedelta(hours=8, minutes=rng.randrange(0, 120, 15)),
+                end_time=day + timedelta(hours=18),
+            )
+            for i in range(n_salesmen)
+        ]
+        return jobs, salesmen
+
+    return make_instance
+
+
+@pytest.fixture
+def assert_valid_roster():
+    """Checker that every route in a roster respects time windows, travel and working hours."""
+
+    def assert_valid_roster(roster, jobs, salesmen):
+        salesmen_by_id = {salesman.salesman_id: salesman for salesman in salesmen}
+        assigned_ids = [job.job_id for route in roster.jobs.values() for job in route]
+        unassigned_ids = [job.job_id for job in roster.unassigned_jobs]
+        assert sorted(assigned_ids + unassigned_ids) == sorted(job.job_id for job in jobs), "Every job should appear exactly once"
+
+        for salesman_id, route in roster.jobs.items():
+            salesman = salesmen_by_id[salesman_id]
+            for previous, job in zip([None] + route, route):
+                assert job.salesman_id == salesman_id
+                assert job.entry_time <= job.start_time, f"Job {job.job_id} should not start before its entry time"
+                finish = job.start_time + timedelta(minutes=job.duration_mins)
+                assert finish <= job.exit_time, f"Job {job.job_id} should finish before its exit time"
+                assert finish <= salesman.end_time, f"Job {job.job_id} should finish before salesman {salesman_id} ends"
+                if previous is not None:
+                    previous_finish = previous.start_time + timedelta(minutes=previous.duration_mins)
+                    travel = previous.location.travel_time_to(job.location)
+                    assert previous_finish + travel <= job.start_time, f"Salesman {salesman_id} can't reach job {job.job_id} in time"
+            if route:
+                last_finish = route[-1].start_time + timedelta(minutes=route[-1].duration_mins)
+                assert last_finish - route[0].start_time <= timedelta(minutes=salesman.max_workday_mins)
+
+    return assert_valid_roster
+
+
+class FakeGeocoder:
+    """Local stand-in for the Google geocoding API, answering for the addresses in locations."""
+
+    def __init__(self, locations):
+        self.locations = locations
+        self.requested = []
+        self.statuses = []
+        # Error statuses Google puts in the body of a 200 response, e.g. OVER_QUERY_LIMIT
+        self.api_statuses = []
+        self.connections = set()
+        self.delay_secs = 0
+        geocoder = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                address = parse_qs(urlparse(self.path).query)["address"][0]
+                geocoder.requested.append(address)
+                geocoder.connections.add(self.client_address)
+                time.sleep(geocoder.delay_secs)
+                status = geocoder.statuses.pop(0) if geocoder.statuses else 200
+                if status != 200:
+                    body = b"{}"
+                elif geocoder.api_statuses:
+                    body = json.dumps({"results": [], "status": geocoder.api_statuses.pop(0)}).encode()
+                elif address in geocoder.locations:
+                    lat, lng, formatted_address = geocoder.locations[address]
+                    body = json.dumps({"results": [{
+                        "geometry": {"location": {"lat": lat, "lng": lng}},
+                        "formatted_address": formatted_address,
+                    }], "status": "OK"}).encode()
+                else:
+                    body = json.dumps({"results": [], "status": "ZERO_RESULTS"}).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}/maps/api/geocode/json"
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+@pytest.fixture
+def fake_geocoder(monkeypatch):
+    """Factory for a FakeGeocoder that LocationHelpers calls instead of Google, with an empty location cache."""
+    from app.services.location_helpers import LocationHelpers
+
+    geocoders = []
+
+    def fake_geocoder(locations, cache_file_path):
+        geocoder = FakeGeocoder(locations)
+        geocoders.append(geocoder)
+        monkeypatch.setenv("GOOGLE_MAPS_API_KEY", "test-key")
+        monkeypatch.setattr(LocationHelpers, "geocode_url", geocoder.url)
+        monkeypatch.setattr(LocationHelpers, "cache_file_path", str(cache_file_path))
+        monkeypatch.setattr(LocationHelpers, "locationCache", {})
+        monkeypatch.setattr(LocationHelpers, "keyIndex", {})
+        monkeypatch.setattr(LocationHelpers, "negativeCache", {})
+        return geocoder
+
+    yield fake_geocoder
+    for geocoder in geocoders:
+        geocoder.close()
@@ -0,0 +1,130 @@
+import pickle
+import threading
+import time
+import pytest
+from unittest.mock import patch
+from app.models.roster_response import RosterResponse
+from app.models.solver_options import SolverOptions
+from app.services.deadline import CANCEL_CHECK_SECS, DEADLINE_MESSAGE, Deadline, cap_deadline
+from app.services.engines import run_engine
+from app.services.solver import solve
+
+
+def cancel_after_assignments(n):
+    """Patch that sets the returned event once n jobs have been assigned."""
+    cancel_event = threading.Event()
+    assign = RosterResponse.assign_job_to_salesman
+    calls = []
+
+    def assign_and_count(roster, *args):
+        assign(roster, *args)
+        calls.append(args)
+        if len(calls) == n:
+            cancel_event.set()
+
+    return cancel_event, patch.object(RosterResponse, "assign_job_to_salesman", assign_and_count)
+
+
+@pytest.mark.parametrize("engine", ["greedy", "round_robin"])
+def test_cancelled_solve_returns_partial_roster(engine, make_instance, assert_valid_roster):
+    jobs, salesmen = make_instance(seed=13, n_jobs=40)
+    cancel_event, counting = cancel_after_assignments(3)
+
+    with counting:
+        roster = run_engine(jobs, salesmen, SolverOptions(engine=engine), Deadline(cancel_event=cancel_event))
+
+    assert_valid_roster(roster, jobs, salesmen)
+    assert sum(len(route) for route in roster.jobs.values()) == 3, "Assignment should stop once cancelled"
+    assert len(roster.unassigned_jobs) == 37
+    assert roster.message == DEADLINE_MESSAGE
+
+
+@pytest.mark.parametrize("options", [
+    SolverOptions(deadline_secs=1e-9),
+    SolverOptions(deadline_secs=1e-9, engine="exact"),
+    SolverOptions(deadline_secs=1e-9, multi_start=8),
+])
+def test_expired_deadline(options, make_instance):
+    jobs, salesmen = make_instance(seed=14, n_jobs=30)
+
+    roster = solve(jobs, salesmen, options)
+
+    assert roster.message == DEADLINE_MESSAGE
+    assert len(roster.unassigned_jobs) == 30
+
+
+def test_solve_finishing_in_time_is_not_flagged(make_instance):
+    roster = solve(*make_instance(seed=14, n_jobs=30), SolverOptions(deadline_secs=60))
+    assert roster.message != DEADLINE_MESSAGE
+
+
+def test_deadline_sent_to_processes_keeps_time_only():
+    deadline = Deadline(60, threading.Event())
+
+    copy = pickle.loads(pickle.dumps(deadline))
+
+    assert copy.at == deadline.at
+    assert copy.cancel_event is None, "A threading.Event can't cancel a solve in another process"
+    assert deadline.cancel_event is not None
+
+
+def test_cap_deadline_keeps_the_sooner_time_and_cancel_event():
+    cancel_event = threading.Event()
+    assert cap_deadline(Deadline(60, cancel_event), 1).remaining_secs() == pytest.approx(1, abs=0.1)
+    assert cap_deadline(Deadline(1), 60).remaining_secs() == pytest.approx(1, abs=0.1)
+    assert cap_deadline(None, 1).remaining_secs() == pytest.approx(1, abs=0.1)
+
+    capped = cap_deadline(Deadline(cancel_event=cancel_event), 60)
+    cancel_event.set()
+    assert capped.expired(), "Cancelling the solve should stop the capped deadline too"
+
+
+def cancel_once_solved():
+    """Patch that sets the returned event as the engine lists the jobs left unassigned, once it has finished."""
+    cancel_event = threading.Event()
+    init = RosterResponse.__init__
+
+    class UnassignedJobs(list):
+        def extend(self, jobs):
+            super().extend(jobs)
+            cancel_event.set()
+
+    def init_and_watch(roster, **kwargs):
+        init(roster, **kwargs)
+        roster.unassigned_jobs = UnassignedJobs()
+
+    return cancel_event, patch.object(RosterResponse, "__init__", init_and_watch)
+
+
+@pytest.mark.parametrize("engine", ["greedy", "round_robin", "regret"])
+def test_deadline_passing_after_the_solve_finishes_is_not_flagged(engine, make_instance):
+    jobs, salesmen = make_instance(seed=13, n_jobs=80, n_salesmen=2)
+    cancel_event, watching = cancel_once_solved()
+
+    with watching:
+        roster = run_engine(jobs, salesmen, SolverOptions(engine=engine), Deadline(cancel_event=cancel_event))
+
+    assert cancel_event.is_set() and roster.unassigned_jobs, "The instance should leave jobs unassigned"
+    assert roster.message != DEADLINE_MESSAGE, "The solve finished before the deadline passed"
+
+
+def test_manager_events_are_checked_now_and_then():
+    class ManagerEvent:
+        checks = 0
+        value = False
+
+        def is_set(self):
+            self.checks += 1
+            return self.value
+
+    cancel_event = ManagerEvent()
+    deadline = Deadline(cancel_event=cancel_event)
+
+    assert not any(deadline.expired() for _ in range(1000))
+    assert cancel_event.checks < 10, "Each check is a round trip to the manager process"
+    cancel_event.value = True
+    time.sleep(CANCEL_CHECK_SECS)
+    assert deadline.expired()
+    checks = cancel_event.checks
+    assert all(deadline.expired() for _ in range(1000))
+    assert cancel_event.checks == checks, "Once set, a cancel event shouldn't be checked again"
@@ -0,0 +1,184 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import pytest
+from sendgrid import SendGridAPIClient
+from app.models.contact_us_request import ContactUsRequest
+from app.services.email_outbox import EmailOutbox, OutboxSender
+
+
+class FakeMailApi:
+    """Local stand-in for the SendGrid mail send API."""
+
+    def __init__(self, failures=0):
+        self.received = []
+        self.failures = failures
+        api = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                body = self.rfile.read(int(self.headers["Content-Length"]))
+                if api.failures > 0:
+                    api.failures -= 1
+                    self.send_response(500)
+                else:
+                    api.received.append((self.path, json.loads(body)))
+                    self.send_response(202)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.host = f"http://127.0.0.1:{self.server.server_address[1]}"
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+@pytest.fixture
+def outbox(tmp_path):
+    return EmailOutbox(str(tmp_path / "outbox.sqlite3"), max_attempts=2, backoff_secs=0)
+
+
+def contact_request(name="Ada"):
+    return ContactUsRequest(name=name, email="ada@example.com", phoneNumber="123", message="Hello\nthere")
+
+
+def test_enqueue_is_durable(outbox):
+    outbox.enqueue(contact_request())
+
+    reopened = EmailOutbox(outbox.db_path)
+    claimed = reopened.claim(limit=10, owner="worker-1")
+    assert len(claimed) == 1, "Enqueued mail should survive reopening the outbox"
+    assert claimed[0][1] == contact_request()
+
+
+def test_claimed_mail_is_not_claimed_by_another_sender(outbox):
+    for name in ["Ada", "Bob", "Cy"]:
+        outbox.enqueue(contact_request(name))
+
+    first = outbox.claim(limit=2, owner="worker-1")
+    second = outbox.claim(limit=10, owner="worker-2")
+
+    assert [request.name for _, request in first] == ["Ada", "Bob"]
+    assert [request.name for _, request in second] == ["Cy"], "Another sender should only get the unclaimed mail"
+    assert outbox.claim(limit=10, owner="worker-3") == []
+
+
+def test_concurrent_claims_share_out_each_mail_once(outbox):
+    for i in range(50):
+        outbox.enqueue(contact_request(f"Name {i}"))
+    claimed = {owner: [] for owner in ["worker-1", "worker-2", "worker-3"]}
+
+    def drain(owner):
+        while batch := outbox.claim(limit=3, owner=owner):
+            claimed[owner].extend(row_id for row_id, _ in batch)
+
+    threads = [threading.Thread(target=drain, args=(owner,)) for owner in claimed]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    row_ids = [row_id for rows in claimed.values() for row_id in rows]
+    assert sorted(row_ids) == sorted(set(row_ids)), "No mail should be claimed twice"
+    assert len(row_ids) == 50
+
+
+def test_expired_claim_is_taken_over(tmp_path):
+    outbox = EmailOutbox(str(tmp_path / "outbox.sqlite3"), backoff_secs=0, lease_secs=0)
+    outbox.enqueue(contact_request())
+    [(row_id, _)] = outbox.claim(limit=10, owner="worker-1")
+
+    assert [claimed_id for claimed_id, _ in outbox.claim(limit=10, owner="worker-2")] == [row_id], \
+        "Mail whose lease ran out should be claimed again"
+    outbox.mark_failed(row_id, "worker-1", "timed out")
+    assert outbox.count("sending") == 1, "The sender that lost its lease shouldn't release the new claim"
+    outbox.mark_sent(row_id, "worker-2")
+    assert outbox.count("sending") == 0
+
+
+def test_sender_delivers_batch_through_mail_api(outbox):
+    api = FakeMailApi()
+    sender = OutboxSender(outbox, SendGridAPIClient("key", host=api.host), "team@example.com", batch_size=2)
+    for name in ["Ada", "Bob", "Cy"]:
+        outbox.enqueue(contact_request(name))
+
+    try:
+        assert sender.flush() == 2, "One pass should send at most batch_size emails"
+        assert sender.flush() == 1
+    finally:
+        api.close()
+
+    assert outbox.count() == 0, "Sent mail should be removed from the outbox"
+    assert [path for path, _ in api.received] == ["/v3/mail/send"] * 3
+    assert api.received[0][1]["subject"] == "Caminora Contact Us: Ada"
+
+
+def test_sender_retries_then_gives_up(outbox):
+    api = FakeMailApi(failures=3)
+    sender = OutboxSender(outbox, SendGridAPIClient("key", host=api.host), "team@example.com")
+    outbox.enqueue(contact_request("Ada"))
+    outbox.enqueue(contact_request("Bob"))
+
+    try:
+        assert sender.flush() == 0, "Both sends fail on the first pass"
+        assert outbox.count() == 2, "Failed mail should stay in the outbox for a retry"
+        assert sender.flush() == 1, "Bob is delivered on retry"
+    finally:
+        api.close()
+
+    assert outbox.count() == 0
+    assert outbox.count("failed") == 1, "Ada should be marked failed after max_attempts"
+
+
+def test_background_sender_delivers_on_wake(outbox):
+    api = FakeMailApi()
+    sender = OutboxSender(outbox, SendGridAPIClient("key", host=api.host), "team@example.com", poll_interval_secs=60)
+    sender.start()
+    try:
+        outbox.enqueue(contact_request())
+        sender.wake()
+        for _ in range(50):
+            if api.received:
+                break
+            threading.Event().wait(0.1)
+    finally:
+        sender.stop()
+        api.close()
+
+    assert len(api.received) == 1, "Waking the sender should deliver the mail without waiting for the poll"
+
+
+def test_wake_right_after_waiting_is_not_lost(outbox):
+    api = FakeMailApi()
+    sender = OutboxSender(outbox, SendGridAPIClient("key", host=api.host), "team@example.com", poll_interval_secs=60)
+
+    class WakeOnFirstWait(threading.Event):
+        waits = 0
+
+        def wait(self, timeout=None):
+            self.waits += 1
+            if self.waits == 1:
+                # Mail enqueued just as the sender stops waiting, before it goes on to flush
+                outbox.enqueue(contact_request())
+                sender.wake()
+                return True
+            return super().wait(timeout)
+
+    sender._wake = WakeOnFirstWait()
+    sender.start()
+    try:
+        for _ in range(50):
+            if api.received:
+                break
+            threading.Event().wait(0.1)
+    finally:
+        sender.stop()
+        api.close()
+
+    assert len(api.received) == 1, "A wake as the sender stops waiting should be delivered now, not at the next poll"
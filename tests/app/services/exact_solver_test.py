@@ -0,0 +1,92 @@
+import random
+import time
+from datetime import datetime, timedelta
+from itertools import combinations, permutations
+from app.models.job import Job
+from app.models.location import Location
+from app.models.salesman import Salesman
+from app.models.solver_options import SolverOptions
+from app.services.engines import run_engine
+from app.services.exact_solver import _BranchAndBound, assign_jobs_exact
+from app.services.job_assignment import assign_jobs
+from app.services.roster_metrics import roster_objective
+
+
+def test_exact_roster_is_valid_and_beats_greedy(make_instance, assert_valid_roster):
+    jobs, salesmen = make_instance(seed=0, n_jobs=12, n_salesmen=2)
+    greedy = assign_jobs(*make_instance(seed=0, n_jobs=12, n_salesmen=2))
+
+    roster = assign_jobs_exact(jobs, salesmen)
+
+    assert_valid_roster(roster, jobs, salesmen)
+    assert roster_objective(roster) > roster_objective(greedy), "The search should improve on the greedy roster"
+    assert len(roster.unassigned_jobs) == 1
+
+
+def test_exact_time_limit_falls_back_to_greedy(make_instance, assert_valid_roster):
+    jobs, salesmen = make_instance(seed=1, n_jobs=40, n_salesmen=5)
+    greedy = assign_jobs(*make_instance(seed=1, n_jobs=40, n_salesmen=5))
+
+    roster = assign_jobs_exact(jobs, salesmen, SolverOptions(exact_time_limit_secs=0.001))
+
+    assert_valid_roster(roster, jobs, salesmen)
+    assert roster_objective(roster) >= roster_objective(greedy), "The exact engine should never be worse than the greedy"
+
+
+def test_auto_engine_picks_exact_for_small_requests(make_instance):
+    options = SolverOptions(engine="auto")
+
+    small = run_engine(*make_instance(seed=2, n_jobs=12, n_salesmen=2), options)
+    large = run_engine(*make_instance(seed=2, n_jobs=41, n_salesmen=2), options)
+
+    assert roster_objective(small) == roster_objective(assign_jobs_exact(*make_instance(seed=2, n_jobs=12, n_salesmen=2)))
+    assert roster_objective(large) == roster_objective(assign_jobs(*make_instance(seed=2, n_jobs=41, n_salesmen=2)))
+
+
+def make_single_salesman_instance(seed):
+    """A few jobs with tight windows for one salesman, so the best route often leaves idle gaps."""
+    rng = random.Random(seed)
+    day = datetime(2025, 2, 5)
+    jobs = []
+    for i in range(rng.randint(3, 6)):
+        entry_time = day + timedelta(hours=9, minutes=rng.randrange(0, 6 * 60, 15))
+        duration_mins = rng.choice([30, 60, 90, 120])
+        jobs.append(Job(
+            job_id=str(i),
+            date=day,
+            location=Location(latitude=43.77 + rng.uniform(-0.02, 0.02), longitude=11.25 + rng.uniform(-0.02, 0.02)),
+            duration_mins=duration_mins,
+            entry_time=entry_time,
+            exit_time=entry_time + timedelta(minutes=duration_mins + rng.randrange(0, 120, 15)),
+        ))
+    salesman = Salesman(
+        salesman_id="100",
+        location=Location(latitude=43.77, longitude=11.25),
+        start_time=day + timedelta(hours=9),
+        end_time=day + timedelta(hours=17),
+        max_workday_mins=rng.choice([4 * 60, 6 * 60, 8 * 60]),
+    )
+    return jobs, salesman
+
+
+def best_score_by_brute_force(search):
+    """Best (jobs, minutes, -travel) over every ordering of every subset of the jobs, for one salesman."""
+    best = (0, 0, 0)
+    rows = range(len(search.table))
+    for size in range(1, len(rows) + 1):
+        for subset in combinations(rows, size):
+            for route in permutations(subset):
+                evaluation = search._evaluate(0, list(route))
+                if evaluation:
+                    best = max(best, (size, sum(search.duration[row] for row in route), -evaluation[0]))
+    return best
+
+
+def test_exact_search_finds_the_brute_force_optimum():
+    for seed in range(400):
+        jobs, salesman = make_single_salesman_instance(seed)
+        search = _BranchAndBound(jobs, [salesman])
+        search.run(time.monotonic() + 60)
+
+        assert search.finished
+        assert search.best_score == best_score_by_brute_force(search), f"Seed {seed}: the search should find the optimum"
@@ -0,0 +1,67 @@
+import json
+from unittest.mock import patch
+from app.services.geocode_warmup import main, read_addresses
+from app.services.location_helpers import LocationHelpers
+
+COLOSSEO = (41.89, 12.4943, "Piazza del Colosseo, 1, 00184 Roma RM, Italy")
+BASS_ST = (-33.808, 151.0591, "2 Bass Street, Ermington NSW 2115, Australia")
+SIGNORIA = (43.7696, 11.2558, "Piazza della Signoria, 10, 50122 Firenze FI, Italy")
+
+
+def write_inputs(tmp_path):
+    addresses = tmp_path / "addresses.txt"
+    addresses.write_text("Piazza del Colosseo, 1\n2 Bass St\n 2 bass street, \n\nNowhere 99\n")
+    requests = tmp_path / "requests.jsonl"
+    requests.write_text(json.dumps({
+        "jobs": [
+            {"job_id": "1", "location": {"address": "Piazza della Signoria 10"}},
+            {"job_id": "2", "location": {"latitude": 43.77, "longitude": 11.25, "address": "Via Roma 1"}},
+        ],
+        "salesmen": [{"salesman_id": "1", "location": {"address": "2 Bass St"}}],
+    }) + "\n")
+    return [str(addresses), str(requests)]
+
+
+def test_read_addresses_from_text_and_requests(tmp_path):
+    addresses = list(read_addresses(write_inputs(tmp_path)))
+
+    assert addresses == [
+        "Piazza del Colosseo, 1", "2 Bass St", "2 bass street,", "Nowhere 99",
+        "Piazza della Signoria 10", "2 Bass St",
+    ], "Jobs with coordinates shouldn't be geocoded"
+
+
+def test_warm_up_geocodes_each_uncached_address_once(tmp_path, fake_geocoder, capsys):
+    cache_file = tmp_path / "locationCache.json"
+    geocoder = fake_geocoder({"2 Bass St": BASS_ST, "Piazza della Signoria 10": SIGNORIA}, cache_file)
+    cached = {"Piazza del Colosseo, 1": {"latitude": COLOSSEO[0], "longitude": COLOSSEO[1], "address": COLOSSEO[2]}}
+    cache_file.write_text(json.dumps(cached))
+
+    with patch.object(LocationHelpers, "add_results_to_cache", wraps=LocationHelpers.add_results_to_cache) as add:
+        status = main(write_inputs(tmp_path) + ["--cache-file", str(cache_file), "--rate", "100"])
+
+    assert sorted(geocoder.requested) == ["2 Bass St", "Nowhere 99", "Piazza della Signoria 10"]
+    assert add.call_count == 1, "Results should be written to the cache in one go"
+    saved = json.loads(cache_file.read_text())
+    assert list(saved) == ["Piazza del Colosseo, 1", "2 Bass St", "Piazza della Signoria 10"]
+    assert saved["2 Bass St"] == {"latitude": BASS_ST[0], "longitude": BASS_ST[1], "address": BASS_ST[2]}
+    assert LocationHelpers.get_coordinates_from_cache("2 Bass Street") == saved["2 Bass St"]
+
+    assert status == 1, "The warm-up should fail when an address couldn't be geocoded"
+    output = capsys.readouterr()
+    assert output.err.startswith("Couldn't geocode Nowhere 99")
+    assert "Read 6 addresses, 3 not cached, 2 geocoded" in output.out
+
+
+def test_warm_up_uses_base_url(tmp_path, fake_geocoder):
+    cache_file = tmp_path / "locationCache.json"
+    geocoder = fake_geocoder({"2 Bass St": BASS_ST}, cache_file)
+    LocationHelpers.geocode_url = "http://127.0.0.1:9/unreachable"
+    addresses = tmp_path / "addresses.txt"
+    addresses.write_text("2 Bass St\n")
+
+    status = main([str(addresses), "--base-url", geocoder.url, "--cache-file", str(cache_file)])
+
+    assert geocoder.requested == ["2 Bass St"]
+    assert "2 Bass St" in json.loads(cache_file.read_text())
+    assert status == 0
@@ -0,0 +1,144 @@
+import time
+import pytest
+import requests
+from app.services import location_helpers
+from app.services.address_keys import address_key
+from app.services.geocoding_client import CircuitOpenError, GeocodingClient, GeocodingError, TokenBucket
+from app.services.location_helpers import LocationHelpers
+
+BASS_ST = (-33.808, 151.0591, "2 Bass Street, Ermington NSW 2115, Australia")
+
+
+@pytest.fixture
+def geocoder(tmp_path, fake_geocoder):
+    return fake_geocoder({"2 Bass St": BASS_ST}, tmp_path / "locationCache.json")
+
+
+def make_client(**kwargs):
+    return GeocodingClient(**{"backoff_secs": 0, "rate_per_sec": 1000, **kwargs})
+
+
+def test_connections_are_kept_alive(geocoder):
+    client = make_client()
+    for _ in range(3):
+        data = client.get_json(geocoder.url, {"address": "2 Bass St"})
+        assert data["results"][0]["formatted_address"] == BASS_ST[2]
+
+    assert len(geocoder.connections) == 1, "Requests should reuse one pooled connection"
+    assert client.metrics()["requests"] == 3
+
+
+def test_retries_429_and_5xx(geocoder):
+    geocoder.statuses = [429, 503]
+    client = make_client(max_retries=2)
+
+    data = client.get_json(geocoder.url, {"address": "2 Bass St"})
+
+    assert data["status"] == "OK"
+    metrics = client.metrics()
+    assert (metrics["requests"], metrics["retries"], metrics["failures"]) == (3, 2, 0)
+    assert metrics["latency_p50_ms"] > 0
+
+
+def test_gives_up_after_max_retries(geocoder):
+    geocoder.statuses = [500, 500, 500]
+    client = make_client(max_retries=1)
+
+    with pytest.raises(requests.HTTPError):
+        client.get_json(geocoder.url, {"address": "2 Bass St"})
+    assert len(geocoder.requested) == 2
+    assert client.metrics()["failures"] == 1
+
+
+def test_client_errors_are_not_retried(geocoder):
+    geocoder.statuses = [400]
+    client = make_client(max_retries=3, failure_threshold=1)
+
+    with pytest.raises(requests.HTTPError):
+        client.get_json(geocoder.url, {"address": "2 Bass St"})
+    assert len(geocoder.requested) == 1
+    assert client.circuit_breaker.state == "closed", "A bad request doesn't mean the API is down"
+
+
+def test_retries_error_statuses_in_the_body(geocoder):
+    geocoder.api_statuses = ["OVER_QUERY_LIMIT", "UNKNOWN_ERROR"]
+    client = make_client(max_retries=2)
+
+    assert client.get_json(geocoder.url, {"address": "2 Bass St"})["status"] == "OK"
+    assert len(geocoder.requested) == 3, "OVER_QUERY_LIMIT and UNKNOWN_ERROR come back as 200s but should be retried"
+
+
+def test_error_statuses_in_the_body_open_the_circuit(geocoder):
+    geocoder.api_statuses = ["OVER_QUERY_LIMIT"] * 4
+    client = make_client(max_retries=1, failure_threshold=2)
+
+    for _ in range(2):
+        with pytest.raises(GeocodingError):
+            client.get_json(geocoder.url, {"address": "2 Bass St"})
+    assert client.circuit_breaker.state == "open"
+    assert client.metrics()["failures"] == 2
+
+
+def test_request_denied_is_not_retried(geocoder):
+    geocoder.api_statuses = ["REQUEST_DENIED"]
+    client = make_client(max_retries=3, failure_threshold=1)
+
+    assert client.get_json(geocoder.url, {"address": "2 Bass St"})["status"] == "REQUEST_DENIED"
+    assert len(geocoder.requested) == 1
+    assert client.circuit_breaker.state == "closed", "A bad key doesn't mean the API is down"
+
+
+def test_slow_responses_time_out(geocoder):
+    geocoder.delay_secs = 0.5
+    client = make_client(timeout_secs=0.1, max_retries=0)
+
+    with pytest.raises(requests.Timeout):
+        client.get_json(geocoder.url, {"address": "2 Bass St"})
+
+
+def test_circuit_breaker_opens_and_recovers(geocoder):
+    geocoder.statuses = [503, 503]
+    client = make_client(max_retries=0, failure_threshold=2, reset_timeout_secs=0.2)
+
+    for _ in range(2):
+        with pytest.raises(requests.HTTPError):
+            client.get_json(geocoder.url, {"address": "2 Bass St"})
+    with pytest.raises(CircuitOpenError):
+        client.get_json(geocoder.url, {"address": "2 Bass St"})
+    assert len(geocoder.requested) == 2, "An open circuit shouldn't call the API"
+    assert client.metrics()["circuit"] == "open"
+
+    time.sleep(0.2)
+    assert client.circuit_breaker.state == "half_open"
+    assert client.get_json(geocoder.url, {"address": "2 Bass St"})["status"] == "OK"
+    assert client.circuit_breaker.state == "closed"
+    assert client.metrics()["rejected"] == 1
+
+
+def test_token_bucket_limits_rate():
+    bucket = TokenBucket(rate_per_sec=50, capacity=2)
+    start = time.monotonic()
+    for _ in range(7):
+        bucket.acquire()
+    assert time.monotonic() - start >= 0.09, "Calls beyond the burst should be spaced out"
+
+
+def test_location_helpers_geocode_through_client(geocoder):
+    assert LocationHelpers.get_coordinates_from_address("2 Bass St") == {
+        "latitude": BASS_ST[0], "longitude": BASS_ST[1], "address": BASS_ST[2],
+    }
+    assert geocoder.requested == ["2 Bass St"]
+
+
+def test_only_zero_results_are_negatively_cached(geocoder, monkeypatch):
+    monkeypatch.setattr(location_helpers, "geocoding_client", make_client(max_retries=0))
+    geocoder.api_statuses = ["OVER_QUERY_LIMIT"]
+
+    with pytest.raises(GeocodingError):
+        LocationHelpers.get_coordinates_from_address("2 Bass St")
+    assert LocationHelpers.negativeCache == {}, "A quota error says nothing about the address"
+    assert LocationHelpers.get_coordinates_from_address("2 Bass St")["address"] == BASS_ST[2]
+
+    with pytest.raises(ValueError):
+        LocationHelpers.get_coordinates_from_address("1 Nowhere St")
+    assert list(LocationHelpers.negativeCache) == [address_key("1 Nowhere St")]
@@ -1,8 +1,15 @@
 from datetime import datetime, timedelta
+import numpy as np
+import pytest
 from app.models.job import Job
 from app.models.salesman import Salesman
 from app.models.location import Location
-from app.services.job_assignment import assign_jobs
+from app.models.solver_options import SolverOptions
+from app.models.roster_response import RosterResponse
+from app.services.job_assignment import (
+    assign_jobs, find_first_job, get_arrival_time_if_possible, get_arrival_times_if_possible, job_starts_after_salesman, order_by_urgency
+)
+from app.services.job_table import JobTable
 from unittest.mock import patch
 from app.services.location_helpers import LocationHelpers
 
@@ -239,7 +246,7 @@ def test_assign_jobs_accounts_for_travel_time():
     assert salesman.time_worked_mins == 235, "Salesman should finish at 13:25"
 
 
-def test_assign_jobs_accounts_for_travel_time_and_entry_time():
+def make_staggered_entry_request():
     # One salesman available 9-5
     salesman = Salesman(
         salesman_id="101",
@@ -276,10 +283,35 @@ def test_assign_jobs_accounts_for_travel_time_and_entry_time():
             exit_time=datetime(2025, 2, 5, 17, 0, 0),
         ),
     ]
+    return jobs, salesman
+
+
+def test_assign_jobs_accounts_for_travel_time_and_entry_time():
+    jobs, salesman = make_staggered_entry_request()
 
     with patch.object(LocationHelpers, 'get_travel_time_minutes', return_value=20):
         roster = assign_jobs(jobs, [salesman])
 
+    job_ids = [job.job_id for job in roster.jobs["101"]]
+    assert job_ids == ["1", "3", "2"], "Job 1 opens first so it should be assigned first"
+
+    start_times = [job.start_time for job in roster.jobs["101"]]
+    assert len(start_times) == 3, "3 jobs should be assigned"
+
+    first_start_time = datetime(2025, 2, 5, 9, 5, 0)
+    assert start_times[0] == first_start_time, "Job 1 should start exactly at its entry_time (9:05)"
+    assert start_times[1] == start_times[0] + timedelta(minutes=60 + 20), "Job 3 should start 1:20h later (60 duration + 20 travel time)"
+    assert start_times[2] == start_times[1] + timedelta(minutes=90 + 20), "Job 2 should start 1:50h later (90 duration + 20 travel time)"
+    assert salesman.current_time == datetime(2025, 2, 5, 13, 0, 0), "Salesman should finish at 13:00 (45 min after job 2 starts)"
+    assert salesman.time_worked_mins == 235, "Salesman should have worked 235 minutes, from 9:05 to 13:00"
+
+
+def test_assign_jobs_fixed_step_wait():
+    jobs, salesman = make_staggered_entry_request()
+
+    with patch.object(LocationHelpers, 'get_travel_time_minutes', return_value=20):
+        roster = assign_jobs(jobs, [salesman], SolverOptions(wait_mins=15))
+
     job_ids = [job.job_id for job in roster.jobs["101"]]
     assert job_ids == ["3", "1", "2"], "All jobs should be assigned in order"
 
@@ -292,3 +324,151 @@ def test_assign_jobs_accounts_for_travel_time_and_entry_time():
     assert str(start_times[2]) == str(start_times[1] + timedelta(minutes=60) + timedelta(minutes=20)), "Job 3 should start 1:20h later (45 duration + 20 travel time)"
     assert str(salesman.current_time) == str(start_times[2] + timedelta(minutes=45)), "Salesman should finish 1:30h later (90 duration)"
     assert salesman.time_worked_mins == 235, "Salesman should finish at 13:35"
+
+
+@pytest.mark.parametrize("vectorized", [False, True])
+def test_assign_jobs_nearest_job_selection(vectorized):
+    salesman = Salesman(
+        salesman_id="101",
+        location=Location(latitude=43.7700, longitude=11.2500),
+        start_time=datetime(2025, 2, 5, 9, 0, 0),
+        end_time=datetime(2025, 2, 5, 17, 0, 0),
+    )
+
+    # Jobs on a line heading east; urgency order zig-zags along it
+    longitudes = [11.2500, 11.2530, 11.2510, 11.2540, 11.2520]
+    durations = [60, 15, 50, 20, 40]
+    jobs = [
+        Job(
+            job_id=str(i + 1),
+            date=datetime(2025, 2, 5),
+            location=Location(latitude=43.7700, longitude=longitude),
+            duration_mins=duration,
+            entry_time=datetime(2025, 2, 5, 9, 0, 0),
+            exit_time=datetime(2025, 2, 5, 17, 0, 0),
+        )
+        for i, (longitude, duration) in enumerate(zip(longitudes, durations))
+    ]
+
+    def single_cluster(jobs, n_clusters):
+        for job in jobs:
+            job.cluster = 0
+
+    with patch('app.services.job_assignment.cluster_jobs', side_effect=single_cluster):
+        roster = assign_jobs(jobs, [salesman], SolverOptions(job_selection="nearest", vectorized=vectorized))
+
+    job_ids = [job.job_id for job in roster.jobs["101"]]
+    assert job_ids == ["1", "3", "5", "2", "4"], "Jobs should be visited nearest first after the most urgent one"
+
+
+@pytest.mark.parametrize("vectorized", [False, True])
+def test_assign_jobs_nearest_clusters_starts_near_home(vectorized):
+    salesman = Salesman(
+        salesman_id="101",
+        location=Location(latitude=43.7700, longitude=11.2000),
+        start_time=datetime(2025, 2, 5, 9, 0, 0),
+        end_time=datetime(2025, 2, 5, 17, 0, 0),
+    )
+
+    # Two jobs near the salesman's home in the west and two across town in the east, which are more urgent
+    longitudes = [11.2000, 11.2010, 11.3000, 11.3010]
+    durations = [30, 30, 60, 60]
+
+    def make_jobs():
+        return [
+            Job(
+                job_id=str(i + 1),
+                date=datetime(2025, 2, 5),
+                location=Location(latitude=43.7700, longitude=longitude),
+                duration_mins=duration,
+                entry_time=datetime(2025, 2, 5, 9, 0, 0),
+                exit_time=datetime(2025, 2, 5, 17, 0, 0),
+            )
+            for i, (longitude, duration) in enumerate(zip(longitudes, durations))
+        ]
+
+    options = SolverOptions(n_clusters=2, vectorized=vectorized)
+    anywhere = assign_jobs(make_jobs(), [salesman.model_copy()], options)
+    near_home = assign_jobs(make_jobs(), [salesman.model_copy()], options.model_copy(update={"nearest_clusters": 1}))
+
+    assert [job.job_id for job in anywhere.jobs["101"]] == ["3", "4", "1", "2"], "Pre assertion - the most urgent jobs come first"
+    assert [job.job_id for job in near_home.jobs["101"]] == ["1", "2", "3", "4"], "Jobs near home should come first, then those further out"
+
+
+def test_assign_jobs_nearest_clusters_roster_is_valid(make_instance, assert_valid_roster):
+    for seed in range(3):
+        jobs, salesmen = make_instance(seed=seed)
+        roster = assign_jobs(jobs, salesmen, SolverOptions(n_clusters=6, nearest_clusters=2))
+        assert_valid_roster(roster, jobs, salesmen)
+
+
+def roster_summary(roster):
+    return {
+        salesman_id: [(job.job_id, job.start_time) for job in jobs] for salesman_id, jobs in roster.jobs.items()
+    }, sorted(job.job_id for job in roster.unassigned_jobs)
+
+
+def test_get_arrival_times_if_possible_matches_scalar(make_instance):
+    jobs, salesmen = make_instance(seed=1)
+    salesman = salesmen[0]
+    salesman.current_location = salesman.location
+    salesman.current_time = salesman.start_time
+    job_table = JobTable(jobs)
+    rows = np.arange(len(jobs))
+
+    for assigned in range(3):
+        arrival_times, feasible = get_arrival_times_if_possible(salesman, job_table, rows)
+        for row, job in enumerate(jobs):
+            expected = get_arrival_time_if_possible(salesman, job)
+            assert feasible[row] == (expected is not None), f"Feasibility of job {job.job_id} should match"
+            if expected is not None:
+                assert job_table.to_datetime(arrival_times[row]) == expected
+        # Move the salesman on to check the travel branch too
+        next_row = int(np.argmax(feasible))
+        job = jobs[next_row]
+        job.assign_salesman(salesman.salesman_id, job_table.to_datetime(arrival_times[next_row]))
+        salesman.assign_job(job)
+
+
+def test_find_first_job_skips_only_jobs_out_of_reach(make_instance):
+    for seed in range(5):
+        jobs, salesmen = make_instance(seed=seed, n_jobs=60)
+        roster = RosterResponse()
+        roster.add_salesmen(salesmen)
+        unassigned = order_by_urgency(jobs)
+        for salesman in salesmen:
+            while True:
+                found = find_first_job(roster, salesman, unassigned, set(), None)
+                expected = next(
+                    ((job, arrival) for job in unassigned if not job_starts_after_salesman(roster, salesman, job)
+                     for arrival in [get_arrival_time_if_possible(salesman, job)] if arrival is not None),
+                    (None, None),
+                )
+                assert found == expected, "Skipping jobs out of reach shouldn't change the first job found"
+                if found[0] is None:
+                    break
+                roster.assign_job_to_salesman(found[0], salesman, found[1])
+                unassigned.remove(found[0])
+
+
+def test_assign_jobs_vectorized_matches_scalar(make_instance):
+    scalar = assign_jobs(*make_instance(seed=2))
+    vectorized = assign_jobs(*make_instance(seed=2), SolverOptions(vectorized=True))
+
+    assert roster_summary(vectorized) == roster_summary(scalar), "Vectorized checks should not change the roster"
+
+
+def test_assign_jobs_roster_is_valid(make_instance, assert_valid_roster):
+    for seed in range(3):
+        jobs, salesmen = make_instance(seed=seed)
+        roster = assign_jobs(jobs, salesmen)
+        assert_valid_roster(roster, jobs, salesmen)
+
+
+def test_order_by_urgency_matches_sort(make_instance):
+    jobs, _ = make_instance(seed=12, n_jobs=200)
+
+    ordered = order_by_urgency(jobs)
+
+    assert len({job.urgency for job in jobs}) < len(jobs), "Pre assertion - some jobs tie on urgency"
+    assert [job.job_id for job in ordered] == [job.job_id for job in sorted(jobs, reverse=True)]
@@ -0,0 +1,84 @@
+import time
+from app.models.solver_options import SolverOptions
+from app.services.deadline import Deadline
+from app.services.job_assignment import assign_jobs
+from app.services import multi_start
+from app.services.multi_start import (
+    MULTI_START_PROCESSES, _get_executor, _run_on_pool, assign_jobs_multi_start, get_variants, run_variant
+)
+from app.services.roster_metrics import roster_objective
+from app.services.solver import solve
+
+
+def roster_summary(roster):
+    return {salesman_id: [(job.job_id, job.start_time) for job in jobs] for salesman_id, jobs in roster.jobs.items()}
+
+
+def test_get_variants():
+    options = SolverOptions(multi_start=20, seed=7)
+    variants = get_variants(options)
+
+    assert len(variants) == 20
+    assert variants[0] == options.model_copy(update={"multi_start": 1}), "The requested options should be tried first"
+    assert all(variant.multi_start == 1 for variant in variants)
+    assert len({variant.model_dump_json() for variant in variants}) == 20, "Variants should all differ"
+    assert [variant.seed for variant in variants if variant.job_order == "random"] == [7, 8, 9, 10, 11, 12, 13]
+
+
+def test_multi_start_is_at_least_as_good_as_single_start(make_instance):
+    single = assign_jobs(*make_instance(seed=3))
+    best = assign_jobs_multi_start(*make_instance(seed=3), SolverOptions(multi_start=16), processes=0)
+
+    assert roster_objective(best) >= roster_objective(single), "Multi-start should never do worse than the default greedy"
+    assert best.options.multi_start == 1, "The winning variant should be recorded"
+
+
+def test_multi_start_is_reproducible(make_instance):
+    jobs, salesmen = make_instance(seed=4)
+    best = assign_jobs_multi_start(jobs, salesmen, SolverOptions(multi_start=16), processes=0)
+    replay = assign_jobs(*make_instance(seed=4), best.options)
+
+    assert roster_summary(replay) == roster_summary(best), "Re-running the recorded variant should give the same roster"
+    assert all(job.salesman_id is None for job in jobs), "Request jobs should not be modified"
+
+
+def test_multi_start_on_worker_processes(make_instance):
+    sequential = assign_jobs_multi_start(*make_instance(seed=5), SolverOptions(multi_start=4, time_budget_secs=60), processes=0)
+    parallel = assign_jobs_multi_start(*make_instance(seed=5), SolverOptions(multi_start=4, time_budget_secs=60), processes=2)
+
+    assert roster_summary(parallel) == roster_summary(sequential)
+    assert parallel.options == sequential.options
+
+
+def test_solve_runs_variants_in_parallel_by_default(make_instance, monkeypatch):
+    pool_sizes = []
+
+    def run_on_pool(jobs, salesmen, variants, budget_ends, processes, deadline=None, variant_deadline=None):
+        pool_sizes.append(processes)
+        return [run_variant(jobs, salesmen, variant) for variant in variants]
+
+    monkeypatch.setattr(multi_start, "_run_on_pool", run_on_pool)
+    solve(*make_instance(seed=5), SolverOptions(multi_start=4))
+
+    assert pool_sizes == [multi_start.MULTI_START_PROCESSES]
+    assert MULTI_START_PROCESSES > 0, "Variants should run in parallel unless MULTI_START_PROCESSES is set to 0"
+
+
+def test_multi_start_respects_time_budget(make_instance):
+    options = SolverOptions(multi_start=16, time_budget_secs=0.001)
+    roster = assign_jobs_multi_start(*make_instance(seed=6), options, processes=0)
+
+    assert roster.options == get_variants(options)[0], "Only the first variant should run when out of time"
+
+
+def test_pool_stops_running_variants_when_out_of_time(make_instance):
+    jobs, salesmen = make_instance(seed=7, n_jobs=40, n_salesmen=5)
+    # The exact search would take its whole minute if nothing stopped it
+    variants = [SolverOptions(), SolverOptions(engine="exact", exact_time_limit_secs=60)]
+    results = _run_on_pool(jobs, salesmen, variants, time.monotonic() + 0.5, processes=2, variant_deadline=Deadline(0.5))
+
+    assert [variant for _, variant in results] == variants[:1], "Only the first variant should finish within the budget"
+    started = time.monotonic()
+    for future in [_get_executor(2).submit(time.monotonic) for _ in range(2)]:
+        future.result(timeout=30)
+    assert time.monotonic() - started < 10, "Both workers should be free soon after the budget runs out"
@@ -0,0 +1,109 @@
+from datetime import datetime
+import numpy as np
+import pytest
+from app.models.job import Job
+from app.models.location import Location
+from app.models.salesman import Salesman
+from app.models.solver_options import SolverOptions
+from app.services.job_assignment import assign_jobs
+from app.services.job_table import JobTable
+from app.services.insertion_routes import InsertionRoutes
+from app.services.regret_insertion import assign_jobs_regret
+from app.services.solver import solve
+
+
+@pytest.mark.parametrize("regret_k", [1, 2, 3])
+def test_regret_roster_is_valid(regret_k, make_instance, assert_valid_roster):
+    for seed in range(3):
+        jobs, salesmen = make_instance(seed=seed, n_jobs=80)
+        roster = assign_jobs_regret(jobs, salesmen, SolverOptions(regret_k=regret_k))
+        assert_valid_roster(roster, jobs, salesmen)
+
+
+def test_regret_assigns_at_least_as_many_jobs_as_greedy(make_instance):
+    for seed in range(3):
+        greedy = assign_jobs(*make_instance(seed=seed, n_jobs=80))
+        regret = assign_jobs_regret(*make_instance(seed=seed, n_jobs=80))
+        assert len(regret.unassigned_jobs) <= len(greedy.unassigned_jobs)
+
+
+def test_regret_places_job_with_one_option_first():
+    def make_request():
+        salesmen = [
+            Salesman(
+                salesman_id="long_day",
+                location=Location(latitude=43.77, longitude=11.25),
+                start_time=datetime(2025, 2, 5, 9, 0, 0),
+                end_time=datetime(2025, 2, 5, 17, 0, 0),
+                max_workday_mins=4 * 60,
+            ),
+            Salesman(
+                salesman_id="morning",
+                location=Location(latitude=43.77, longitude=11.25),
+                start_time=datetime(2025, 2, 5, 9, 0, 0),
+                end_time=datetime(2025, 2, 5, 10, 0, 0),
+            ),
+        ]
+        # Either salesman can do the more urgent morning job, only the long day salesman the afternoon one
+        jobs = [
+            Job(
+                job_id=job_id,
+                date=datetime(2025, 2, 5),
+                location=Location(latitude=43.77, longitude=11.25),
+                duration_mins=60,
+                entry_time=entry_time,
+                exit_time=exit_time,
+            )
+            for job_id, entry_time, exit_time in [
+                ("morning", datetime(2025, 2, 5, 9, 0, 0), datetime(2025, 2, 5, 10, 0, 0)),
+                ("afternoon", datetime(2025, 2, 5, 16, 0, 0), datetime(2025, 2, 5, 17, 0, 0)),
+            ]
+        ]
+        return jobs, salesmen
+
+    cheapest_first = assign_jobs_regret(*make_request(), SolverOptions(regret_k=1))
+    roster = assign_jobs_regret(*make_request())
+
+    assert [job.job_id for job in cheapest_first.unassigned_jobs] == ["afternoon"], "Pre assertion - the urgent job takes the long day"
+    assert [job.job_id for job in roster.jobs["long_day"]] == ["afternoon"]
+    assert [job.job_id for job in roster.jobs["morning"]] == ["morning"]
+    assert roster.message == "Roster completed with all jobs assigned"
+
+
+def test_insertion_costs_are_updated_incrementally(make_instance):
+    jobs, salesmen = make_instance(seed=4, n_jobs=50)
+    routes = InsertionRoutes(JobTable(jobs), salesmen)
+
+    for _ in range(20):
+        assert routes.insert_next(k=2)
+        incremental = routes.cost.copy()
+        for s in range(len(salesmen)):
+            routes._update_costs(s)
+        np.testing.assert_array_equal(incremental, routes.cost, "Only the changed route's costs should change")
+
+
+def test_travel_is_only_computed_to_unassigned_jobs(make_instance):
+    jobs, salesmen = make_instance(seed=4, n_jobs=50)
+    table = JobTable(jobs)
+    routes = InsertionRoutes(table, salesmen)
+    travel_seconds_from = table.travel_seconds_from
+    widths = []
+
+    def record_width(location, rows):
+        widths.append((len(rows), max(len(route) for route in routes.routes) + int(table.unassigned.sum())))
+        return travel_seconds_from(location, rows)
+
+    table.travel_seconds_from = record_width
+    while routes.insert_next(k=2):
+        pass
+
+    assert widths
+    assert all(width <= bound for width, bound in widths), "Routed jobs shouldn't keep travel to every job"
+
+
+def test_solve_selects_regret_engine(make_instance):
+    roster = solve(*make_instance(seed=5), SolverOptions(engine="regret"))
+    expected = assign_jobs_regret(*make_instance(seed=5))
+
+    assert {sid: [job.job_id for job in route] for sid, route in roster.jobs.items()} == \
+        {sid: [job.job_id for job in route] for sid, route in expected.jobs.items()}
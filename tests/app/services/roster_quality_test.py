@@ -0,0 +1,64 @@
+from datetime import datetime
+from app.models.job import Job
+from app.models.location import Location
+from app.models.salesman import Salesman
+from app.models.solver_options import SolverOptions
+from app.services.roster_metrics import roster_objective
+from app.services.roster_quality import get_capacity_bounds, get_min_travel_mins
+from app.services.solver import solve
+
+
+def make_job(job_id, longitude=11.25, duration_mins=60, entry_hour=9, exit_hour=17):
+    return Job(
+        job_id=job_id,
+        date=datetime(2025, 2, 5),
+        location=Location(latitude=43.77, longitude=longitude),
+        duration_mins=duration_mins,
+        entry_time=datetime(2025, 2, 5, entry_hour, 0, 0),
+        exit_time=datetime(2025, 2, 5, exit_hour, 0, 0),
+    )
+
+
+def test_capacity_bounds():
+    salesmen = [Salesman(
+        salesman_id="1",
+        location=Location(latitude=43.77, longitude=11.25),
+        start_time=datetime(2025, 2, 5, 9, 0, 0),
+        end_time=datetime(2025, 2, 5, 17, 0, 0),
+    )]
+    jobs = [make_job(str(i), duration_mins=180) for i in range(3)] + [make_job("late", entry_hour=18, exit_hour=20)]
+
+    bounds = get_capacity_bounds(jobs, salesmen)
+
+    assert bounds.max_jobs == 2, "Only two 3 hour jobs fit into an 8 hour day"
+    assert bounds.max_work_mins == 480
+    assert bounds.min_travel_mins == 0
+
+
+def test_min_travel_drops_longest_edges_per_route():
+    jobs = [make_job("a", 11.25), make_job("b", 11.26), make_job("c", 11.30)]
+    ab = jobs[0].location.travel_time_to(jobs[1].location).total_seconds() / 60
+    bc = jobs[1].location.travel_time_to(jobs[2].location).total_seconds() / 60
+
+    assert get_min_travel_mins(jobs, 1) == ab + bc
+    assert get_min_travel_mins(jobs, 2) == ab, "Two routes can skip the longest edge"
+    assert get_min_travel_mins(jobs, 3) == 0
+
+
+def test_solve_with_quality_report(make_instance):
+    jobs, salesmen = make_instance(seed=10, n_jobs=30)
+
+    roster = solve(jobs, salesmen, SolverOptions(quality_report=True))
+
+    quality = roster.quality
+    assigned_jobs, work_mins, travel = roster_objective(roster)
+    assert quality.assigned_jobs == assigned_jobs <= quality.bounds.max_jobs
+    assert quality.work_mins == work_mins <= quality.bounds.max_work_mins
+    assert quality.bounds.min_travel_mins <= quality.travel_mins == -travel
+    assert 0 <= quality.gap <= 1
+    assert [salesman.salesman_id for salesman in quality.salesmen] == list(roster.jobs)
+    assert all(0 <= salesman.utilization <= 1 for salesman in quality.salesmen)
+
+
+def test_solve_without_quality_report(make_instance):
+    assert solve(*make_instance(seed=10, n_jobs=30)).quality is None
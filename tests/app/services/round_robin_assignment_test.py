@@ -0,0 +1,85 @@
+from datetime import datetime
+import numpy as np
+from app.models.job import Job
+from app.models.location import Location
+from app.models.salesman import Salesman
+from app.models.solver_options import SolverOptions
+from app.services.job_assignment import get_arrival_times_if_possible
+from app.services.round_robin_assignment import _OpenJobs, assign_jobs_round_robin
+from app.services.solver import solve
+
+
+def test_round_robin_roster_is_valid(make_instance, assert_valid_roster):
+    jobs, salesmen = make_instance(seed=8)
+    roster = assign_jobs_round_robin(jobs, salesmen)
+
+    assert_valid_roster(roster, jobs, salesmen)
+    assert all(roster.jobs.values()), "Every salesman should get work when salesmen advance together"
+
+
+def test_round_robin_shares_jobs_between_salesmen():
+    salesmen = [
+        Salesman(
+            salesman_id=str(i),
+            location=Location(latitude=43.77, longitude=11.25),
+            start_time=datetime(2025, 2, 5, 9, 0, 0),
+            end_time=datetime(2025, 2, 5, 17, 0, 0),
+        )
+        for i in range(2)
+    ]
+    jobs = [
+        Job(
+            job_id=str(i),
+            date=datetime(2025, 2, 5),
+            location=Location(latitude=43.77, longitude=11.25),
+            duration_mins=60,
+            entry_time=datetime(2025, 2, 5, 9, 0, 0),
+            exit_time=datetime(2025, 2, 5, 17, 0, 0),
+        )
+        for i in range(4)
+    ]
+
+    roster = assign_jobs_round_robin(jobs, salesmen)
+
+    assert [len(route) for route in roster.jobs.values()] == [2, 2], "Jobs should alternate between available salesmen"
+    assert [job.start_time.hour for job in roster.jobs["0"]] == [9, 10]
+    assert roster.message == "Roster completed with all jobs assigned"
+
+
+def test_round_robin_unassignable_jobs(make_instance):
+    jobs, salesmen = make_instance(seed=9, n_jobs=80, n_salesmen=1)
+    roster = assign_jobs_round_robin(jobs, salesmen)
+
+    assert roster.unassigned_jobs, "One salesman can't do 80 jobs"
+    assert roster.message == "Roster completed with unassigned jobs"
+
+
+def test_solve_selects_round_robin_engine(make_instance):
+    roster = solve(*make_instance(seed=8), SolverOptions(engine="round_robin"))
+    expected = assign_jobs_round_robin(*make_instance(seed=8))
+
+    assert {sid: [job.job_id for job in route] for sid, route in roster.jobs.items()} == \
+        {sid: [job.job_id for job in route] for sid, route in expected.jobs.items()}
+    assert roster.options.engine == "round_robin"
+
+
+def test_open_jobs_pick_the_same_job_as_checking_every_job(make_instance, monkeypatch):
+    soonest_start = _OpenJobs.soonest_start
+    events = []
+
+    def soonest_start_of_every_job(open_jobs, salesman):
+        row, arrival_time = soonest_start(open_jobs, salesman)
+        rows = np.flatnonzero(open_jobs.table.unassigned)
+        arrival_times, feasible = get_arrival_times_if_possible(salesman, open_jobs.table, rows)
+        if feasible.any():
+            best = np.argmin(np.where(feasible, arrival_times, np.iinfo(np.int64).max))
+            assert (row, arrival_time) == (rows[best], arrival_times[best])
+        else:
+            assert row is None
+        events.append(row)
+        return row, arrival_time
+
+    monkeypatch.setattr(_OpenJobs, "soonest_start", soonest_start_of_every_job)
+    for seed in range(5):
+        assign_jobs_round_robin(*make_instance(seed=seed, n_jobs=300, n_salesmen=8))
+    assert len(events) > 150
@@ -0,0 +1,103 @@
+import asyncio
+import multiprocessing.forkserver
+import os
+import threading
+import pytest
+from app.services.deadline import Deadline
+from app.services.location_helpers import LocationHelpers
+from app.services.solver_pool import SOLVER_PRELOAD, SolverPool, SolverPoolSaturated, get_solver_context
+
+
+def test_run_on_dedicated_thread():
+    pool = SolverPool(processes=0, max_queue=0)
+    try:
+        thread_name = asyncio.run(pool.run(lambda: threading.current_thread().name))
+    finally:
+        pool.shutdown()
+    assert thread_name.startswith("solver"), "Solve should run on the dedicated solver thread"
+    assert pool.in_flight == 0
+
+
+def test_run_on_process_pool():
+    pool = SolverPool(processes=1, max_queue=0)
+    try:
+        distance = asyncio.run(pool.run(LocationHelpers.get_distance_between, (0.0, 0.0), (0.0, 1.0)))
+    finally:
+        pool.shutdown()
+    assert distance == pytest.approx(LocationHelpers.get_distance_between((0.0, 0.0), (0.0, 1.0)))
+
+
+def test_solver_processes_are_forked_from_preloaded_fork_server():
+    pool = SolverPool(processes=1, max_queue=0)
+    try:
+        pool.start()
+        parent_pid = asyncio.run(pool.run(os.getppid))
+    finally:
+        pool.shutdown()
+    assert parent_pid == multiprocessing.forkserver._forkserver._forkserver_pid, "Solver processes should share the fork server's imports"
+    get_solver_context()
+    assert multiprocessing.forkserver._forkserver._preload_modules == SOLVER_PRELOAD
+
+
+def test_rejects_when_saturated():
+    pool = SolverPool(processes=0, max_queue=1)
+    release = threading.Event()
+
+    async def saturate():
+        running = [asyncio.create_task(pool.run(release.wait)) for _ in range(pool.capacity)]
+        await asyncio.sleep(0)
+        assert pool.in_flight == pool.capacity
+        with pytest.raises(SolverPoolSaturated):
+            await pool.run(release.wait)
+        release.set()
+        await asyncio.gather(*running)
+
+    try:
+        asyncio.run(saturate())
+    finally:
+        pool.shutdown()
+    assert pool.in_flight == 0, "Finished solves should free their slots"
+
+
+def test_cancelled_caller_keeps_slot_until_solve_finishes():
+    pool = SolverPool(processes=0, max_queue=0)
+    started, release = threading.Event(), threading.Event()
+
+    def solve():
+        started.set()
+        release.wait()
+
+    async def cancel_caller():
+        caller = asyncio.create_task(pool.run(solve))
+        await asyncio.to_thread(started.wait)
+        caller.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await caller
+        assert pool.in_flight == 1, "A solve still running after its caller gave up should keep its slot"
+        with pytest.raises(SolverPoolSaturated):
+            await pool.run(solve)
+        release.set()
+        for _ in range(100):
+            if pool.in_flight == 0:
+                break
+            await asyncio.sleep(0.01)
+
+    try:
+        asyncio.run(cancel_caller())
+    finally:
+        release.set()
+        pool.shutdown()
+    assert pool.in_flight == 0, "The slot should be freed once the solve finishes"
+
+
+def test_cancel_events_share_the_manager_started_up_front():
+    pool = SolverPool(processes=1, max_queue=0)
+    try:
+        pool.start()
+        manager = pool._manager
+        cancel_event = pool.cancel_event()
+        assert pool._manager is manager, "Requests shouldn't start a manager process"
+        cancel_event.set()
+        assert Deadline(cancel_event=cancel_event).expired()
+    finally:
+        pool.shutdown()
@@ -0,0 +1,69 @@
+import random
+from app.services.spatial_index import SpatialGrid
+
+
+def random_points(n, seed=0):
+    rng = random.Random(seed)
+    return [(f"p{i}", 43.77 + rng.uniform(-0.05, 0.05), 11.25 + rng.uniform(-0.05, 0.05)) for i in range(n)]
+
+
+def brute_force_order(grid, points, latitude, longitude):
+    x, y = grid._project(latitude, longitude)
+
+    def distance(point):
+        px, py = grid._project(point[1], point[2])
+        return ((px - x) ** 2 + (py - y) ** 2) ** 0.5
+
+    return [point[0] for point in sorted(points, key=distance)]
+
+
+def test_nearest_matches_brute_force():
+    points = random_points(300)
+    grid = SpatialGrid.from_points(points, cell_size_km=0.5)
+
+    for latitude, longitude in [(43.77, 11.25), (43.70, 11.20), (43.85, 11.35)]:
+        assert list(grid.nearest(latitude, longitude)) == brute_force_order(grid, points, latitude, longitude)
+
+
+def test_nearest_is_lazy():
+    points = random_points(300)
+    grid = SpatialGrid.from_points(points, cell_size_km=0.5)
+
+    first = next(grid.nearest(43.77, 11.25))
+    assert first == brute_force_order(grid, points, 43.77, 11.25)[0]
+
+
+def test_remove():
+    points = random_points(50)
+    grid = SpatialGrid.from_points(points, cell_size_km=0.5)
+    removed = {name for name, _, _ in points[:20]}
+    for name, _, _ in points[:20]:
+        grid.remove(name)
+    grid.remove("not indexed")
+
+    assert len(grid) == 30
+    assert points[0][0] not in grid
+    assert set(grid.nearest(43.77, 11.25)) == {name for name, _, _ in points} - removed
+
+
+def test_remove_while_iterating():
+    points = random_points(50)
+    grid = SpatialGrid.from_points(points, cell_size_km=0.5)
+
+    seen = []
+    for name in grid.nearest(43.77, 11.25):
+        seen.append(name)
+        grid.remove(name)
+    assert len(seen) == 50 and len(grid) == 0
+
+
+def test_within():
+    points = random_points(300)
+    grid = SpatialGrid.from_points(points, cell_size_km=0.5)
+    x, y = grid._project(43.77, 11.25)
+
+    expected = {
+        name for name, lat, lon in points
+        if ((grid._project(lat, lon)[0] - x) ** 2 + (grid._project(lat, lon)[1] - y) ** 2) ** 0.5 <= 1.3
+    }
+    assert set(grid.within(43.77, 11.25, 1.3)) == expected
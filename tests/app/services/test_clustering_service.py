@@ -1,9 +1,10 @@
 from datetime import datetime
 import unittest
 from unittest.mock import MagicMock
-from app.services.clustering_service import cluster_jobs
+from app.services.clustering_service import cluster_jobs, get_cluster_affinity, get_cluster_centroids
 from app.models.job import Job
 from app.models.location import Location
+from app.models.salesman import Salesman
 
 class TestClusteringService(unittest.TestCase):
     def setUp(self):
@@ -44,6 +45,21 @@ class TestClusteringService(unittest.TestCase):
         self.assertEqual(len(set(cluster_ids)), 2)  # Ensure 2 clusters are created
         for job in self.jobs:
             self.assertIsInstance(job.cluster, int)  # Ensure cluster IDs are integers
+    def test_get_cluster_affinity(self):
+        for job, cluster in zip(self.jobs, [0, 1, 2]):
+            job.cluster = cluster
+        salesman = Salesman(
+            salesman_id="101",
+            location=Location(latitude=48.8566, longitude=2.3522),  # Paris
+            start_time=datetime(2025, 2, 5, 9, 0, 0),
+            end_time=datetime(2025, 2, 5, 17, 0, 0),
+        )
+
+        centroids = get_cluster_centroids(self.jobs)
+        affinity = get_cluster_affinity([salesman], centroids)
+
+        self.assertEqual(centroids[2], (51.5075, -0.1280))
+        self.assertEqual(affinity, {"101": [2, 0, 1]})  # London, New York, Los Angeles
 
 if __name__ == "__main__":
     unittest.main()
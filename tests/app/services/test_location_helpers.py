@@ -1,5 +1,11 @@
 import os
 import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+import pytest
+from app.services.address_keys import address_key
 from app.services.location_helpers import LocationHelpers
 
 
@@ -8,6 +14,8 @@ class TestLocationHelpers:
         self.test_file_path = os.path.join(os.path.dirname(__file__), 'locationCache.json')
         LocationHelpers.cache_file_path = self.test_file_path
         LocationHelpers.locationCache = {}
+        LocationHelpers.negativeCache = {}
+        LocationHelpers.fuzzyIndex = None
 
         if os.path.exists(self.test_file_path):
             os.remove(self.test_file_path)
@@ -85,6 +93,78 @@ class TestLocationHelpers:
 
         self.assert_get_new_address_and_add_to_cache(expected_result, rawAddress)
 
+    def test_get_coordinates_from_cache_by_canonical_key(self):
+        test_data = {"2 Bass St": {"latitude": -33.808, "longitude": 151.0591, "address": "2 Bass Street, Ermington"}}
+        self.set_test_cache(test_data)
+
+        for address in ["2 Bass Street", " 2 bass st, ", "2 BASS ST."]:
+            assert LocationHelpers.get_coordinates_from_cache(address) == test_data["2 Bass St"], f"{address} should hit the cache"
+        assert LocationHelpers.get_coordinates_from_cache("12 Bass St") is None
+        assert list(LocationHelpers.locationCache) == ["2 Bass St"], "Lookups shouldn't add keys to the cache"
+
+    def test_get_coordinates_from_cache_fuzzy(self):
+        test_data = {"Via dei Calzaiuoli 45, Florence": {"latitude": 43.771, "longitude": 11.2547, "address": "Via dei Calzaiuoli, 45, Firenze"}}
+        with patch.object(LocationHelpers, "fuzzy_threshold", None):
+            self.set_test_cache(test_data)
+            assert LocationHelpers.get_coordinates_from_cache("Via dei Calzaioli 45, Florence") is None, "Fuzzy matching is off by default"
+
+        with patch.object(LocationHelpers, "fuzzy_threshold", 0.7):
+            self.set_test_cache(test_data)
+            assert LocationHelpers.get_coordinates_from_cache("Via dei Calzaioli 45, Florence") == test_data["Via dei Calzaiuoli 45, Florence"]
+            assert LocationHelpers.get_coordinates_from_cache("Via dei Calzaiuoli 46, Florence") is None, "House numbers must match"
+
+    def test_concurrent_lookups_share_one_api_call(self):
+        self.set_test_cache({})
+        location = {"latitude": 41.89, "longitude": 12.4943, "address": "Piazza del Colosseo, 1, 00184 Roma RM, Italy"}
+        started = threading.Event()
+
+        def slow_api(address):
+            started.set()
+            time.sleep(0.2)
+            return location
+
+        with patch.object(LocationHelpers, "get_coordinates_via_api", side_effect=slow_api) as api, \
+                patch.object(LocationHelpers, "add_result_to_cache", wraps=LocationHelpers.add_result_to_cache) as add:
+            with ThreadPoolExecutor(max_workers=5) as executor:
+                futures = [executor.submit(LocationHelpers.get_coordinates_from_address, "Piazza del Colosseo, 1") for _ in range(5)]
+                results = [future.result() for future in futures]
+
+        assert results == [location] * 5
+        assert api.call_count == 1, "Concurrent lookups of one address should share a single API call"
+        assert add.call_count == 1, "The cache file should be written once"
+        assert LocationHelpers._flights == {}
+
+    def test_concurrent_lookups_share_api_errors(self):
+        self.set_test_cache({})
+
+        def failing_api(address):
+            time.sleep(0.2)
+            raise ConnectionError("API unavailable")
+
+        with patch.object(LocationHelpers, "get_coordinates_via_api", side_effect=failing_api) as api:
+            with ThreadPoolExecutor(max_workers=3) as executor:
+                futures = [executor.submit(LocationHelpers.get_coordinates_from_address, "Piazza del Colosseo, 1") for _ in range(3)]
+                for future in futures:
+                    with pytest.raises(ConnectionError):
+                        future.result()
+
+        assert api.call_count == 1
+        assert LocationHelpers.negativeCache == {}, "Transient errors shouldn't be cached"
+
+    def test_invalid_address_is_negatively_cached(self):
+        self.set_test_cache({})
+
+        with patch.object(LocationHelpers, "get_coordinates_via_api", return_value={}) as api:
+            for _ in range(3):
+                with pytest.raises(ValueError):
+                    LocationHelpers.get_coordinates_from_address("Nowhere Street 99º")
+            assert api.call_count == 1, "Invalid addresses shouldn't be looked up again until the TTL expires"
+
+            LocationHelpers.negativeCache[address_key("Nowhere Street 99º")] = time.monotonic() - 1
+            with pytest.raises(ValueError):
+                LocationHelpers.get_coordinates_from_address("Nowhere Street 99º")
+            assert api.call_count == 2, "Invalid addresses should be looked up again after the TTL"
+
     def assert_get_new_address_and_add_to_cache(self, expected_result, rawAddress):
         result = LocationHelpers.get_coordinates_from_address(rawAddress)
         assert result == expected_result[rawAddress]
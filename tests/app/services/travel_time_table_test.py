@@ -0,0 +1,94 @@
+import json
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from itertools import product
+from unittest.mock import patch
+import pytest
+from app.models.location import Location
+from app.services import travel_time_table as travel_time_table_module
+from app.services.location_helpers import LocationHelpers
+from app.services.travel_time_table import TravelTimeTable
+
+SITES = [(43.7696, 11.2558), (43.771, 11.2547), (43.7731, 11.2560), (41.89, 12.4943), (-33.808, 151.0591)]
+
+
+def test_lookup_matches_travel_time_minutes(tmp_path):
+    table = TravelTimeTable(str(tmp_path / "travel.npy"))
+
+    assert table.add_sites(SITES) == 5
+    assert table.add_sites(SITES[:2]) == 0, "Known sites shouldn't be added again"
+
+    for coord1, coord2 in product(SITES[:4], SITES[:4]):
+        assert table.lookup(coord1, coord2) == LocationHelpers.get_travel_time_minutes(coord1, coord2)
+    assert table.lookup(SITES[0], SITES[4]) is None, "Times too long for int16 fall back to computing them"
+    assert table.lookup(SITES[0], (45.0, 9.0)) is None
+
+
+def test_table_persists_and_grows(tmp_path):
+    path = str(tmp_path / "travel.npy")
+    table = TravelTimeTable(path, initial_capacity=2)
+    table.add_sites(SITES[:3])
+    table.add_sites(SITES[3:4])
+    assert table.matrix.shape == (6, 6)
+
+    with patch.object(LocationHelpers, "get_travel_times_minutes", side_effect=AssertionError("recomputed")):
+        reopened = TravelTimeTable(path)
+        assert len(reopened) == 4
+        assert reopened.lookup(SITES[0], SITES[3]) == LocationHelpers.get_travel_time_minutes(SITES[0], SITES[3])
+        assert reopened.add_sites(SITES[:4]) == 0
+
+
+def test_workers_sharing_a_table_agree_on_site_ids(tmp_path):
+    """Each table stands in for a worker process: flock locks separate opens of the lock file."""
+    path = str(tmp_path / "travel.npy")
+    sites = [(round(43.7 + i / 1000, 4), round(11.2 + i / 700, 4)) for i in range(40)]
+    workers = [TravelTimeTable(path, initial_capacity=2) for _ in range(4)]
+
+    with ThreadPoolExecutor(len(workers)) as pool:
+        list(pool.map(lambda worker, start: [worker.add_sites(sites[i:i + 3]) for i in range(start, len(sites), 6)],
+                      workers, range(0, 8, 2)))
+
+    reopened = TravelTimeTable(path)
+    assert len(reopened) == len(sites)
+    for table in workers + [reopened]:
+        for coord1, coord2 in product(sites[::3], sites[::4]):
+            if table.lookup(coord1, coord2) is not None:
+                assert table.lookup(coord1, coord2) == LocationHelpers.get_travel_time_minutes(coord1, coord2)
+
+    stale = workers[0]
+    assert stale.add_sites(sites) == 0, "Sites other workers added are picked up, not added again"
+    assert stale.lookup(sites[0], sites[-1]) == LocationHelpers.get_travel_time_minutes(sites[0], sites[-1])
+
+
+@pytest.fixture
+def shared_table(tmp_path, monkeypatch):
+    table = TravelTimeTable(str(tmp_path / "travel.npy"))
+    monkeypatch.setattr(travel_time_table_module, "travel_time_table", table)
+    monkeypatch.setattr(LocationHelpers, "travelTimeTable", table)
+    return table
+
+
+def test_travel_time_to_uses_table(shared_table):
+    shared_table.add_sites(SITES[:3])
+    florence = [Location(latitude=lat, longitude=lon) for lat, lon in SITES[:3]]
+
+    with patch.object(LocationHelpers, "get_travel_time_minutes", side_effect=AssertionError("computed")):
+        assert florence[0].travel_time_to(florence[2]) == timedelta(minutes=max(5, shared_table.lookup(SITES[0], SITES[2])))
+
+    with patch.object(LocationHelpers, "get_travel_time_minutes", return_value=42) as compute:
+        assert florence[0].travel_time_to(Location(latitude=45.0, longitude=9.0)) == timedelta(minutes=42)
+        compute.assert_called_once()
+
+
+def test_geocoded_addresses_are_added_to_table(shared_table, tmp_path, monkeypatch):
+    monkeypatch.setattr(LocationHelpers, "cache_file_path", str(tmp_path / "locationCache.json"))
+    monkeypatch.setattr(LocationHelpers, "locationCache", {})
+    monkeypatch.setattr(LocationHelpers, "keyIndex", {})
+
+    LocationHelpers.add_results_to_cache({
+        "Piazza della Signoria 10": {"latitude": SITES[0][0], "longitude": SITES[0][1], "address": "Piazza della Signoria"},
+        "Via dei Calzaiuoli 45": {"latitude": SITES[1][0], "longitude": SITES[1][1], "address": "Via dei Calzaiuoli"},
+    })
+
+    assert shared_table.lookup(SITES[0], SITES[1]) == LocationHelpers.get_travel_time_minutes(SITES[0], SITES[1])
+    assert json.loads((tmp_path / "travel.npy.sites.json").read_text()) == ["43.7696,11.2558", "43.7710,11.2547"]
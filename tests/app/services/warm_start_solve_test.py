@@ -0,0 +1,93 @@
+from datetime import datetime
+from app.models.job import Job
+from app.models.location import Location
+from app.models.salesman import Salesman
+from app.models.solver_options import SolverOptions
+from app.models.warm_start import WarmStart
+from app.services.job_assignment import assign_jobs
+from app.services.solver import solve
+
+
+def routes(roster):
+    return {salesman_id: [job.job_id for job in route] for salesman_id, route in roster.jobs.items()}
+
+
+def test_warm_start_keeps_previous_routes(make_instance, assert_valid_roster):
+    previous = assign_jobs(*make_instance(seed=30, n_jobs=80))
+    jobs, salesmen = make_instance(seed=30, n_jobs=80)
+
+    roster = solve(jobs, salesmen, SolverOptions(), hints=WarmStart(roster=previous).get_hints())
+
+    assert_valid_roster(roster, jobs, salesmen)
+    for salesman_id, route in routes(previous).items():
+        kept = [job_id for job_id in routes(roster)[salesman_id] if job_id in route]
+        assert kept == route, "Each salesman should keep their previous route, in order"
+
+
+def test_warm_start_skips_jobs_that_no_longer_fit(make_instance, assert_valid_roster):
+    salesman = Salesman(
+        salesman_id="101",
+        location=Location(latitude=43.77, longitude=11.25),
+        start_time=datetime(2025, 2, 5, 9, 0, 0),
+        end_time=datetime(2025, 2, 5, 12, 0, 0),
+    )
+    jobs = [
+        Job(
+            job_id=job_id,
+            date=datetime(2025, 2, 5),
+            location=Location(latitude=43.77, longitude=11.25),
+            duration_mins=60,
+            entry_time=entry_time,
+            exit_time=datetime(2025, 2, 5, 17, 0, 0),
+        )
+        for job_id, entry_time in [("morning", datetime(2025, 2, 5, 9, 0, 0)), ("afternoon", datetime(2025, 2, 5, 14, 0, 0))]
+    ]
+    hints = {"afternoon": "101", "morning": "101", "unknown": "101", "morning_again": "nobody"}
+
+    roster = assign_jobs(jobs, [salesman], hints=hints)
+
+    assert routes(roster) == {"101": ["morning"]}, "The salesman now ends before the afternoon job"
+    assert [job.job_id for job in roster.unassigned_jobs] == ["afternoon"]
+
+
+def test_warm_start_fills_gaps_before_and_between_seeded_jobs(assert_valid_roster):
+    salesman = Salesman(
+        salesman_id="101",
+        location=Location(latitude=43.77, longitude=11.25),
+        start_time=datetime(2025, 2, 5, 9, 0, 0),
+        end_time=datetime(2025, 2, 5, 18, 0, 0),
+    )
+    jobs = [
+        Job(
+            job_id=job_id,
+            date=datetime(2025, 2, 5),
+            location=Location(latitude=43.77, longitude=11.25),
+            duration_mins=60,
+            entry_time=datetime(2025, 2, 5, *entry_time),
+            exit_time=datetime(2025, 2, 5, *exit_time),
+        )
+        for job_id, entry_time, exit_time in [
+            ("morning", (9, 0), (10, 30)),
+            ("midday", (11, 0), (13, 0)),
+            ("lunch", (12, 30), (14, 0)),
+            ("afternoon", (14, 0), (17, 0)),
+        ]
+    ]
+
+    roster = assign_jobs(jobs, [salesman], hints={"midday": "101", "afternoon": "101"})
+
+    assert_valid_roster(roster, jobs, [salesman])
+    assert routes(roster) == {"101": ["morning", "midday", "lunch", "afternoon"]}, "Jobs should fill the time around the seeded ones"
+    assert [job.start_time.hour for job in roster.jobs["101"]] == [9, 11, 12, 14]
+    assert roster.message == "Roster completed with all jobs assigned"
+
+
+def test_warm_start_uses_greedy_engine(make_instance):
+    jobs, salesmen = make_instance(seed=31, n_jobs=20)
+    hints = {job.job_id: salesmen[-1].salesman_id for job in jobs[:4]}
+
+    roster = solve(jobs, salesmen, SolverOptions(engine="round_robin", multi_start=4), hints=hints)
+    expected = assign_jobs(*make_instance(seed=31, n_jobs=20), hints=hints)
+
+    assert routes(roster) == routes(expected), "Warm starts should fill in with the greedy"
+    assert roster.options.engine == "greedy", "The response should record the engine that ran"
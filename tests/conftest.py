@@ -0,0 +1,5 @@
+import os
+
+# Route tests patch the solver's helpers in this process, so solves must run here rather than in
+# worker processes. Set before the app is imported, which creates the solver pool.
+os.environ["SOLVER_PROCESSES"] = "0"